@@ -0,0 +1,79 @@
+"""
+Micro-benchmark of decoding incoming Lavalink frames.
+
+Compares the generic path (JSON to dict, then ``Stats``/``PlayerState`` built from the
+dict) with the typed msgspec structs of :mod:`lavacord.schema` for the frames a node
+receives most. Only decoding and building the state objects is measured.
+
+    python benchmarks/decoding.py [--number N]
+
+Timings of a few microseconds are noisy, compare several runs before drawing conclusions.
+"""
+
+import argparse
+import timeit
+
+from lavacord import schema
+from lavacord.stats import PlayerState, Stats
+from lavacord.utils import get_serializer
+
+FRAMES = {
+    "playerUpdate": (
+        '{"op":"playerUpdate","guildId":"846716540919541770",'
+        '"state":{"time":1500467109000,"position":60000,"connected":true,"ping":12}}'
+    ),
+    "stats": (
+        '{"op":"stats","players":412,"playingPlayers":388,"uptime":912345678,'
+        '"memory":{"free":123456789,"used":987654321,"allocated":1111111110,"reservable":4294967296},'
+        '"cpu":{"cores":8,"systemLoad":0.31,"lavalinkLoad":0.12},'
+        '"frameStats":{"sent":1164000,"nulled":12,"deficit":40}}'
+    ),
+    "TrackEndEvent": (
+        '{"op":"event","type":"TrackEndEvent","guildId":"846716540919541770",'
+        '"track":"QAAAjQIAJVJpY2sgQXN0bGV5IC0gTmV2ZXIgR29ubmEgR2l2ZSBZb3UgVXAADlJpY2tBc3RsZXlWRVZP",'
+        '"reason":"FINISHED"}'
+    ),
+}
+
+
+def legacy(raw: str):
+    data = get_serializer().loads(raw)
+    op = data.pop("op")
+    if op == "stats":
+        return Stats(data)
+    data.pop("guildId")
+    if op == "playerUpdate":
+        return PlayerState(data.get("state"))
+    data.pop("type")
+    return data
+
+
+def typed(raw: str):
+    frame = schema.decode(raw)
+    if isinstance(frame, schema.StatsFrame):
+        return Stats._from_frame(frame)
+    if isinstance(frame, schema.PlayerUpdateFrame):
+        return PlayerState._from_frame(frame.state)
+    return frame
+
+
+def measure(func, raw: str, number: int) -> float:
+    return min(timeit.repeat(lambda: func(raw), number=number, repeat=5)) / number * 1e9
+
+
+def run(number: int) -> None:
+    if not schema.HAS_MSGSPEC:
+        print("msgspec is not installed, only the generic path is available.")
+        return
+
+    print(f"json backend: {get_serializer().name}")
+    print(f"{'frame':<14} {'generic':>9} {'typed':>9}   ns/frame")
+    for name, raw in FRAMES.items():
+        print(f"{name:<14} {measure(legacy, raw, number):9.0f} {measure(typed, raw, number):9.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+    run(args.number)
@@ -0,0 +1,103 @@
+"""
+Micro-benchmark of the search query routing used by ``Player.search_tracks``.
+
+Compares :class:`lavacord.SourceRouter` with the previous hard-coded ``if/elif`` chain
+over a corpus of realistic queries. Only the routing is measured, no request is made.
+
+    python benchmarks/router_bench.py [--number N] [--extra-hosts N]
+
+The last row registers many third-party hosts to show that routing cost does not
+grow with the number of supported sources.
+"""
+
+import argparse
+import timeit
+
+import yarl
+
+from lavacord.router import SourceRouter, default_router
+
+CORPUS = [
+    "Rick Astley Never Gonna Give You Up",
+    "lofi hip hop radio",
+    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+    "https://youtube.com/watch?v=dQw4w9WgXcQ&t=42s",
+    "https://youtu.be/dQw4w9WgXcQ",
+    "https://m.youtube.com/watch?v=dQw4w9WgXcQ",
+    "https://www.youtube.com/playlist?list=PLFgquLnL59alCl_2TQvOiD5Vgm1hCaGSI",
+    "https://music.youtube.com/watch?v=lYBUbBu4W08",
+    "https://music.youtube.com/playlist?list=RDCLAK5uy_kmPRjHDECIcuVwnKsx2Ng7fyNgFKWNJFs",
+    "https://open.spotify.com/track/4cOdK2wGLETKBW3PvgPWqT?si=4ec58d4668b145d2",
+    "https://open.spotify.com/playlist/37i9dQZF1DXcBWIGoYBM5M",
+    "https://open.spotify.com/intl-de/album/6dVIqQ8qmQ5GBnJ9shOYGE",
+    "https://www.twitch.tv/monstercat",
+    "https://soundcloud.com/forss/flickermood",
+    "https://soundcloud.com/forss/sets/soulhack",
+    "https://example.com/audio.mp3",
+]
+
+
+def legacy_route(query: str):
+    result = yarl.URL(query)
+    if not result.host:
+        return "YouTubeTrack"
+
+    if result.host in ("www.youtube.com", "youtube.com"):
+        return "YouTubePlaylist" if result.query.get("list") else "YouTubeTrack"
+    elif result.host in ("www.music.youtube.com", "music.youtube.com"):
+        return "YouTubeMusicPlaylist" if result.query.get("list") else "YouTubeMusicTrack"
+    elif result.host in ("open.spotify.com",):
+        type_ = result.parts[-2]
+        if type_ == "playlist":
+            return "SpotifyPlaylist"
+        elif type_ == "track":
+            return "SpotifyTrack"
+        elif type_ == "album":
+            return "SpotifyAlbum"
+        return None
+    elif result.host in ("www.twitch.tv",):
+        return "TwitchTrack"
+    return None
+
+
+def crowded_router(extra_hosts: int) -> SourceRouter:
+    """The default routes plus ``extra_hosts`` third-party sources registered in front of them."""
+    router = SourceRouter(fallback=default_router.fallback)
+
+    async def resolver(query, url, requester, node):
+        return None
+
+    for index in range(extra_hosts):
+        router.register(f"source{index}.example.org", resolver, path=r"/track/")
+
+    for host in default_router.hosts:
+        for route in default_router._routes[host]:
+            router.register(host, route.resolver, path=route.path, query=route.query)
+
+    return router
+
+
+def measure(func, number: int) -> float:
+    elapsed = min(timeit.repeat(lambda: [func(query) for query in CORPUS], number=number, repeat=5))
+    return elapsed / (number * len(CORPUS)) * 1e9
+
+
+def run(number: int, extra_hosts: int) -> None:
+    cases = (
+        ("legacy if/elif", legacy_route),
+        ("SourceRouter.match", default_router.match),
+        (f"+{extra_hosts} hosts", crowded_router(extra_hosts).match),
+    )
+    for name, func in cases:
+        print(f"{name:<20} {measure(func, number):8.0f} ns/query")
+
+    unrouted = [query for query in CORPUS if default_router.match(query)[0] is None]
+    print(f"unrouted queries: {unrouted}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--extra-hosts", type=int, default=500)
+    args = parser.parse_args()
+    run(args.number, args.extra_hosts)
@@ -0,0 +1,80 @@
+"""
+Micro-benchmark of the JSON backends on the payloads lavacord sends most.
+
+For every installed backend it measures the old send path (serialise to ``str``, then
+``send_str`` encodes it again) against :meth:`Serializer.dumps`, which produces the UTF-8
+bytes written to the text frame directly, and decoding of a ``playerUpdate`` frame.
+
+    python benchmarks/serializers.py [--number N]
+"""
+
+import argparse
+import timeit
+
+from lavacord.filter import Equalizer, Filters
+from lavacord.utils import SERIALIZERS
+
+TRACK = (
+    "QAAAjQIAJVJpY2sgQXN0bGV5IC0gTmV2ZXIgR29ubmEgR2l2ZSBZb3UgVXAADlJpY2tBc3RsZXlWRVZPAAAAAAADPCAAC2RR"
+    "dzR3OVdnWGNRAAEAK2h0dHBzOi8vd3d3LnlvdXR1YmUuY29tL3dhdGNoP3Y9ZFF3NHc5V2dYY1EAB3lvdXR1YmUAAAAAAAAAAA=="
+)
+
+
+def _filters() -> dict:
+    filters = Filters(volume=0.8)
+    filters.equalizer(Equalizer([0.2, 0.15, 0.1, 0.05, 0.0, -0.05, -0.1, -0.1, -0.1, -0.1, -0.1, -0.1, 0, 0, 0]))
+    filters.timescale(1.1, 1.05, 1.0)
+    filters.rotation(0.2)
+    return {**filters._payload, "guildId": "846716540919541770"}
+
+
+PAYLOADS = {
+    "play": {
+        "op": "play",
+        "guildId": "846716540919541770",
+        "track": TRACK,
+        "noReplace": False,
+        "startTime": "0",
+        "pause": False,
+    },
+    "filters": _filters(),
+    "voiceUpdate": {
+        "op": "voiceUpdate",
+        "guildId": "846716540919541770",
+        "sessionId": "9f8a1c3c2b2f4b0c8e0f6a1d9e7c5b3a",
+        "event": {
+            "token": "a1b2c3d4e5f6a7b8",
+            "guild_id": "846716540919541770",
+            "endpoint": "rotterdam2601.discord.media:443",
+        },
+    },
+}
+
+PLAYER_UPDATE = (
+    '{"op":"playerUpdate","guildId":"846716540919541770",'
+    '"state":{"time":1500467109,"position":60000,"connected":true,"ping":12}}'
+)
+
+
+def measure(func, number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e9
+
+
+def run(number: int) -> None:
+    print(f"{'backend':<8} {'payload':<12} {'str+encode':>11} {'bytes':>8}   ns/op")
+    for name, cls in SERIALIZERS.items():
+        serializer = cls()
+        for payload_name, payload in PAYLOADS.items():
+            legacy = measure(lambda: serializer.dumps_str(payload).encode("utf-8"), number)
+            direct = measure(lambda: serializer.dumps(payload), number)
+            print(f"{name:<8} {payload_name:<12} {legacy:11.0f} {direct:8.0f}")
+
+        decode = measure(lambda: serializer.loads(PLAYER_UPDATE), number)
+        print(f"{name:<8} {'loads':<12} {decode:11.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+    run(args.number)
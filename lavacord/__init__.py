@@ -11,13 +11,25 @@ __license__ = "MIT"
 __version__ = "1.0.2a"
 
 from .abc import *
+from .bus import *
 from .client import *
 from .enums import *
 from .events import *
 from .exceptions import *
 from .filter import *
+from .history import *
+from .idle import *
+from .lag import *
+from .metrics import *
 from .player import *
 from .pool import *
 from .queue import *
+from .ramp import *
+from .router import *
+from .snapshot import *
 from .stats import *
+from .storage import *
+from .timers import *
+from .tracing import *
 from .tracks import *
+from .updates import *
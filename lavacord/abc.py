@@ -28,6 +28,8 @@ from __future__ import annotations
 import abc
 from datetime import timedelta, datetime, timezone
 from typing import (
+    Any,
+    Dict,
     List,
     Literal,
     Optional,
@@ -40,7 +42,7 @@ from typing import (
 )
 
 import hikari
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, validator
 
 from .enums import Icons
 
@@ -55,6 +57,8 @@ __all__ = (
 
 ST = TypeVar("ST", bound="Searchable")
 
+_TRACK_TYPES: Dict[str, Type[Track]] = {}
+
 
 class Track(BaseModel):
     """A Lavalink track object."""
@@ -72,6 +76,12 @@ class Track(BaseModel):
 
     requester: hikari.Snowflake = Field(repr=False)
 
+    _formatted: Optional[str] = PrivateAttr(default=None)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _TRACK_TYPES[cls.__name__] = cls
+
     @validator("position", pre=True)
     def parse_position(cls, value):
         return int(value)
@@ -80,10 +90,49 @@ class Track(BaseModel):
     def parse_length(cls, value):
         return timedelta(milliseconds=value)
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in self.__fields__:
+            self._formatted = None
+
+    def _copy_and_set_values(self, values, fields_set, *, deep):
+        # copy(update=...) sets the fields directly and carries the cache over.
+        track = super()._copy_and_set_values(values, fields_set, deep=deep)
+        track._formatted = None
+        return track
+
     def __str__(self):
-        return f"[{self.title} - {self.author}]({self.uri}) \n" \
-               f"({self.length if not self.is_stream else 'Infinity'}) " \
-               f"Requester: <@{self.requester}>"
+        # Queue pages format the same tracks over and over, so keep the result until a field changes.
+        if self._formatted is None:
+            self._formatted = f"[{self.title} - {self.author}]({self.uri}) \n" \
+                              f"({self.length if not self.is_stream else 'Infinity'}) " \
+                              f"Requester: <@{self.requester}>"
+        return self._formatted
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-compatible representation of the track, restorable with :meth:`from_dict`."""
+        data = self.dict(by_alias=True)
+        data["length"] = int(self.length.total_seconds() * 1000)
+        data["requester"] = int(self.requester)
+        data["type"] = self.__class__.__name__
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Track:
+        """Rebuild a track produced by :meth:`to_dict` using its original track class."""
+        data = dict(data)
+        track_cls = _TRACK_TYPES.get(data.pop("type", None), cls)
+        return track_cls(**data)
+
+    async def resolve(self, node: Node) -> Track:
+        """|coro|
+        Resolve any metadata needed before the track can be played.
+
+        Tracks that are created lazily, like :class:`lavacord.PartialTrack`, override
+        this and return the playable track, by default the track is already playable
+        and is returned as is.
+        """
+        return self
 
     @property
     def thumbnail(self):
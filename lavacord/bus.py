@@ -0,0 +1,207 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022 CrazzzyyFoxx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import typing as t
+
+import hikari
+
+__all__ = (
+    "EventCallback",
+    "EventBus",
+)
+
+EventT = t.TypeVar("EventT", bound=hikari.Event)
+EventCallback = t.Callable[[EventT], t.Coroutine[t.Any, t.Any, None]]
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class EventBus:
+    """Delivers lavacord events to listeners without going through hikari.
+
+    Listeners are keyed by event type and optionally by guild, dispatching an event only
+    looks up the listeners of its guild and the guild-less ones, for the event type and
+    its base classes. Subscribing to ``BaseTrackEvent`` receives every track event.
+    """
+
+    def __init__(self):
+        self._listeners: t.Dict[
+            t.Type[hikari.Event],
+            t.Dict[t.Optional[hikari.Snowflake], t.List[EventCallback[t.Any]]]
+        ] = {}
+        self._waiters: t.Dict[
+            t.Tuple[t.Type[hikari.Event], t.Optional[hikari.Snowflake]],
+            t.List[t.Tuple[t.Optional[t.Callable[[t.Any], bool]], asyncio.Future]]
+        ] = {}
+
+    def __repr__(self) -> str:
+        return f"<EventBus listeners={len(self)}>"
+
+    def __len__(self) -> int:
+        return sum(len(callbacks) for guilds in self._listeners.values() for callbacks in guilds.values())
+
+    def subscribe(
+            self,
+            event_type: t.Type[EventT],
+            callback: EventCallback[EventT],
+            *,
+            guild_id: t.Optional[hikari.Snowflake] = None
+    ) -> None:
+        """Call ``callback`` for every event of ``event_type``, only those of ``guild_id`` if given."""
+        self._listeners.setdefault(event_type, {}).setdefault(guild_id, []).append(callback)
+
+    def unsubscribe(
+            self,
+            event_type: t.Type[EventT],
+            callback: EventCallback[EventT],
+            *,
+            guild_id: t.Optional[hikari.Snowflake] = None
+    ) -> None:
+        """Remove a listener added by :meth:`subscribe`, nothing happens if it is not subscribed."""
+        guilds = self._listeners.get(event_type)
+        callbacks = guilds.get(guild_id) if guilds else None
+        if not callbacks or callback not in callbacks:
+            return
+
+        callbacks.remove(callback)
+        if not callbacks:
+            del guilds[guild_id]
+            if not guilds:
+                del self._listeners[event_type]
+
+    def listen(
+            self,
+            event_type: t.Type[EventT],
+            *,
+            guild_id: t.Optional[hikari.Snowflake] = None
+    ) -> t.Callable[[EventCallback[EventT]], EventCallback[EventT]]:
+        """Decorator form of :meth:`subscribe`."""
+        def decorator(callback: EventCallback[EventT]) -> EventCallback[EventT]:
+            self.subscribe(event_type, callback, guild_id=guild_id)
+            return callback
+
+        return decorator
+
+    async def wait_for(
+            self,
+            event_type: t.Type[EventT],
+            *,
+            guild_id: t.Optional[hikari.Snowflake] = None,
+            predicate: t.Optional[t.Callable[[EventT], bool]] = None,
+            timeout: t.Optional[float] = None
+    ) -> EventT:
+        """|coro|
+        Wait for the next event of ``event_type`` matching the guild and predicate.
+
+        Raises
+        ------
+        :exc:`asyncio.TimeoutError`
+            If no matching event was dispatched in time.
+        """
+        future = asyncio.get_running_loop().create_future()
+        key = (event_type, guild_id)
+        waiter = (predicate, future)
+        self._waiters.setdefault(key, []).append(waiter)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._remove_waiter(key, waiter)
+
+    def _remove_waiter(
+            self,
+            key: t.Tuple[t.Type[hikari.Event], t.Optional[hikari.Snowflake]],
+            waiter: t.Tuple[t.Optional[t.Callable[[t.Any], bool]], asyncio.Future]
+    ) -> None:
+        waiters = self._waiters.get(key)
+        if waiters is None or waiter not in waiters:
+            return
+
+        waiters.remove(waiter)
+        if not waiters:
+            del self._waiters[key]
+
+    def _resolve_waiters(self, event: hikari.Event, guild_id: t.Optional[hikari.Snowflake]) -> None:
+        """Resolve the waiters of the event type, its base classes, and of its guild or any guild."""
+        guilds = (guild_id, None) if guild_id is not None else (None,)
+        for cls in type(event).__mro__:
+            for key in ((cls, guild) for guild in guilds):
+                waiters = self._waiters.get(key)
+                if waiters is None:
+                    continue
+                for waiter in list(waiters):
+                    predicate, future = waiter
+                    if future.done():
+                        continue
+                    try:
+                        if predicate is not None and not predicate(event):
+                            continue
+                    except Exception as error:
+                        future.set_exception(error)
+                    else:
+                        future.set_result(event)
+                    self._remove_waiter(key, waiter)
+
+    async def dispatch(self, event: hikari.Event, guild_id: t.Optional[hikari.Snowflake] = None) -> None:
+        """|coro|
+        Run the listeners of the event, concurrently, and wait for them to finish.
+
+        Errors raised by listeners are logged and do not reach the caller.
+        """
+        if self._waiters:
+            self._resolve_waiters(event, guild_id)
+
+        if not self._listeners:
+            return
+
+        callbacks = []
+        for cls in type(event).__mro__:
+            guilds = self._listeners.get(cls)
+            if guilds is None:
+                continue
+            if guild_id is not None:
+                callbacks.extend(guilds.get(guild_id, ()))
+            callbacks.extend(guilds.get(None, ()))
+
+        if not callbacks:
+            return
+
+        if len(callbacks) == 1:
+            try:
+                await callbacks[0](event)
+            except Exception as error:
+                self._log_error(callbacks[0], event, error)
+            return
+
+        results = await asyncio.gather(*(callback(event) for callback in callbacks), return_exceptions=True)
+        for callback, result in zip(callbacks, results):
+            if isinstance(result, Exception):
+                self._log_error(callback, event, result)
+
+    @staticmethod
+    def _log_error(callback: EventCallback[t.Any], event: hikari.Event, error: Exception) -> None:
+        logger.error(f"Listener {getattr(callback, '__name__', callback)} failed on {type(event).__name__}:: {error}")
@@ -23,35 +23,74 @@ SOFTWARE.
 """
 
 import asyncio
+import logging
 import typing as t
 
 import hikari
 
 from .exceptions import NoMatchingNode
 from .player import BasePlayer
-from .pool import Node, NodePool
+from .pool import NodePool
+from .utils import Histogram
 
 __all__ = (
     "LavalinkClient",
 )
 
+if t.TYPE_CHECKING:
+    from .idle import IdleManager
+
 BP = t.TypeVar("BP", bound=BasePlayer)
 
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class _VoiceHandshake:
+    """The halves of a guild's voice connection received from Discord so far."""
+
+    __slots__ = ("channel_id", "session_id", "token", "endpoint", "sent", "started_at")
+
+    def __init__(self, started_at: float):
+        self.channel_id: t.Optional[hikari.Snowflake] = None
+        self.session_id: t.Optional[str] = None
+        self.token: t.Optional[str] = None
+        self.endpoint: t.Optional[str] = None
+        self.sent: t.Optional[t.Tuple[str, str, str]] = None
+        self.started_at: float = started_at
+
+    @property
+    def key(self) -> t.Optional[t.Tuple[str, str, str]]:
+        """What a voiceUpdate would be built from, None while a half is missing."""
+        if self.session_id is None or self.token is None or self.endpoint is None:
+            return None
+        return self.session_id, self.token, self.endpoint
+
 
 class LavalinkClient:
     """
     Represents a Lavalink client used to manage nodes and connections.
+
+    Voice state and voice server updates are buffered per guild until both arrived
+    and the player exists, then exactly one ``voiceUpdate`` is sent to Lavalink.
+    It is only sent again when the session, token or endpoint changes.
+    The time from the first half to the ``voiceUpdate`` is recorded in :attr:`join_latency`.
     """
 
     def __init__(self, bot: hikari.GatewayBot):
         self.bot = bot
+        self._idle_manager: t.Optional[IdleManager] = None
+        self._connection_waiters: t.Dict[hikari.Snowflake, t.List[asyncio.Future]] = {}
+        self._handshakes: t.Dict[hikari.Snowflake, _VoiceHandshake] = {}
+        self.join_latency: Histogram = Histogram()
+        """Seconds between the start of a voice handshake and its voiceUpdate."""
         self.bot.subscribe(hikari.VoiceStateUpdateEvent, self._raw_voice_state_update)
         self.bot.subscribe(hikari.VoiceServerUpdateEvent, self._raw_voice_server_update)
 
-    @staticmethod
-    async def create_player(voice_state: hikari.VoiceState, cls=BasePlayer) -> BP:
+    async def create_player(self, voice_state: hikari.VoiceState, cls=BasePlayer, **kwargs: t.Any) -> BP:
         node = NodePool.get_node()
-        player = await node.create_player(voice_state, cls)
+        player = await node.create_player(voice_state, cls, **kwargs)
+        self._handshake(voice_state.guild_id)
+        await self._flush_handshake(voice_state.guild_id, player)
         return player
 
     @staticmethod
@@ -63,54 +102,154 @@ class LavalinkClient:
 
         return None
 
+    def _handshake(self, guild_id: hikari.Snowflake) -> _VoiceHandshake:
+        handshake = self._handshakes.get(guild_id)
+        if handshake is None:
+            handshake = self._handshakes[guild_id] = _VoiceHandshake(asyncio.get_running_loop().time())
+        return handshake
+
+    async def _flush_handshake(self, guild_id: hikari.Snowflake, player: t.Optional[BasePlayer] = None) -> None:
+        """Apply the buffered halves to the player and send the voiceUpdate once both are there."""
+        handshake = self._handshakes.get(guild_id)
+        if handshake is None:
+            return
+
+        if player is None:
+            player = await self.get_player(guild_id)
+            if player is None:
+                return
+
+        if handshake.channel_id is not None:
+            player.voice_channel_id = handshake.channel_id
+        if handshake.session_id is not None:
+            player.session_id = handshake.session_id
+
+        key = handshake.key
+        if key is None or key == handshake.sent:
+            return
+
+        # Marked as sent before awaiting, so concurrent flushes of the same handshake send it once.
+        previous, handshake.sent = handshake.sent, key
+        player._voice_server = {
+            "token": handshake.token,
+            "guild_id": str(guild_id),
+            "endpoint": handshake.endpoint
+        }
+        try:
+            await player.node._websocket.send({
+                "op": "voiceUpdate",
+                "guildId": str(guild_id),
+                "sessionId": handshake.session_id,
+                "event": player._voice_server
+            })
+        except Exception:
+            handshake.sent = previous
+            raise
+
+        if previous is None:
+            latency = asyncio.get_running_loop().time() - handshake.started_at
+            self.join_latency.observe(latency)
+            logger.debug(f"Voice handshake completed:: {guild_id} ({latency * 1000:.1f} ms)")
+        else:
+            logger.debug(f"Voice server changed:: {guild_id} ({handshake.endpoint})")
+
+        self._notify_connection(player)
+
     async def _raw_voice_state_update(self, event: hikari.VoiceStateUpdateEvent) -> None:
         """
         A voice state update has been received from Discord.
         """
-        if event.state.user_id != self.bot.get_me().id:
-            return
+        try:
+            if event.state.user_id == self.bot.get_me().id:
+                await self._own_voice_state_update(event)
+        finally:
+            # After the player took the bot's new channel, so the idle check sees it.
+            if self._idle_manager is not None:
+                await self._idle_manager._on_voice_state_update(event)
 
+    async def _own_voice_state_update(
+            self,
+            event: hikari.VoiceStateUpdateEvent
+    ) -> None:
         guild_id = event.guild_id
-        player = await self.get_player(guild_id)
+        if event.state.channel_id is None:
+            # Left voice, the next join starts a new handshake.
+            self._handshakes.pop(guild_id, None)
+            player = await self.get_player(guild_id)
+            if player:
+                player.voice_channel_id = None
+                player.session_id = event.state.session_id
+                # That server went with the old session, a rejoin waits for a new one.
+                player._voice_server = None
+            return
 
-        if player:
-            player.voice_channel_id = event.state.channel_id
-            player.session_id = event.state.session_id
+        handshake = self._handshake(guild_id)
+        handshake.channel_id = event.state.channel_id
+        handshake.session_id = event.state.session_id
+        await self._flush_handshake(guild_id)
 
     async def _raw_voice_server_update(self, event: hikari.VoiceServerUpdateEvent) -> None:
         """
         A voice server update has been received from Discord.
         """
-        guild_id = event.guild_id
+        handshake = self._handshake(event.guild_id)
+        handshake.token = event.token
+        handshake.endpoint = event.raw_endpoint
+        await self._flush_handshake(event.guild_id)
 
-        player = await self.get_player(guild_id)
-        if not player:
+    def _notify_connection(self, player: BasePlayer) -> None:
+        if player.session_id is None or player._voice_server is None:
             return
-        await player.node._websocket.send({
-            "op": "voiceUpdate",
-            "guildId": str(guild_id),
-            "sessionId": player.session_id,
-            "event": {
-                "token": event.token,
-                "guild_id": str(guild_id),
-                "endpoint": event.raw_endpoint
-            }
-        })
-
-    async def wait_for_connection(self, guild_id: hikari.Snowflake) -> t.Optional[Node]:
+
+        for future in self._connection_waiters.pop(player.guild_id, ()):
+            if not future.done():
+                future.set_result(player)
+
+    async def wait_for_connection(
+            self,
+            guild_id: hikari.Snowflake,
+            *,
+            timeout: t.Optional[float] = None
+    ) -> BP:
         """
         Wait for the voice connection to be established.
 
+        The connection is established once the player exists and both the voice state
+        and the voice server update were applied to it.
+
         Parameters
         ---------
         guild_id: :class:`hikari.Snowflake`
             guild id for server
+        timeout: Optional[float]
+            Seconds to wait before giving up, None to wait forever.
+
+        Raises
+        --------
+        :exc:`asyncio.TimeoutError`
+            If the connection was not established in time.
         """
-        while not (await self.get_player(guild_id)):
-            await asyncio.sleep(0.1)
-        return await self.get_player(guild_id)
+        player = await self.get_player(guild_id)
+        if player is not None and player.session_id is not None and player._voice_server is not None:
+            return player
 
-    async def wait_for_remove_connection(self, guild_id: hikari.Snowflake) -> None:
+        future = asyncio.get_running_loop().create_future()
+        self._connection_waiters.setdefault(guild_id, []).append(future)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            waiters = self._connection_waiters.get(guild_id)
+            if waiters is not None and future in waiters:
+                waiters.remove(future)
+                if not waiters:
+                    del self._connection_waiters[guild_id]
+
+    async def wait_for_remove_connection(
+            self,
+            guild_id: hikari.Snowflake,
+            *,
+            timeout: t.Optional[float] = None
+    ) -> None:
         """
         Wait for the voice connection to be removed.
 
@@ -118,14 +257,18 @@ class LavalinkClient:
         ---------
         guild_id: :class:`hikari.Snowflake`
             guild id for server
+        timeout: Optional[float]
+            Seconds to wait before giving up, None to wait forever.
 
         Raises
         --------
         :exc:`.NoMatchingNode`
             If guild not found in nodes cache.
+        :exc:`asyncio.TimeoutError`
+            If the player was not removed in time.
         """
         player = await self.get_player(guild_id)
         if not player:
             raise NoMatchingNode("Node not found", guild_id)
-        while await self.get_player(guild_id):
-            await asyncio.sleep(0.1)
+
+        await asyncio.wait_for(asyncio.shield(player._removal()), timeout)
@@ -31,7 +31,8 @@ __all__ = (
     "RepeatMode",
     "Icons",
     "LoadType",
-    "ErrorSeverity"
+    "ErrorSeverity",
+    "TrackEndReason",
 )
 
 
@@ -47,6 +48,27 @@ class ErrorSeverity(str, Enum):
     fault = "FAULT"
 
 
+class TrackEndReason(str, Enum):
+    FINISHED = "FINISHED"
+    LOAD_FAILED = "LOAD_FAILED"
+    STOPPED = "STOPPED"
+    REPLACED = "REPLACED"
+    CLEANUP = "CLEANUP"
+    UNKNOWN = "UNKNOWN"
+    """A reason this version of lavacord does not know, sent by a newer Lavalink."""
+
+    @classmethod
+    def parse(cls, value: str) -> TrackEndReason:
+        """The member for ``value``, :attr:`UNKNOWN` when there is none."""
+        member = cls(value)
+        return member if isinstance(member, cls) else cls.UNKNOWN
+
+    @property
+    def may_start_next(self) -> bool:
+        """Whether the next track should be started after a track ended for this reason."""
+        return self in (TrackEndReason.FINISHED, TrackEndReason.LOAD_FAILED)
+
+
 class LoadType(str, Enum):
     track_loaded = "TRACK_LOADED"
     playlist_loaded = "PLAYLIST_LOADED"
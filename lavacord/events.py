@@ -31,13 +31,14 @@ import hikari
 from hikari.events.base_events import Event
 
 from .abc import Track
-from .enums import ErrorSeverity
+from .enums import ErrorSeverity, TrackEndReason
 from .player import BasePlayer
 
 if t.TYPE_CHECKING:
     from .pool import Node
 
 __all__ = ("NodeReady",
+           "BaseTrackEvent",
            "TrackStartEvent",
            "TrackEndEvent",
            "TrackExceptionEvent",
@@ -64,11 +65,17 @@ class BaseTrackEvent(Event):
     player: BP = attrs.field()
     """The player in which the track is located"""
 
+    source: t.Optional[Track] = attrs.field(default=None)
+    """The track object, when the player knows it (its current, previous or prefetched track)"""
+
     @property
     def app(self) -> hikari.traits.RESTAware:
         return self.player.node.bot
 
     async def build_track(self) -> Track:
+        """The track of the event, decoded by Lavalink only when :attr:`source` is unknown."""
+        if self.source is not None:
+            return self.source
         return await self.player.node.build_track(Track, self.track)
 
 
@@ -84,7 +91,7 @@ class TrackEndEvent(BaseTrackEvent):
     """
     Event on track end.
     """
-    reason: str = attrs.field()
+    reason: TrackEndReason = attrs.field(converter=TrackEndReason.parse)
 
 
 @attrs.define(kw_only=True, weakref_slot=False)
@@ -22,11 +22,152 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+from __future__ import annotations
+
+import copy
+import itertools
+import operator
 import typing as t
+from array import array
 
 from .exceptions import FiltersError
+from .utils import _to_json_bytes
+
+__all__ = (
+    "Equalizer",
+    "Filters",
+    "FilterSet",
+)
+
+
+def _freeze(value: t.Any) -> t.Hashable:
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class Equalizer:
+    """
+    An immutable set of the 15 equalizer gains, stored as a float array.
+
+    Gains are clamped to -0.25..1.0 in a single pass when the equalizer is built, so
+    every operation returns a valid equalizer. Equalizers can be blended, added,
+    subtracted and scaled, which makes interpolating between presets cheap.
+
+    Parameters
+    ---------
+    gains: Iterable[:class:`float`]
+        The gains of the bands starting at band 0, missing bands are 0.
+    """
+
+    BANDS: t.ClassVar[int] = 15
+    MIN_GAIN: t.ClassVar[float] = -0.25
+    MAX_GAIN: t.ClassVar[float] = 1.0
+
+    __slots__ = ("_gains", "_hash")
+
+    def __init__(self, gains: t.Iterable[float] = ()) -> None:
+        values = array("d", gains)
+        if len(values) > self.BANDS:
+            raise FiltersError("Invalid band, must be 0-14")
+        values.extend(itertools.repeat(0.0, self.BANDS - len(values)))
+
+        low, high = self.MIN_GAIN, self.MAX_GAIN
+        clamped = array("d", (min(max(gain, low), high) for gain in values))
+        object.__setattr__(self, "_gains", clamped)
+        # Hash the values, not the bytes: -0.0 == 0.0 but their bytes differ.
+        object.__setattr__(self, "_hash", hash(tuple(clamped)))
+
+    @classmethod
+    def flat(cls) -> Equalizer:
+        """An equalizer that leaves every band unchanged."""
+        return cls()
+
+    @classmethod
+    def from_bands(cls, bands: t.Mapping[int, float]) -> Equalizer:
+        """Build an equalizer from ``{band: gain}``, missing bands are 0."""
+        gains = [0.0] * cls.BANDS
+        for band, gain in bands.items():
+            if not -1 < band < cls.BANDS:
+                raise FiltersError("Invalid band, must be 0-14")
+            gains[band] = gain
+        return cls(gains)
+
+    @classmethod
+    def from_payload(cls, payload: t.Iterable[t.Mapping[str, t.Any]]) -> Equalizer:
+        """Build an equalizer from the ``equalizer`` filter payload."""
+        return cls.from_bands({band["band"]: band["gain"] for band in payload})
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"<Equalizer {[round(gain, 3) for gain in self._gains]}>"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Equalizer):
+            return NotImplemented
+        return self._gains == other._gains
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __len__(self) -> int:
+        return self.BANDS
+
+    def __iter__(self) -> t.Iterator[float]:
+        return iter(self._gains)
+
+    def __getitem__(self, band: int) -> float:
+        return self._gains[band]
+
+    def __add__(self, other: Equalizer) -> Equalizer:
+        if not isinstance(other, Equalizer):
+            return NotImplemented
+        return Equalizer(map(operator.add, self._gains, other._gains))
+
+    def __sub__(self, other: Equalizer) -> Equalizer:
+        if not isinstance(other, Equalizer):
+            return NotImplemented
+        return Equalizer(map(operator.sub, self._gains, other._gains))
+
+    def __mul__(self, factor: float) -> Equalizer:
+        if not isinstance(factor, (int, float)):
+            return NotImplemented
+        return Equalizer(map(operator.mul, self._gains, itertools.repeat(factor)))
 
-__all__ = ("Filters",)
+    __rmul__ = __mul__
+
+    @property
+    def gains(self) -> t.Tuple[float, ...]:
+        return tuple(self._gains)
+
+    def with_band(self, band: int, gain: float) -> Equalizer:
+        """A copy with one band changed."""
+        if not -1 < band < self.BANDS:
+            raise FiltersError("Invalid band, must be 0-14")
+        gains = array("d", self._gains)
+        gains[band] = gain
+        return Equalizer(gains)
+
+    def blend(self, other: Equalizer, weight: float = 0.5) -> Equalizer:
+        """Interpolate towards ``other``, 0 returns this one and 1 returns ``other``."""
+        pairs = zip(self._gains, other._gains)
+        return Equalizer(ours + (theirs - ours) * weight for ours, theirs in pairs)
+
+    def diff(self, other: Equalizer) -> t.Dict[int, float]:
+        """``{band: change}`` for the bands whose gain differs in ``other``."""
+        return {
+            band: theirs - ours
+            for band, (ours, theirs) in enumerate(zip(self._gains, other._gains))
+            if ours != theirs
+        }
+
+    def to_payload(self) -> t.List[t.Dict[str, t.Union[int, float]]]:
+        """The gains in the format of the ``equalizer`` filter."""
+        return [{"band": band, "gain": gain} for band, gain in enumerate(self._gains)]
 
 
 class Filters:
@@ -42,24 +183,24 @@ class Filters:
     """
     def __init__(self, volume: t.Union[int, float] = 1.0) -> None:
         self._payload: dict = {"op": "filters", "volume": volume}
+
+    def freeze(self) -> FilterSet:
+        """An immutable :class:`FilterSet` of the filters currently configured."""
+        return FilterSet(self._payload)
     
-    def equalizer(self, bands: t.List[t.Dict[int, t.Union[float, int]]]):
+    def equalizer(self, bands: t.Union[Equalizer, t.List[t.Dict[int, t.Union[float, int]]]]):
         """
         There are 15 bands (0-14) that can be changed.
 
         "gain" is the multiplier for the given band. The default value is 0. Valid values range from -0.25 to 1.0,
         where -0.25 means the given band is completely muted, and 0.25 means it is doubled. Modifying the gain could
         also change the volume of the output.
+
+        Takes an :class:`Equalizer` or a list of ``{band: gain}`` dicts.
         """
-        update_list = []
-        for x in range(0, len(bands)):
-            for key, value in bands[x].items():
-                if not -1 < key < 15:
-                    raise FiltersError("Invalid band, must be 0-14")
-                gain = max(min(float(value), 1.0), -0.25)
-                band = key
-                update_list.append({'band': band, 'gain': gain})
-        self._payload["equalizer"] = update_list
+        if not isinstance(bands, Equalizer):
+            bands = Equalizer.from_bands({key: value for band in bands for key, value in band.items()})
+        self._payload["equalizer"] = bands.to_payload()
     
     def karaoke(self, level: t.Union[int, float], mono_level: t.Union[int, float], filter_band: t.Union[int, float], filter_width: t.Union[int, float]):
         """
@@ -114,3 +255,81 @@ class Filters:
         Higher frequencies get suppressed, while lower frequencies pass through this filter, thus the name low pass.
         """
         self._payload["lowPass"] = {"smoothing": smoothing}
+
+
+class FilterSet:
+    """
+    An immutable set of filters, e.g. a preset.
+
+    Equal sets compare and hash equal no matter how they were built, and the payload is
+    serialised only once per set. Players remember the set they applied last and skip
+    sending an equal one, so keep presets around instead of rebuilding them.
+
+    Parameters
+    ---------
+    payload: Optional[Mapping[:class:`str`, Any]]
+        The filters as they are sent to Lavalink, e.g. ``{"timescale": {"speed": 1.2, "pitch": 1, "rate": 1}}``.
+    **filters: Any
+        Additional filters in the same format, overriding ``payload``.
+    """
+
+    __slots__ = ("_payload", "_key", "_hash", "_body")
+
+    def __init__(self, payload: t.Optional[t.Mapping[str, t.Any]] = None, **filters: t.Any) -> None:
+        data = {key: value for key, value in {**(payload or {}), **filters}.items() if key not in ("op", "guildId")}
+        data = copy.deepcopy(data)
+        key = _freeze(data)
+        object.__setattr__(self, "_payload", data)
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_hash", hash(key))
+        object.__setattr__(self, "_body", None)
+
+    def __setattr__(self, name: str, value: t.Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FilterSet):
+            return NotImplemented
+        return self._hash == other._hash and self._key == other._key
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"<FilterSet {', '.join(self._payload) or 'empty'}>"
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._payload
+
+    def get(self, name: str, default: t.Any = None) -> t.Any:
+        """A copy of the settings of one filter."""
+        return copy.deepcopy(self._payload.get(name, default))
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        """A copy of the filters as they are sent to Lavalink."""
+        return copy.deepcopy(self._payload)
+
+    def replace(self, **changes: t.Any) -> FilterSet:
+        """A new set with some filters changed, None removes a filter."""
+        data = {**self._payload, **changes}
+        return FilterSet({key: value for key, value in data.items() if value is not None})
+
+    def diff(self, other: t.Optional[FilterSet]) -> t.Dict[str, t.Any]:
+        """The filters that differ from ``other``, with None for those this set does not have."""
+        theirs = dict(other._key) if other is not None else {}
+        ours = dict(self._key)
+        return {
+            name: self.get(name)
+            for name in ours.keys() | theirs.keys()
+            if ours.get(name) != theirs.get(name)
+        }
+
+    def _frame(self, guild_id: str) -> bytes:
+        """The serialised filters op for a guild, built from the cached body."""
+        body = self._body
+        if body is None:
+            body = _to_json_bytes(self._payload)[1:-1]
+            object.__setattr__(self, "_body", body)
+
+        head = b'{"op":"filters","guildId":"' + guild_id.encode() + b'"'
+        return head + b"," + body + b"}" if body else head + b"}"
@@ -0,0 +1,166 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022 CrazzzyyFoxx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+import time
+import typing as t
+from array import array
+
+if t.TYPE_CHECKING:
+    from .stats import Stats
+
+__all__ = ("StatsHistory",)
+
+
+class StatsHistory:
+    """The latest stats of a node, in a fixed-size ring of columns.
+
+    Every sampled field is an ``array('d')`` of ``capacity`` slots, the oldest sample is
+    overwritten once the ring is full, so memory does not grow with uptime. Aggregates
+    take an optional window in seconds, counted back from the latest sample.
+
+    Frame counters are -1 when Lavalink does not report them, such samples are ignored
+    by :meth:`deficit_rate`.
+
+    Parameters
+    ----------
+    capacity: int
+        The number of samples kept. Lavalink reports stats every minute, the default of 120
+        keeps two hours.
+    """
+
+    COLUMNS: t.ClassVar[t.Tuple[str, ...]] = (
+        "players",
+        "playing_players",
+        "system_load",
+        "lavalink_load",
+        "memory_used",
+        "memory_allocated",
+        "frames_sent",
+        "frames_nulled",
+        "frames_deficit",
+    )
+
+    def __init__(self, capacity: int = 120):
+        if capacity < 1:
+            raise ValueError("The capacity must be at least 1.")
+
+        self.capacity: int = capacity
+        self._times: array = array("d", [0.0]) * capacity
+        self._columns: t.Dict[str, array] = {name: array("d", [0.0]) * capacity for name in self.COLUMNS}
+        self._next: int = 0
+        self._size: int = 0
+
+    def __repr__(self) -> str:
+        return f"<StatsHistory samples={self._size}/{self.capacity}>"
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, stats: Stats, at: t.Optional[float] = None) -> None:
+        """Record a sample, taken at :func:`time.monotonic` ``at`` or now."""
+        index = self._next
+        self._times[index] = time.monotonic() if at is None else at
+        for name, column in self._columns.items():
+            column[index] = getattr(stats, name)
+
+        self._next = (index + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def clear(self) -> None:
+        self._next = 0
+        self._size = 0
+
+    def _ordered(self, column: array) -> array:
+        """The filled part of the column, oldest sample first."""
+        if self._size < self.capacity:
+            return column[:self._size]
+        return column[self._next:] + column[:self._next]
+
+    def times(self, seconds: t.Optional[float] = None) -> array:
+        """The monotonic times of the samples in the window, oldest first."""
+        times = self._ordered(self._times)
+        if seconds is None or not times:
+            return times
+        return times[bisect.bisect_left(times, times[-1] - seconds):]
+
+    def values(self, name: str, seconds: t.Optional[float] = None) -> array:
+        """The values of a column in the window, oldest first.
+
+        Raises
+        ------
+        :exc:`KeyError`
+            If ``name`` is not one of :attr:`COLUMNS`.
+        """
+        values = self._ordered(self._columns[name])
+        if seconds is None:
+            return values
+        return values[len(values) - len(self.times(seconds)):]
+
+    def latest(self, name: str) -> t.Optional[float]:
+        if not self._size:
+            return None
+        return self._columns[name][self._next - 1]
+
+    def mean(self, name: str, seconds: t.Optional[float] = None) -> float:
+        """The mean of a column in the window, 0 without samples."""
+        values = self.values(name, seconds)
+        return math.fsum(values) / len(values) if values else 0.0
+
+    def max(self, name: str, seconds: t.Optional[float] = None) -> float:
+        """The maximum of a column in the window, 0 without samples."""
+        values = self.values(name, seconds)
+        return max(values) if values else 0.0
+
+    def percentile(self, name: str, q: float, seconds: t.Optional[float] = None) -> float:
+        """The ``q`` quantile (0 to 1) of a column in the window, interpolated between samples."""
+        values = sorted(self.values(name, seconds))
+        if not values:
+            return 0.0
+
+        position = min(max(q, 0.0), 1.0) * (len(values) - 1)
+        lower = math.floor(position)
+        upper = min(lower + 1, len(values) - 1)
+        return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+    def deficit_rate(self, seconds: t.Optional[float] = None) -> float:
+        """The fraction of the expected audio frames Lavalink could not send in the window.
+
+        Expected frames are the sent, nulled and missing ones. Samples where Lavalink did
+        not report frame stats (-1) are skipped, while a negative deficit, reported when
+        more frames were sent than expected, counts as none missing. 0 when nothing was expected.
+        """
+        expected = missing = 0.0
+        for sent, nulled, deficit in zip(self.values("frames_sent", seconds),
+                                         self.values("frames_nulled", seconds),
+                                         self.values("frames_deficit", seconds)):
+            if sent == -1 or nulled == -1 or deficit == -1:
+                continue
+            deficit = max(deficit, 0.0)
+            expected += sent + nulled + deficit
+            missing += deficit
+        return missing / expected if expected else 0.0
@@ -0,0 +1,218 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022 CrazzzyyFoxx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import typing as t
+
+import hikari
+
+from .enums import TrackEndReason
+from .events import TrackEndEvent, TrackStartEvent
+from .pool import NodePool
+from .timers import TimerHandle, TimingWheel
+
+if t.TYPE_CHECKING:
+    from .client import LavalinkClient
+    from .player import BasePlayer
+
+__all__ = ("IdleManager",)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class IdleManager:
+    """Pauses and destroys players nobody is listening to.
+
+    A player is idle when no human user is in its voice channel or when nothing is
+    playing on it anymore. Idle players are paused after ``pause_after`` seconds and
+    destroyed after ``destroy_after`` seconds. A player that was paused because its
+    channel was empty is resumed as soon as somebody joins again.
+
+    Voice channel occupancy comes from the voice state updates received by the client,
+    every timer lives on a single :class:`TimingWheel`.
+
+    Parameters
+    ----------
+    client: :class:`LavalinkClient`
+        The client whose players are watched.
+    pause_after: Optional[float]
+        Seconds before an idle player is paused, None to never pause. Defaults to 60.
+    destroy_after: Optional[float]
+        Seconds before an idle player is destroyed, None to never destroy. Defaults to 300.
+    resume: bool
+        Whether players paused by the manager resume when a listener comes back. Defaults to True.
+    wheel: Optional[:class:`TimingWheel`]
+        The wheel the timers are scheduled on, a new one with a one second resolution by default.
+    """
+
+    def __init__(
+            self,
+            client: LavalinkClient,
+            *,
+            pause_after: t.Optional[float] = 60.0,
+            destroy_after: t.Optional[float] = 300.0,
+            resume: bool = True,
+            wheel: t.Optional[TimingWheel] = None,
+    ):
+        self.client: LavalinkClient = client
+        self.pause_after: t.Optional[float] = pause_after
+        self.destroy_after: t.Optional[float] = destroy_after
+        self.resume: bool = resume
+        self._wheel: TimingWheel = wheel if wheel is not None else TimingWheel()
+
+        self._members: t.Dict[hikari.Snowflake, t.Dict[hikari.Snowflake, hikari.Snowflake]] = {}
+        self._playing: t.Set[hikari.Snowflake] = set()
+        self._timers: t.Dict[hikari.Snowflake, t.List[TimerHandle]] = {}
+        self._auto_paused: t.Set[hikari.Snowflake] = set()
+
+        client._idle_manager = self
+        NodePool.events.subscribe(TrackStartEvent, self._on_track_start)
+        NodePool.events.subscribe(TrackEndEvent, self._on_track_end)
+
+    def __repr__(self) -> str:
+        return f"<IdleManager idle={len(self._timers)} pause_after={self.pause_after} " \
+               f"destroy_after={self.destroy_after}>"
+
+    def close(self) -> None:
+        """Stop watching players and cancel every pending timer."""
+        self.client._idle_manager = None
+        NodePool.events.unsubscribe(TrackStartEvent, self._on_track_start)
+        NodePool.events.unsubscribe(TrackEndEvent, self._on_track_end)
+        self._wheel.close()
+        self._timers.clear()
+        self._auto_paused.clear()
+
+    def _seed(self, guild_id: hikari.Snowflake) -> t.Dict[hikari.Snowflake, hikari.Snowflake]:
+        """Occupancy of the guild, taken from the cache the first time the guild is seen."""
+        members = self._members.get(guild_id)
+        if members is None:
+            members = self._members[guild_id] = {}
+            cache = getattr(self.client.bot, "cache", None)
+            if cache is not None:
+                for user_id, state in cache.get_voice_states_view_for_guild(guild_id).items():
+                    if state.channel_id is not None and not (state.member and state.member.is_bot):
+                        members[user_id] = state.channel_id
+        return members
+
+    def listeners(self, guild_id: hikari.Snowflake, channel_id: t.Optional[hikari.Snowflake]) -> int:
+        """The number of human users in the voice channel."""
+        if channel_id is None:
+            return 0
+        return sum(1 for channel in self._seed(guild_id).values() if channel == channel_id)
+
+    def is_idle(self, player: BasePlayer) -> bool:
+        """Whether nobody listens to the player or nothing is playing on it."""
+        return (
+            player.guild_id not in self._playing
+            or self.listeners(player.guild_id, player.voice_channel_id) == 0
+        )
+
+    async def _on_voice_state_update(self, event: hikari.VoiceStateUpdateEvent) -> None:
+        """Called by :class:`LavalinkClient` for every voice state update, including other users'."""
+        state = event.state
+        if state.user_id != self.client.bot.get_me().id:
+            if state.member is not None and state.member.is_bot:
+                return
+
+            members = self._seed(event.guild_id)
+            if state.channel_id is None:
+                members.pop(state.user_id, None)
+            else:
+                members[state.user_id] = state.channel_id
+
+        await self.refresh(event.guild_id)
+
+    async def _on_track_start(self, event: TrackStartEvent) -> None:
+        self._playing.add(event.player.guild_id)
+        await self.refresh(event.player.guild_id)
+
+    async def _on_track_end(self, event: TrackEndEvent) -> None:
+        if event.reason is not TrackEndReason.REPLACED:
+            self._playing.discard(event.player.guild_id)
+        await self.refresh(event.player.guild_id)
+
+    def _cancel(self, guild_id: hikari.Snowflake) -> None:
+        for handle in self._timers.pop(guild_id, ()):
+            handle.cancel()
+
+    def _forget(self, guild_id: hikari.Snowflake) -> None:
+        self._cancel(guild_id)
+        self._playing.discard(guild_id)
+        self._auto_paused.discard(guild_id)
+
+    async def refresh(self, guild_id: hikari.Snowflake) -> None:
+        """|coro|
+        Re-evaluate the player of the guild, starting or cancelling its idle timers.
+        """
+        player = await self.client.get_player(guild_id)
+        if player is None:
+            self._forget(guild_id)
+            return
+
+        if not self.is_idle(player):
+            self._cancel(guild_id)
+            if guild_id in self._auto_paused:
+                self._auto_paused.discard(guild_id)
+                if self.resume and player.is_paused():
+                    logger.info(f"Listener returned, resuming player:: {guild_id}")
+                    await player.resume()
+            return
+
+        if guild_id in self._timers:
+            return
+
+        timers = self._timers[guild_id] = []
+        if self.pause_after is not None:
+            timers.append(self._wheel.schedule(self.pause_after, self._expire, guild_id, False))
+        if self.destroy_after is not None:
+            timers.append(self._wheel.schedule(self.destroy_after, self._expire, guild_id, True))
+
+    def _expire(self, guild_id: hikari.Snowflake, destroy: bool) -> None:
+        if destroy:
+            self._timers.pop(guild_id, None)
+        asyncio.create_task(self._reap(guild_id, destroy))
+
+    async def _reap(self, guild_id: hikari.Snowflake, destroy: bool) -> None:
+        player = await self.client.get_player(guild_id)
+        if player is None:
+            self._forget(guild_id)
+            return
+
+        if not self.is_idle(player):
+            return
+
+        try:
+            if destroy:
+                logger.info(f"Destroying idle player:: {guild_id}")
+                self._forget(guild_id)
+                await player.destroy()
+            elif guild_id in self._playing and not player.is_paused():
+                logger.info(f"Pausing idle player:: {guild_id}")
+                self._auto_paused.add(guild_id)
+                await player.pause()
+        except Exception as error:
+            logger.error(f"Failed to reap idle player:: {guild_id} :: {error}")
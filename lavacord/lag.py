@@ -0,0 +1,127 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022 CrazzzyyFoxx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import collections
+import math
+import typing as t
+
+from .utils import Histogram
+
+__all__ = ("LagTracker",)
+
+
+class LagTracker:
+    """Measures how late the ``playerUpdate`` frames of a node arrive.
+
+    Each frame carries the Lavalink clock time it was sent at, the difference with the
+    local receive time is the lag plus the skew between both clocks. The skew is estimated
+    as the smallest difference seen, minus half the smallest REST round trip: the fastest
+    frames took about as long as half a round trip. The estimate is kept per epoch (one
+    per stats frame, so a minute) over the last ``epochs`` epochs, which follows clock drift.
+
+    Lag that rises above the lowest epoch mean adds to the node penalty, so
+    :meth:`NodePool.get_node` avoids congested nodes.
+
+    Parameters
+    ----------
+    epochs: int
+        The number of epochs the skew and the baseline lag are taken from. Defaults to 8.
+    recent: int
+        The number of latest frames the current lag is averaged over. Defaults to 32.
+    penalty_per_second: float
+        Penalty added for each second of lag above the baseline. Defaults to 100, a
+        tenth of a second weighs like ten playing players.
+    """
+
+    def __init__(self, *, epochs: int = 8, recent: int = 32, penalty_per_second: float = 100.0):
+        self.penalty_per_second: float = penalty_per_second
+        self.histogram: Histogram = Histogram()
+        """Lag of every frame in seconds."""
+        self._minima: t.Deque[float] = collections.deque(maxlen=epochs)
+        self._means: t.Deque[float] = collections.deque(maxlen=epochs)
+        self._rtts: t.Deque[float] = collections.deque(maxlen=epochs)
+        self._recent: t.Deque[float] = collections.deque(maxlen=recent)
+        self._epoch_min: float = math.inf
+        self._epoch_sum: float = 0.0
+        self._epoch_count: int = 0
+
+    def __repr__(self) -> str:
+        return f"<LagTracker lag={self.lag:.3f} skew={self.skew} rtt={self.rtt}>"
+
+    @property
+    def rtt(self) -> t.Optional[float]:
+        """The smallest recent REST round trip in seconds, None before the first probe."""
+        return min(self._rtts) if self._rtts else None
+
+    @property
+    def skew(self) -> t.Optional[float]:
+        """Seconds the local clock is ahead of the node's, None before the first frame."""
+        lowest = min(self._epoch_min, min(self._minima, default=math.inf))
+        if lowest == math.inf:
+            return None
+        return lowest - (self.rtt or 0.0) / 2
+
+    @property
+    def lag(self) -> float:
+        """The mean lag of the latest frames in seconds."""
+        return math.fsum(self._recent) / len(self._recent) if self._recent else 0.0
+
+    @property
+    def baseline(self) -> float:
+        """The lowest mean lag of the recent epochs, the lag of the node when it is not congested."""
+        means = list(self._means)
+        if self._epoch_count:
+            means.append(self._epoch_sum / self._epoch_count)
+        return min(means) if means else 0.0
+
+    @property
+    def penalty(self) -> float:
+        return max(self.lag - self.baseline, 0.0) * self.penalty_per_second
+
+    def observe_update(self, sent_at: float, received_at: float) -> None:
+        """Record a frame sent at the node's ``sent_at`` and received at the local ``received_at``, POSIX seconds."""
+        offset = received_at - sent_at
+        if offset < self._epoch_min:
+            self._epoch_min = offset
+
+        lag = max(offset - self.skew, 0.0)
+        self.histogram.observe(lag)
+        self._recent.append(lag)
+        self._epoch_sum += lag
+        self._epoch_count += 1
+
+    def observe_rtt(self, seconds: float) -> None:
+        """Record the round trip of a REST request to the node."""
+        self._rtts.append(seconds)
+
+    def rotate(self) -> None:
+        """Start a new epoch, the oldest one is forgotten once there are ``epochs`` of them."""
+        if self._epoch_count:
+            self._minima.append(self._epoch_min)
+            self._means.append(self._epoch_sum / self._epoch_count)
+        self._epoch_min = math.inf
+        self._epoch_sum = 0.0
+        self._epoch_count = 0
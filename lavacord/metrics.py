@@ -0,0 +1,291 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022 CrazzzyyFoxx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import typing as t
+
+from .utils import Histogram
+
+if t.TYPE_CHECKING:
+    from aiohttp import web
+
+    from .client import LavalinkClient
+    from .pool import Node
+
+__all__ = (
+    "NodeMetrics",
+    "render_metrics",
+    "MetricsServer",
+)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# (attribute of Stats, metric name, help)
+_STATS_GAUGES: t.Tuple[t.Tuple[str, str, str], ...] = (
+    ("uptime", "lavacord_node_uptime_milliseconds", "Uptime reported by the Lavalink node."),
+    ("players", "lavacord_node_players", "Players reported by the Lavalink node."),
+    ("playing_players", "lavacord_node_playing_players", "Playing players reported by the Lavalink node."),
+    ("memory_free", "lavacord_node_memory_free_bytes", "Free memory of the Lavalink node."),
+    ("memory_used", "lavacord_node_memory_used_bytes", "Used memory of the Lavalink node."),
+    ("memory_allocated", "lavacord_node_memory_allocated_bytes", "Allocated memory of the Lavalink node."),
+    ("memory_reservable", "lavacord_node_memory_reservable_bytes", "Reservable memory of the Lavalink node."),
+    ("cpu_cores", "lavacord_node_cpu_cores", "CPU cores of the Lavalink node."),
+    ("system_load", "lavacord_node_system_load", "System load of the Lavalink node."),
+    ("lavalink_load", "lavacord_node_lavalink_load", "Load of the Lavalink process."),
+    ("frames_sent", "lavacord_node_frames_sent", "Audio frames sent per minute, -1 when unknown."),
+    ("frames_nulled", "lavacord_node_frames_nulled", "Audio frames nulled per minute, -1 when unknown."),
+    ("frames_deficit", "lavacord_node_frames_deficit", "Audio frames missing per minute, -1 when unknown."),
+)
+
+_PENALTIES: t.Tuple[t.Tuple[str, str], ...] = (
+    ("player_penalty", "player"),
+    ("cpu_penalty", "cpu"),
+    ("null_frame_penalty", "null_frame"),
+    ("deficit_frame_penalty", "deficit_frame"),
+)
+
+
+class NodeMetrics:
+    """Counters of one node, updated by lavacord as it works.
+
+    Updating them is a dict or attribute increment, they are always on. Node gauges are
+    not stored here, they are read from :attr:`Node.stats` when rendering.
+    """
+
+    __slots__ = ("frames_in", "frames_out", "reconnects", "dispatch_depth", "rest_latency")
+
+    def __init__(self):
+        self.frames_in: t.Dict[str, int] = {}
+        """Frames received from Lavalink by op."""
+        self.frames_out: t.Dict[str, int] = {}
+        """Frames sent to Lavalink by op."""
+        self.reconnects: int = 0
+        """Times the websocket was reconnected after being closed."""
+        self.dispatch_depth: int = 0
+        """Frames received and not processed yet."""
+        self.rest_latency: t.Dict[str, Histogram] = {}
+        """Latency of the REST requests in seconds by endpoint."""
+
+    def __repr__(self) -> str:
+        return f"<NodeMetrics in={sum(self.frames_in.values())} out={sum(self.frames_out.values())} " \
+               f"reconnects={self.reconnects}>"
+
+    def observe_rest(self, endpoint: str, seconds: float) -> None:
+        histogram = self.rest_latency.get(endpoint)
+        if histogram is None:
+            histogram = self.rest_latency[endpoint] = Histogram()
+        histogram.observe(seconds)
+
+
+def _escape(value: t.Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class _Writer:
+    def __init__(self):
+        self.lines: t.List[str] = []
+
+    def header(self, name: str, kind: str, text: str) -> None:
+        self.lines.append(f"# HELP {name} {text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name: str, labels: t.Dict[str, t.Any], value: float) -> None:
+        if labels:
+            rendered = ",".join(f'{key}="{_escape(label)}"' for key, label in labels.items())
+            self.lines.append(f"{name}{{{rendered}}} {_number(value)}")
+        else:
+            self.lines.append(f"{name} {_number(value)}")
+
+    def histogram(self, name: str, labels: t.Dict[str, t.Any], histogram: Histogram) -> None:
+        for bound, total in histogram.cumulative():
+            self.sample(f"{name}_bucket", {**labels, "le": _number(bound)}, total)
+        self.sample(f"{name}_sum", labels, histogram.sum)
+        self.sample(f"{name}_count", labels, histogram.count)
+
+    def text(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+def render_metrics(
+        nodes: t.Optional[t.Iterable[Node]] = None,
+        *,
+        client: t.Optional[LavalinkClient] = None
+) -> str:
+    """Render the metrics of the nodes in the Prometheus text format.
+
+    Parameters
+    ----------
+    nodes: Optional[Iterable[:class:`Node`]]
+        The nodes to render, every node of the pool by default.
+    client: Optional[:class:`LavalinkClient`]
+        Also render the voice join latency of this client.
+    """
+    if nodes is None:
+        from .pool import NodePool
+        nodes = NodePool._nodes.values()
+    nodes = list(nodes)
+    writer = _Writer()
+
+    writer.header("lavacord_node_connected", "gauge", "Whether the websocket of the node is connected.")
+    for node in nodes:
+        writer.sample("lavacord_node_connected", {"node": node.identifier}, int(node.is_connected()))
+
+    writer.header("lavacord_node_local_players", "gauge", "Players of this client on the node.")
+    for node in nodes:
+        writer.sample("lavacord_node_local_players", {"node": node.identifier}, len(node.players))
+
+    with_stats = [node for node in nodes if node.stats is not None]
+    for attribute, name, text in _STATS_GAUGES:
+        writer.header(name, "gauge", text)
+        for node in with_stats:
+            writer.sample(name, {"node": node.identifier}, getattr(node.stats, attribute))
+
+    # The components add up to the penalty, which gets its own metric so summing the components is not off.
+    writer.header("lavacord_node_penalty", "gauge", "Load balancing penalty of the node by component.")
+    for node in with_stats:
+        for attribute, component in _PENALTIES:
+            writer.sample("lavacord_node_penalty", {"node": node.identifier, "component": component},
+                          getattr(node.stats.penalty, attribute))
+        writer.sample("lavacord_node_penalty", {"node": node.identifier, "component": "lag"}, node.lag.penalty)
+
+    writer.header("lavacord_node_load_penalty", "gauge", "Load balancing penalty of the node, lower is preferred.")
+    for node in with_stats:
+        writer.sample("lavacord_node_load_penalty", {"node": node.identifier}, node.penalty)
+
+    writer.header("lavacord_websocket_frames_received_total", "counter", "Frames received from Lavalink by op.")
+    for node in nodes:
+        for op, count in sorted(node.metrics.frames_in.items()):
+            writer.sample("lavacord_websocket_frames_received_total", {"node": node.identifier, "op": op}, count)
+
+    writer.header("lavacord_websocket_frames_sent_total", "counter", "Frames sent to Lavalink by op.")
+    for node in nodes:
+        for op, count in sorted(node.metrics.frames_out.items()):
+            writer.sample("lavacord_websocket_frames_sent_total", {"node": node.identifier, "op": op}, count)
+
+    writer.header("lavacord_websocket_reconnects_total", "counter", "Websocket reconnections of the node.")
+    for node in nodes:
+        writer.sample("lavacord_websocket_reconnects_total", {"node": node.identifier}, node.metrics.reconnects)
+
+    writer.header("lavacord_websocket_dispatch_depth", "gauge", "Received frames waiting to be processed.")
+    for node in nodes:
+        writer.sample("lavacord_websocket_dispatch_depth", {"node": node.identifier}, node.metrics.dispatch_depth)
+
+    writer.header("lavacord_rest_request_seconds", "histogram", "Latency of the REST requests by endpoint.")
+    for node in nodes:
+        for endpoint, histogram in sorted(node.metrics.rest_latency.items()):
+            writer.histogram("lavacord_rest_request_seconds",
+                             {"node": node.identifier, "endpoint": endpoint}, histogram)
+
+    writer.header("lavacord_node_lag_seconds", "histogram", "Lag of the playerUpdate frames, corrected for clock skew.")
+    for node in nodes:
+        writer.histogram("lavacord_node_lag_seconds", {"node": node.identifier}, node.lag.histogram)
+
+    writer.header("lavacord_node_clock_skew_seconds", "gauge", "Seconds the local clock is ahead of the node's.")
+    for node in nodes:
+        if node.lag.skew is not None:
+            writer.sample("lavacord_node_clock_skew_seconds", {"node": node.identifier}, node.lag.skew)
+
+    writer.header("lavacord_node_rest_rtt_seconds", "gauge", "Smallest recent REST round trip to the node.")
+    for node in nodes:
+        if node.lag.rtt is not None:
+            writer.sample("lavacord_node_rest_rtt_seconds", {"node": node.identifier}, node.lag.rtt)
+
+    if client is not None:
+        writer.header("lavacord_voice_join_seconds", "histogram", "Time from joining a voice channel to voiceUpdate.")
+        writer.histogram("lavacord_voice_join_seconds", {}, client.join_latency)
+
+    return writer.text()
+
+
+class MetricsServer:
+    """A local HTTP endpoint serving :func:`render_metrics` for Prometheus to scrape.
+
+    Parameters
+    ----------
+    host: str
+        The address to listen on. Defaults to ``127.0.0.1``.
+    port: int
+        The port to listen on. Defaults to 9464.
+    path: str
+        The path of the metrics. Defaults to ``/metrics``.
+    client: Optional[:class:`LavalinkClient`]
+        Passed to :func:`render_metrics`.
+    """
+
+    def __init__(
+            self,
+            host: str = "127.0.0.1",
+            port: int = 9464,
+            *,
+            path: str = "/metrics",
+            client: t.Optional[LavalinkClient] = None
+    ):
+        self.host: str = host
+        self.port: int = port
+        self.path: str = path
+        self.client: t.Optional[LavalinkClient] = client
+        self._runner: t.Optional[web.AppRunner] = None
+
+    def __repr__(self) -> str:
+        return f"<MetricsServer http://{self.host}:{self.port}{self.path}>"
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        from aiohttp import web
+
+        return web.Response(body=render_metrics(client=self.client).encode("utf-8"),
+                            headers={"Content-Type": CONTENT_TYPE})
+
+    async def start(self) -> None:
+        """|coro|
+        Start serving the metrics.
+        """
+        from aiohttp import web
+
+        app = web.Application()
+        app.router.add_get(self.path, self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        logger.info(f"Serving metrics:: {self!r}")
+
+    async def close(self) -> None:
+        """|coro|
+        Stop serving the metrics.
+        """
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
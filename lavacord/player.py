@@ -24,17 +24,24 @@ SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
 import datetime
 import logging
+import time
 import typing as t
 
 import hikari
-import yarl
 
-from . import abc, Playlist
+from . import abc, Playlist, tracing
+from .bus import EventCallback
+from .enums import RepeatMode, TrackEndReason
+from .filter import Filters, FilterSet
 from .queue import Queue
+from .ramp import Easing, RampScheduler, default_ramps, linear
+from .router import SourceRouter, default_router
 from .stats import PlayerState
 from .tracks import *
+from .updates import Publisher, StateUpdates
 
 if t.TYPE_CHECKING:
     from .pool import Node, NodePool
@@ -49,11 +56,15 @@ logger: logging.Logger = logging.getLogger(__name__)
 class BasePlayer:
     """Lavaplayer object."""
 
+    ramps: t.ClassVar[RampScheduler] = default_ramps
+
     def __init__(self,
                  guild_id: hikari.Snowflake,
                  channel_id: hikari.Snowflake,
                  *,
-                 node: Node):
+                 node: Node,
+                 prefetch_window: t.Optional[float] = None,
+                 auto_advance: bool = False):
         self.last_state: PlayerState = PlayerState.null()
 
         self.voice_channel_id: hikari.Snowflake = channel_id
@@ -68,8 +79,24 @@ class BasePlayer:
         self.volume: float = 100
         self._paused: bool = False
         self._source: t.Optional[abc.Track] = None
+        self._previous_source: t.Optional[abc.Track] = None
+        self._voice_server: t.Optional[t.Dict[str, str]] = None
+        self.filters: t.Optional[FilterSet] = None
+        """The filters last applied to the player."""
         self.queue = Queue()
 
+        self.prefetch_window: t.Optional[float] = prefetch_window
+        """Seconds before the end of a track at which the next one is prepared. None disables prefetching."""
+        self.auto_advance: bool = auto_advance
+        """Whether the next queued track is started by lavacord itself when a track ends."""
+        self._prefetched: t.Optional[t.Tuple[abc.Track, abc.Track, t.Dict[str, t.Any]]] = None
+        self._prefetch_handle: t.Optional[asyncio.TimerHandle] = None
+        self._prefetch_task: t.Optional[asyncio.Task] = None
+        self._removed: t.Optional[asyncio.Future] = None
+        self._subscriptions: t.List[t.Tuple[t.Type[hikari.Event], EventCallback[t.Any]]] = []
+        self._updates: Publisher[PlayerState] = Publisher()
+        self._start_span: t.Any = None
+
     @property
     def source(self) -> t.Optional[abc.Track]:
         """The currently playing audio source."""
@@ -81,10 +108,15 @@ class BasePlayer:
         if not self.is_playing():
             return datetime.timedelta(seconds=0)
 
-        if self.is_paused():
+        if self.is_paused() or not self.last_state.received_at:
             return self.last_state.position
 
-        return self.last_state.position
+        position = self.last_state.position + datetime.timedelta(
+            seconds=time.monotonic() - self.last_state.received_at
+        )
+        if not self._source.is_stream:
+            position = min(position, self._source.length)
+        return position
 
     def is_connected(self) -> bool:
         """Indicates whether the player is connected to voice."""
@@ -123,6 +155,118 @@ class BasePlayer:
         await self.node.bot.update_voice_state(self.guild_id, channel.id)
         logger.info(f"Moving to voice channel:: {channel.id}")
 
+    def _play_payload(self, source: abc.Track, replace: bool, start: int, end: int) -> t.Dict[str, t.Any]:
+        payload = {
+            "op": "play",
+            "guildId": str(self.guild_id),
+            "track": source.id,
+            "noReplace": not replace,
+            "startTime": str(start),
+        }
+        if end > 0:
+            payload["endTime"] = str(end)
+
+        return payload
+
+    def _cancel_prefetch(self) -> None:
+        if self._prefetch_handle is not None:
+            self._prefetch_handle.cancel()
+            self._prefetch_handle = None
+
+    def _start_prefetch(self) -> None:
+        self._prefetch_handle = None
+        if self._prefetch_task is None or self._prefetch_task.done():
+            self._prefetch_task = asyncio.create_task(self.prefetch())
+            self._prefetch_task.add_done_callback(self._on_prefetch_done)
+
+    def _on_prefetch_done(self, task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Prefetch failed:: {task.exception()} ({self.voice_channel_id})")
+
+    def _on_state_update(self) -> None:
+        """Publish the latest ``playerUpdate`` and schedule the prefetch of the next track from it."""
+        self._updates.publish(self.last_state)
+        self._cancel_prefetch()
+
+        source = self._source
+        if self.prefetch_window is None or source is None or source.is_stream:
+            return
+        if self._prefetched is not None and self.queue.peek_next_track() is self._prefetched[0]:
+            return
+
+        remaining = (source.length - self.position).total_seconds() - self.prefetch_window
+        if remaining <= 0:
+            self._start_prefetch()
+        elif not self.is_paused():
+            self._prefetch_handle = asyncio.get_running_loop().call_later(remaining, self._start_prefetch)
+
+    async def prefetch(self) -> t.Optional[abc.Track]:
+        """|coro|
+        Prepare the next queued track so it can be sent as soon as the current one ends.
+
+        Lazy metadata of the track is resolved and its ``play`` frame is built ahead of time,
+        :meth:`play` then sends it without any further work.
+        Called automatically when ``prefetch_window`` is set.
+        Returns
+        -------
+        Optional[:class:`lavacord.abc.Track`]
+            The prepared track, None if nothing is queued.
+        """
+        track = self.queue.peek_next_track()
+        if track is None:
+            return None
+
+        if self._prefetched is not None and self._prefetched[0] is track:
+            return self._prefetched[1]
+
+        resolved = await track.resolve(self.node)
+        self._prefetched = (track, resolved, self._play_payload(resolved, True, 0, 0))
+        logger.debug(f"Prefetched track:: {resolved.__repr__()} ({self.voice_channel_id})")
+        return resolved
+
+    def _known_track(self, identifier: str) -> t.Optional[abc.Track]:
+        """The track object of a base64 identifier, if it is the current, previous or prefetched track."""
+        for track in (self._source, self._previous_source, self._prefetched and self._prefetched[1]):
+            if track and track.id == identifier:
+                return track
+        return None
+
+    def _on_track_started(self) -> None:
+        if self._start_span is not None:
+            self._start_span.end()
+            self._start_span = None
+
+    def _on_track_ended(self, identifier: str, reason: str) -> None:
+        """Clear the current track after ``TrackEndEvent``, unless a newer track already replaced it."""
+        source = self._source
+        if source is None:
+            return
+        if self._start_span is not None and source.id == identifier:
+            # The track ended without starting, e.g. it failed to load.
+            self._start_span.set_attribute("reason", reason)
+            self._on_track_started()
+        if reason != TrackEndReason.REPLACED.value or source.id == identifier:
+            self._previous_source, self._source = source, None
+
+    async def _on_track_end(self, reason: TrackEndReason) -> None:
+        """Start the next queued track after ``TrackEndEvent`` when auto advance is enabled."""
+        if not self.auto_advance or not reason.may_start_next:
+            return
+
+        if reason is TrackEndReason.LOAD_FAILED and self.queue.repeat_mode == RepeatMode.ONE:
+            # Repeating a track that cannot be loaded would loop forever, move on instead.
+            track = self.queue.get() if self.queue else None
+        elif self.queue.peek_next_track() is not None:
+            track = self.queue.get_next_track()
+        else:
+            track = None
+
+        if track is None:
+            logger.debug(f"Auto advance:: queue is empty ({self.voice_channel_id})")
+            return
+
+        await self.play(track)
+
     async def play(
             self, source: abc.Track, replace: bool = True, start: int = 0, end: int = 0
     ):
@@ -149,20 +293,28 @@ class BasePlayer:
         else:
             return
 
-        payload = {
-            "op": "play",
-            "guildId": str(self.guild_id),
-            "track": source.id,
-            "noReplace": not replace,
-            "startTime": str(start),
-        }
-        if end > 0:
-            payload["endTime"] = str(end)
+        prefetched, self._prefetched = self._prefetched, None
+        self._cancel_prefetch()
 
-        await self.node._websocket.send(payload)
+        if prefetched is not None and (source is prefetched[0] or source is prefetched[1]) \
+                and (replace, start, end) == (True, 0, 0):
+            source, payload = prefetched[1], prefetched[2]
+        else:
+            source = await source.resolve(self.node)
+            payload = self._play_payload(source, replace, start, end)
+
+        with tracing.span("lavacord.player.play", guild=self.guild_id, node=self.node.identifier,
+                          track=source.identifier):
+            await self.node._websocket.send(payload)
+
+        # Time until Lavalink reports the track started, ended by _on_track_started.
+        self._on_track_started()
+        self._start_span = tracing.span("lavacord.player.start", guild=self.guild_id, track=source.identifier)
 
         logger.info(f"Started playing track:: {source.__repr__()} ({self.voice_channel_id})")
 
+        if self._source is not None:
+            self._previous_source = self._source
         self._source = source
         return source
 
@@ -170,10 +322,13 @@ class BasePlayer:
         """|coro|
         Stop the Player's currently playing song.
         """
-        await self.node._websocket.send({
-            "op": "stop", "guildId": str(self.guild_id)}
-        )
+        with tracing.span("lavacord.player.stop", guild=self.guild_id, node=self.node.identifier):
+            await self.node._websocket.send({
+                "op": "stop", "guildId": str(self.guild_id)}
+            )
         logger.info(f"Current track stopped:: {str(self.source)} ({self.voice_channel_id})")
+        if self._source is not None:
+            self._previous_source = self._source
         self._source = None
 
     async def set_pause(self, pause: bool) -> None:
@@ -184,9 +339,10 @@ class BasePlayer:
         pause: bool
             A bool indicating if the player's paused state should be set to True or False.
         """
-        await self.node._websocket.send(
-            {"op": "pause", "guildId": str(self.guild_id), "pause": pause}
-        )
+        with tracing.span("lavacord.player.pause", guild=self.guild_id, node=self.node.identifier, pause=pause):
+            await self.node._websocket.send(
+                {"op": "pause", "guildId": str(self.guild_id), "pause": pause}
+            )
         self._paused = pause
         logger.info(f"Set pause:: {self._paused} ({self.voice_channel_id})")
 
@@ -213,11 +369,69 @@ class BasePlayer:
             The volume to set the player to.
         """
         self.volume = max(min(volume, 1000), 0)
-        await self.node._websocket.send(
-            {"op": "volume", "guildId": str(self.guild_id), "volume": self.volume}
-        )
+        with tracing.span("lavacord.player.volume", guild=self.guild_id, node=self.node.identifier):
+            await self.node._websocket.send(
+                {"op": "volume", "guildId": str(self.guild_id), "volume": self.volume}
+            )
         logger.info(f"Set volume:: {self.volume} ({self.voice_channel_id})")
 
+    async def fade_volume(self, volume: int, duration: float, *, easing: Easing = linear) -> bool:
+        """|coro|
+        Gradually change the volume, e.g. to fade out before skipping.
+        Parameters
+        ----------
+        volume: int
+            The target volume.
+        duration: float
+            Seconds the fade takes.
+        easing: :class:`Easing`
+            The shape of the fade. Defaults to linear.
+        Returns
+        -------
+        bool
+            Whether the target was reached, False if another fade replaced this one.
+        """
+        return await self.ramps.fade_volume(self, volume, duration, easing=easing)
+
+    async def ramp_filters(self, filters: t.Union[Filters, FilterSet], duration: float, *,
+                           easing: Easing = linear) -> bool:
+        """|coro|
+        Gradually move the numeric filter settings to ``filters``, e.g. a slow timescale change.
+
+        Works like :meth:`fade_volume`.
+        """
+        if isinstance(filters, Filters):
+            filters = filters.freeze()
+        return await self.ramps.ramp_filters(self, filters, duration, easing=easing)
+
+    async def set_filters(self, filters: t.Union[Filters, FilterSet]) -> bool:
+        """|coro|
+        Apply filters to the player, replacing the current ones.
+
+        Nothing is sent when the filters equal the ones already applied.
+        Parameters
+        ----------
+        filters: Union[:class:`Filters`, :class:`FilterSet`]
+            The filters to apply.
+        Returns
+        -------
+        bool
+            Whether the filters changed.
+        """
+        if isinstance(filters, Filters):
+            filters = filters.freeze()
+
+        if filters == self.filters:
+            logger.debug(f"Filters unchanged:: {filters} ({self.voice_channel_id})")
+            return False
+
+        changes = filters.diff(self.filters)
+        with tracing.span("lavacord.player.filters", guild=self.guild_id, node=self.node.identifier):
+            await self.node._websocket.send_raw(filters._frame(str(self.guild_id)), op="filters")
+        self.filters = filters
+        logger.info(f"Set filters:: {changes} ({self.voice_channel_id})")
+        return True
+
     async def seek(self, position: int = 0) -> None:
         """|coro|
         Seek to the given position in the song.
@@ -226,56 +440,148 @@ class BasePlayer:
         position: int
             The position as an int in milliseconds to seek to. Could be None to seek to beginning.
         """
-        await self.node._websocket.send(
-            dict(op="seek", guildId=str(self.guild_id), position=position)
-        )
+        with tracing.span("lavacord.player.seek", guild=self.guild_id, node=self.node.identifier):
+            await self.node._websocket.send(
+                dict(op="seek", guildId=str(self.guild_id), position=position)
+            )
 
     async def destroy(self):
         """|coro|
                Destroy the player..
                 """
-        await self.node._websocket.send(
-            {"op": "destroy", "guildId": str(self.guild_id)}
-        )
+        with tracing.span("lavacord.player.destroy", guild=self.guild_id, node=self.node.identifier):
+            await self.node._websocket.send(
+                {"op": "destroy", "guildId": str(self.guild_id)}
+            )
+        self._on_track_started()
         logger.info(f'Player destroyed:: {self.voice_channel_id}')
-        self.node._players.pop(self.guild_id)
+        self._cancel_prefetch()
+        for event_type, callback in self._subscriptions:
+            self.node._pool_events.unsubscribe(event_type, callback, guild_id=self.guild_id)
+        self._subscriptions.clear()
+        self._updates.close()
+        self.node._remove_player(self.guild_id)
         await self.disconnect()
 
+    def subscribe(self, event_type: t.Type[hikari.Event], callback: EventCallback[t.Any]) -> None:
+        """Call ``callback`` for the events of ``event_type`` of this player's guild until it is destroyed.
+
+        The callback is called directly by lavacord, independently of hikari's dispatcher.
+        """
+        self.node._pool_events.subscribe(event_type, callback, guild_id=self.guild_id)
+        self._subscriptions.append((event_type, callback))
+
+    def unsubscribe(self, event_type: t.Type[hikari.Event], callback: EventCallback[t.Any]) -> None:
+        """Remove a listener added by :meth:`subscribe`."""
+        self.node._pool_events.unsubscribe(event_type, callback, guild_id=self.guild_id)
+        if (event_type, callback) in self._subscriptions:
+            self._subscriptions.remove((event_type, callback))
+
+    def updates(self, min_interval: float = 0.0) -> StateUpdates:
+        """Subscribe to the ``playerUpdate`` states of this player.
+
+        .. code-block:: python
+
+            async for state in player.updates(min_interval=1):
+                ...
+
+        A consumer slower than the updates receives the latest state and skips the older ones.
+        The iteration ends when the player is destroyed or the subscription is closed.
+
+        Parameters
+        ----------
+        min_interval: float
+            The minimum number of seconds between two states. Defaults to 0.
+        """
+        updates = StateUpdates(min_interval)
+        self._updates.add(updates)
+        return updates
+
+    async def wait_for(
+            self,
+            event_type: t.Type[hikari.Event],
+            *,
+            predicate: t.Optional[t.Callable[[t.Any], bool]] = None,
+            timeout: t.Optional[float] = None
+    ) -> t.Any:
+        """|coro|
+        Wait for the next event of ``event_type`` of this player's guild.
+        """
+        return await self.node._pool_events.wait_for(event_type, guild_id=self.guild_id,
+                                                     predicate=predicate, timeout=timeout)
+
+    def _removal(self) -> asyncio.Future:
+        """Future resolved once the player is removed from its node."""
+        if self._removed is None:
+            self._removed = asyncio.get_running_loop().create_future()
+            if self.node.get_player(self.guild_id) is not self:
+                self._removed.set_result(None)
+        return self._removed
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        """JSON-compatible snapshot of the player, restorable with :meth:`_restore`."""
+        return {
+            "guild_id": int(self.guild_id),
+            "channel_id": int(self.voice_channel_id) if self.voice_channel_id else None,
+            "session_id": self.session_id,
+            "voice_server": self._voice_server,
+            "volume": self.volume,
+            "paused": self._paused,
+            "position": int(self.position.total_seconds() * 1000),
+            "source": self._source.to_dict() if self._source is not None else None,
+            "filters": self.filters.to_dict() if self.filters is not None else None,
+            "queue": self.queue.to_dict(),
+        }
+
+    async def _restore(self, data: t.Dict[str, t.Any], *, resumed: bool) -> None:
+        """Load a snapshot made by :meth:`to_dict`.
+
+        When the node resumed its Lavalink session the server still plays the track and only the
+        local state is restored, otherwise voice, volume, filters and the track are sent again.
+        """
+        self.session_id = data["session_id"]
+        self._voice_server = data["voice_server"]
+        self.volume = data["volume"]
+        self._paused = data["paused"]
+        self._connected = self.voice_channel_id is not None
+        self.queue = type(self.queue).from_dict(data["queue"])
+
+        source = abc.Track.from_dict(data["source"]) if data["source"] else None
+        filters = FilterSet(data["filters"]) if data["filters"] else None
+
+        if resumed:
+            self.filters = filters
+            self._source = source
+            self.last_state = PlayerState({"time": 0, "position": data["position"], "connected": True})
+            return
+
+        if self.session_id and self._voice_server:
+            await self.node._websocket.send({
+                "op": "voiceUpdate",
+                "guildId": str(self.guild_id),
+                "sessionId": self.session_id,
+                "event": self._voice_server
+            })
+
+        if self.volume != 100:
+            await self.set_volume(self.volume)
+
+        if filters is not None:
+            await self.set_filters(filters)
+
+        if source is not None:
+            paused = self._paused
+            await self.play(source, start=data["position"])
+            if paused:
+                await self.set_pause(True)
+
 
 class Player(BasePlayer):
+    router: t.ClassVar[SourceRouter] = default_router
+    """The :class:`SourceRouter` used by :meth:`search_tracks`, override it to change the supported sources."""
+
     async def search_tracks(self,
                             query: str,
                             member: hikari.Snowflake,
                             ) -> t.Optional[t.Union[SearchableTrack, Playlist]]:
-        result = yarl.URL(query)
-        if not result.host:
-            data = await YouTubeTrack.search(query, member, self.node, return_first=True)
-        else:
-            query = str(result)
-            if result.host in ("www.youtube.com", "youtube.com"):
-                if result.query.get('list'):
-                    data = await YouTubePlaylist.search(query, member, self.node)
-                else:
-                    data = await YouTubeTrack.search(query, member, self.node, return_first=True)
-            elif result.host in ("www.music.youtube.com", "music.youtube.com"):
-                if result.query.get('list'):
-                    data = await YouTubeMusicPlaylist.search(query, member, self.node)
-                else:
-                    data = await YouTubeMusicTrack.search(query, member, self.node, return_first=True)
-            elif result.host in ("open.spotify.com",):
-                type_ = result.parts[-2]
-                if type_ == "playlist":
-                    data = await SpotifyPlaylist.search(result.parts[-1], member, self.node)
-                elif type_ == "track":
-                    data = await SpotifyTrack.search(result.parts[-1], member, self.node)
-                elif type_ == "album":
-                    data = await SpotifyAlbum.search(result.parts[-1], member, self.node)
-                else:
-                    return None
-
-            elif result.host in ("www.twitch.tv",):
-                data = await TwitchTrack.search(query, member, self.node)
-            else:
-                return
-
-        return data
+        return await self.router.resolve(query, member, self.node)
@@ -28,8 +28,11 @@ from __future__ import annotations
 import asyncio.exceptions
 import logging
 import os
+import time
 from typing import (
     Any,
+    Awaitable,
+    Callable,
     ClassVar,
     Dict,
     List,
@@ -44,10 +47,17 @@ import hikari
 import tekore
 
 from . import abc
+from .bus import EventBus
 from .enums import *
+from . import tracing
 from .exceptions import *
+from .history import StatsHistory
+from .lag import LagTracker
+from .metrics import NodeMetrics
 from .player import BasePlayer
-from .stats import Stats
+from .ratelimit import RateLimiter
+from .stats import PlayerState, Stats
+from .updates import PoolStateUpdates, Publisher
 from .utils import _from_json, Credentials
 from .websocket import Websocket
 
@@ -60,6 +70,9 @@ PT = TypeVar("PT", bound=abc.Track)
 PLT = TypeVar("PLT", bound=abc.Playlist)
 BP = TypeVar("BP", bound=BasePlayer)
 
+PlayerSelector = Callable[[BasePlayer], bool]
+PlayerOperation = Callable[[BasePlayer], Awaitable[Any]]
+
 logger: logging.Logger = logging.getLogger(__name__)
 
 
@@ -73,6 +86,9 @@ class Node:
         This class should not be created manually. Please use :meth:`NodePool.create_node()` instead.
     """
 
+    PROBE_INTERVAL: ClassVar[float] = 300.0
+    """Minimum seconds between two REST round trip probes, see :attr:`lag`."""
+
     def __init__(
             self,
             bot: hikari.GatewayBot,
@@ -87,8 +103,15 @@ class Node:
             spotify_client_secret: Optional[str] = None,
             identifier: str = None,
             resume_key: Optional[str] = None,
+            dispatch_events: bool = True,
     ):
         self.bot = bot
+        self.events: EventBus = EventBus()
+        """Listeners for the events of this node only, see :attr:`NodePool.events` for all nodes."""
+        self.dispatch_events: bool = dispatch_events
+        """Whether events are also dispatched through hikari, in addition to the event buses."""
+        self.metrics: NodeMetrics = NodeMetrics()
+        """Counters of this node, see :func:`render_metrics`."""
         self.credentials: Credentials = Credentials(host,
                                                     password,
                                                     port=port,
@@ -101,6 +124,12 @@ class Node:
         self._players: Dict[hikari.Snowflake, BasePlayer] = {}
         self._websocket: Optional[Websocket] = None
         self.stats: Optional[Stats] = None
+        self.history: StatsHistory = StatsHistory()
+        """The recent stats of the node."""
+        self.lag: LagTracker = LagTracker()
+        """The lag of the frames received from the node, part of its :attr:`penalty`."""
+        self._probe_task: Optional[asyncio.Task] = None
+        self._probed_at: Optional[float] = None
         self._spotify: Optional[tekore.Spotify] = None
 
         if spotify_client_id and spotify_client_secret:
@@ -135,12 +164,17 @@ class Node:
         if self.stats is None:
             return 9e30
 
-        return self.stats.penalty.total
+        return self.stats.penalty.total + self.lag.penalty
 
     @property
     def spotify(self) -> tekore.Spotify:
         return self._spotify
 
+    @property
+    def resumed(self) -> bool:
+        """Whether Lavalink resumed the session of the resume key, keeping its players, when the node connected."""
+        return self._websocket is not None and self._websocket.resumed
+
     def is_connected(self) -> bool:
         """Bool indicating whether or not this Node is currently connected to Lavalink."""
         if self._websocket is None:
@@ -152,27 +186,135 @@ class Node:
         self._websocket = Websocket(node=self)
         await self._websocket.connect()
 
-    async def create_player(self, voice_state: hikari.VoiceState, cls=BasePlayer) -> BP:
-        player = cls(voice_state.guild_id, voice_state.channel_id, node=self)
+    async def create_player(self, voice_state: hikari.VoiceState, cls=BasePlayer, **kwargs: Any) -> BP:
+        player = cls(voice_state.guild_id, voice_state.channel_id, node=self, **kwargs)
         self._players[voice_state.guild_id] = player
         return player
 
     def get_player(self, guild_id: hikari.Snowflake) -> Optional[BP]:
         return self._players.get(guild_id)
 
-    async def _get_data(self,
-                        endpoint: str,
-                        params: dict
-                        ) -> Tuple[Dict[str, Any], aiohttp.ClientResponse]:
+    @property
+    def _pool_events(self) -> EventBus:
+        """The bus shared by every node, players subscribe there so they keep their listeners across nodes."""
+        return NodePool.events
+
+    async def _dispatch(self, event: hikari.Event, guild_id: Optional[hikari.Snowflake] = None) -> None:
+        """Deliver an event to this node's bus, the pool's bus and, if enabled, hikari."""
+        await self.events.dispatch(event, guild_id)
+        await self._pool_events.dispatch(event, guild_id)
+        if self.dispatch_events:
+            await self.bot.dispatch(event)
+
+    def _on_stats(self, stats: Stats) -> None:
+        self.stats = stats
+        self.history.append(stats)
+        self.lag.rotate()
+        self._schedule_probe()
+
+    def _schedule_probe(self) -> None:
+        """Start a probe unless one is running or ran within :attr:`PROBE_INTERVAL`."""
+        if self._probe_task is not None and not self._probe_task.done():
+            return
+
+        now = time.monotonic()
+        if self._probed_at is not None and now - self._probed_at < self.PROBE_INTERVAL:
+            return
+
+        self._probed_at = now
+        self._probe_task = asyncio.create_task(self._probe())
+
+    def _on_player_update(self, state: PlayerState, received_at: float) -> None:
+        """Record the lag of a ``playerUpdate`` frame received at the POSIX time ``received_at``."""
+        self.lag.observe_update(state.time.timestamp(), received_at)
+
+    async def _probe(self) -> None:
+        """Measure the REST round trip to the node, used to correct the lag for clock skew."""
+        started = time.perf_counter()
+        try:
+            await self._request("version", text=True)
+        except Exception as error:
+            logger.debug(f"Latency probe failed:: {error} ({self.identifier})")
+            return
+
+        self.lag.observe_rtt(time.perf_counter() - started)
+
+    def _publish_state(self, player: BP, state: PlayerState) -> None:
+        NodePool._updates.publish((player, state))
+
+    def _remove_player(self, guild_id: hikari.Snowflake) -> Optional[BP]:
+        player = self._players.pop(guild_id, None)
+        if player is not None and player._removed is not None and not player._removed.done():
+            player._removed.set_result(None)
+        return player
 
+    async def apply(self,
+                    operation: PlayerOperation,
+                    selector: Optional[PlayerSelector] = None,
+                    *,
+                    concurrency: int = 16,
+                    rate: Optional[float] = None,
+                    ) -> Dict[hikari.Snowflake, Any]:
+        """|coro|
+        Run an operation on many players of this node concurrently.
+
+        Parameters
+        ----------
+        operation: Callable[[:class:`BasePlayer`], Awaitable[Any]]
+            The coroutine function to run, e.g. ``lambda player: player.set_volume(50)``.
+        selector: Optional[Callable[[:class:`BasePlayer`], bool]]
+            Only players for which this returns True are affected. Defaults to every player.
+        concurrency: int
+            The maximum amount of operations running at once. Defaults to 16.
+        rate: Optional[float]
+            The maximum amount of operations started per second, None for no limit.
+        Returns
+        -------
+        Dict[:class:`hikari.Snowflake`, Any]
+            The result of the operation for every affected guild, or the exception it raised.
+        """
+        players = [player for player in list(self._players.values()) if selector is None or selector(player)]
+        semaphore = asyncio.Semaphore(concurrency)
+        limiter = RateLimiter(rate) if rate is not None else None
+
+        async def run(player: BasePlayer) -> Any:
+            async with semaphore:
+                if limiter is not None:
+                    await limiter.acquire()
+                return await operation(player)
+
+        results = await asyncio.gather(*(run(player) for player in players), return_exceptions=True)
+        logger.debug(f"Bulk operation on {len(players)} players:: {self}")
+        return {player.guild_id: result for player, result in zip(players, results)}
+
+    async def _request(self,
+                       endpoint: str,
+                       params: Optional[dict] = None,
+                       *,
+                       text: bool = False
+                       ) -> Tuple[Any, aiohttp.ClientResponse]:
+        """GET a REST endpoint of the node, traced and timed in :attr:`metrics`.
+
+        The body is decoded as JSON, or returned as is when ``text`` is True.
+        """
         headers = {"Authorization": self.credentials.password}
         url = f"{self.credentials.host}/{endpoint}"
 
-        async with self._websocket.session.get(url, headers=headers, params=params) as resp:
-            data = await resp.json(loads=_from_json)
+        started = time.perf_counter()
+        with tracing.span(f"lavacord.rest.{endpoint}", node=self._identifier, params=params) as span:
+            async with self._websocket.session.get(url, headers=headers, params=params) as resp:
+                data = await (resp.text() if text else resp.json(loads=_from_json))
+            span.set_attribute("status", resp.status)
+        self.metrics.observe_rest(endpoint, time.perf_counter() - started)
 
         return data, resp
 
+    async def _get_data(self,
+                        endpoint: str,
+                        params: dict
+                        ) -> Tuple[Dict[str, Any], aiohttp.ClientResponse]:
+        return await self._request(endpoint, params)
+
     async def _loadtracks(self, query):
         data, resp = await self._get_data("loadtracks", {"identifier": query})
         if resp.status != 200:
@@ -193,12 +335,13 @@ class Node:
                          requester: hikari.Snowflake,
                          *,
                          return_first: bool = True,
-                         payload: dict = None
+                         payload: dict = None,
+                         search: bool = True
                          ) -> List[PT]:
         if payload is None:
             payload = {}
 
-        query = f"{cls._search_type}:{query}" if cls._search_type else query
+        query = f"{cls._search_type}:{query}" if search and cls._search_type else query
 
         data, load_type = await self._loadtracks(query)
         if load_type is LoadType.track_loaded or return_first:
@@ -260,6 +403,31 @@ class Node:
 
 class NodePool:
     _nodes: ClassVar[Dict[str, Node]] = {}
+    events: ClassVar[EventBus] = EventBus()
+    """Listeners for the events of every node, optionally per guild."""
+    _updates: ClassVar[Publisher[Tuple[BasePlayer, PlayerState]]] = Publisher()
+
+    @classmethod
+    def updates(cls, min_interval: float = 0.0) -> PoolStateUpdates:
+        """Subscribe to the ``playerUpdate`` states of every player of the pool.
+
+        Each item maps the guilds updated since the previous one to their player and
+        latest state, see :meth:`BasePlayer.updates`.
+
+        .. code-block:: python
+
+            async for states in NodePool.updates(min_interval=5):
+                for guild_id, (player, state) in states.items():
+                    ...
+
+        Parameters
+        ----------
+        min_interval: float
+            The minimum number of seconds between two items. Defaults to 0.
+        """
+        updates = PoolStateUpdates(min_interval)
+        cls._updates.add(updates)
+        return updates
 
     @classmethod
     async def create_node(
@@ -276,6 +444,7 @@ class NodePool:
             spotify_client_secret: Optional[str] = None,
             identifier: str = None,
             resume_key: Optional[str] = None,
+            dispatch_events: bool = True,
     ) -> Node:
 
         if identifier in cls._nodes:
@@ -292,7 +461,8 @@ class NodePool:
             spotify_client_id=spotify_client_id,
             spotify_client_secret=spotify_client_secret,
             identifier=identifier,
-            resume_key=resume_key
+            resume_key=resume_key,
+            dispatch_events=dispatch_events
         )
 
         cls._nodes[node.identifier] = node
@@ -324,6 +494,35 @@ class NodePool:
 
         return sorted(nodes, key=lambda n: n.penalty)[0]
 
+    @classmethod
+    async def apply(cls,
+                    operation: PlayerOperation,
+                    selector: Optional[PlayerSelector] = None,
+                    *,
+                    nodes: Optional[Callable[[Node], bool]] = None,
+                    concurrency: int = 16,
+                    rate: Optional[float] = None,
+                    ) -> Dict[hikari.Snowflake, Any]:
+        """|coro|
+        Run an operation on players across the pool, see :meth:`Node.apply`.
+
+        Every node runs its share of the players at the same time,
+        ``concurrency`` and ``rate`` apply per node.
+
+        Parameters
+        ----------
+        nodes: Optional[Callable[[:class:`Node`], bool]]
+            Only nodes for which this returns True are affected. Defaults to every node.
+        """
+        targets = [node for node in cls._nodes.values() if nodes is None or nodes(node)]
+        results: Dict[hikari.Snowflake, Any] = {}
+        for node_results in await asyncio.gather(
+                *(node.apply(operation, selector, concurrency=concurrency, rate=rate) for node in targets)
+        ):
+            results.update(node_results)
+
+        return results
+
     @classmethod
     async def get_player(cls, guild_id: hikari.Snowflake) -> Optional[BP]:
         for node in NodePool._nodes.values():
@@ -26,10 +26,16 @@ SOFTWARE.
 
 from __future__ import annotations
 
+import asyncio
 from collections import deque
 from copy import copy
 from datetime import timedelta
+from itertools import islice
 from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
     Generic,
     Iterable,
     Iterator,
@@ -40,13 +46,17 @@ from typing import (
     Union
 )
 
+import hikari
+
 from . import abc, exceptions
 from .enums import RepeatMode
 from .types.queue import Queue as QueueBase
 
 __all__ = (
     "BaseQueue",
-    "Queue"
+    "Queue",
+    "FairDeque",
+    "FairQueue",
 )
 
 
@@ -65,7 +75,9 @@ class BaseQueue(Iterable[abc.Track], Generic[QT]):
         The maximum allowed tracks in the Queue. If None, no maximum is used. Defaults to None.
     """
 
-    __slots__ = ("max_size", "_queue", "_overflow")
+    __slots__ = (
+        "max_size", "_queue", "_overflow", "_requesters", "_waiters", "_version"
+    )
 
     def __init__(
         self,
@@ -77,6 +89,9 @@ class BaseQueue(Iterable[abc.Track], Generic[QT]):
         self.max_size: Optional[int] = max_size
         self._queue: QT = queue_cls()  # type: ignore
         self._overflow: bool = overflow
+        self._requesters: Dict[hikari.Snowflake, Deque[abc.Track]] = {}
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._version: int = 0
 
     def __str__(self) -> str:
         """String showing all Playable objects appearing as a list."""
@@ -119,7 +134,10 @@ class BaseQueue(Iterable[abc.Track], Generic[QT]):
 
     def __delitem__(self, index: int) -> None:
         """Delete item at given position."""
+        item = self._queue[index]
+        self._unindex_at(self._normalize_index(index), item)
         self._queue.__delitem__(index)
+        self._version += 1
 
     def __iter__(self) -> Iterator[abc.Track]:
         """Iterate over members in the queue.
@@ -161,19 +179,96 @@ class BaseQueue(Iterable[abc.Track], Generic[QT]):
         raise TypeError(f"Adding '{type(other)}' type to the queue is not supported.")
 
     def _get(self) -> abc.Track:
-        return self._queue.popleft()
+        item = self._queue.popleft()
+        self._unindex_left(item)
+        self._version += 1
+        return item
 
     def _drop(self) -> abc.Track:
-        return self._queue.pop()
+        item = self._queue.pop()
+        self._unindex_right(item)
+        self._version += 1
+        return item
 
     def _index(self, item: abc.Track) -> int:
         return self._queue.index(item)
 
     def _put(self, item: abc.Track) -> None:
         self._queue.append(item)
+        self._requesters.setdefault(item.requester, deque()).append(item)
+        self._version += 1
 
     def _insert(self, index: int, item: abc.Track) -> None:
+        index = self._normalize_index(index, insert=True)
+        rank = self._rank(index, item.requester)
+        self._requesters.setdefault(item.requester, deque()).insert(rank, item)
         self._queue.insert(index, item)
+        self._version += 1
+
+    def _replace(self, items: Iterable[abc.Track]) -> None:
+        """Swap the queue contents for ``items`` in one pass and rebuild the requester index."""
+        items = list(items)
+        self._queue.clear()
+        self._queue.extend(items)
+        self._rebuild_index()
+        self._version += 1
+        self._wakeup_next()
+
+    def _wakeup_next(self) -> None:
+        while self._waiters and not self.is_empty:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    def _rebuild_index(self) -> None:
+        self._requesters = {}
+        for item in self._queue:
+            self._requesters.setdefault(item.requester, deque()).append(item)
+
+    def _slice(self, start: int, stop: int) -> List[abc.Track]:
+        count = self.count
+        start, stop = max(0, start), min(stop, count)
+        if start >= stop:
+            return []
+
+        # Walk from whichever end is closer, so the last pages cost as little as the first ones.
+        if start > count - stop:
+            items = list(islice(reversed(self._queue), count - stop, count - start))
+            items.reverse()
+            return items
+
+        return list(islice(self._queue, start, stop))
+
+    def _normalize_index(self, index: int, *, insert: bool = False) -> int:
+        count = self.count
+        if index < 0:
+            index += count
+        return max(0, min(index, count if insert else count - 1))
+
+    def _rank(self, index: int, requester: hikari.Snowflake) -> int:
+        """Number of tracks by ``requester`` placed before ``index``."""
+        if requester not in self._requesters:
+            return 0
+        return sum(1 for track in islice(self._queue, index) if track.requester == requester)
+
+    def _unindex_left(self, item: abc.Track) -> None:
+        tracks = self._requesters[item.requester]
+        tracks.popleft()
+        if not tracks:
+            del self._requesters[item.requester]
+
+    def _unindex_right(self, item: abc.Track) -> None:
+        tracks = self._requesters[item.requester]
+        tracks.pop()
+        if not tracks:
+            del self._requesters[item.requester]
+
+    def _unindex_at(self, index: int, item: abc.Track) -> None:
+        tracks = self._requesters[item.requester]
+        del tracks[self._rank(index, item.requester)]
+        if not tracks:
+            del self._requesters[item.requester]
 
     @staticmethod
     def _check_playable(item: abc.Track) -> abc.Track:
@@ -190,6 +285,11 @@ class BaseQueue(Iterable[abc.Track], Generic[QT]):
 
         return iterable
 
+    @property
+    def version(self) -> int:
+        """Grows on every change of the queue, so caches can tell that it changed."""
+        return self._version
+
     @property
     def count(self) -> int:
         """Returns queue member count."""
@@ -215,6 +315,56 @@ class BaseQueue(Iterable[abc.Track], Generic[QT]):
 
         return self._get()
 
+    async def wait_not_empty(self, timeout: Optional[float] = None) -> None:
+        """|coro|
+        Wait until the queue has at least one member.
+
+        Waiters are woken by :meth:`put`, :meth:`put_at_index` and :meth:`extend`
+        without any polling.
+
+        Parameters
+        ----------
+        timeout: Optional[float]
+            Seconds to wait before giving up. Waits forever when None.
+
+        Raises
+        ------
+        :exc:`asyncio.TimeoutError`
+            If the queue is still empty after ``timeout`` seconds.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        while self.is_empty:
+            waiter = loop.create_future()
+            self._waiters.append(waiter)
+            try:
+                if deadline is None:
+                    await waiter
+                else:
+                    await asyncio.wait_for(waiter, max(0.0, deadline - loop.time()))
+            except BaseException:
+                waiter.cancel()
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+
+                # This waiter may have been woken right before being cancelled.
+                self._wakeup_next()
+                raise
+
+        self._wakeup_next()
+
+    async def wait_get(self, timeout: Optional[float] = None) -> abc.Track:
+        """|coro|
+        Return the next item, waiting for one to be added if the queue is empty.
+
+        Raises :exc:`asyncio.TimeoutError` if nothing arrives within ``timeout`` seconds.
+        """
+        await self.wait_not_empty(timeout)
+        return self.get()
+
     def pop(self) -> abc.Track:
         """Return item from the right end side of the queue.
 
@@ -223,7 +373,7 @@ class BaseQueue(Iterable[abc.Track], Generic[QT]):
         if self.is_empty:
             raise exceptions.QueueEmpty("No items in the queue.")
 
-        return self._queue.pop()
+        return self._drop()
 
     def find_position(self, item: abc.Track) -> int:
         """Find the position a given item within the queue.
@@ -232,6 +382,87 @@ class BaseQueue(Iterable[abc.Track], Generic[QT]):
         """
         return self._index(self._check_playable(item))
 
+    @property
+    def requesters(self) -> List[hikari.Snowflake]:
+        """Returns the requesters that currently have tracks in the queue."""
+        return list(self._requesters)
+
+    def page_count(self, size: int = 10) -> int:
+        """Returns the number of pages of ``size`` tracks in the queue."""
+        return max(1, -(-self.count // size))
+
+    def page(self, number: int, size: int = 10) -> List[str]:
+        """Returns the formatted tracks of the given zero-based page.
+
+        Only the tracks on the page are visited and formatted,
+        negative page numbers count from the last page.
+        """
+        if size < 1:
+            raise ValueError("Page size must be at least 1.")
+
+        if number < 0:
+            number += self.page_count(size)
+
+        start = number * size
+        return [str(track) for track in self._slice(start, start + size)]
+
+    def count_by_requester(self, requester: hikari.Snowflake) -> int:
+        """Returns how many tracks the given requester has in the queue."""
+        tracks = self._requesters.get(requester)
+        return len(tracks) if tracks else 0
+
+    def tracks_by_requester(self, requester: hikari.Snowflake) -> List[abc.Track]:
+        """Returns the tracks of the given requester in queue order.
+
+        Cost scales with the requester's own track count, not the queue size.
+        """
+        return list(self._requesters.get(requester, ()))
+
+    def remove_where(self, predicate: Callable[[abc.Track], bool]) -> List[abc.Track]:
+        """Remove every track matching ``predicate`` in a single pass.
+
+        Returns the removed tracks in queue order.
+        """
+        kept: List[abc.Track] = []
+        removed: List[abc.Track] = []
+        for track in self._queue:
+            if predicate(track):
+                removed.append(track)
+            else:
+                kept.append(track)
+
+        if removed:
+            self._replace(kept)
+
+        return removed
+
+    def remove_by_requester(self, requester: hikari.Snowflake) -> List[abc.Track]:
+        """Remove every track added by the given requester.
+
+        The removed tracks come from the requester index, so no other requester's entries
+        are touched or re-indexed. The queue is only walked up to the requester's last
+        track, the rest of it is left alone. Returns the removed tracks in queue order.
+        """
+        tracks = self._requesters.pop(requester, None)
+        if not tracks:
+            return []
+
+        removed = {id(track) for track in tracks}
+        remaining = len(tracks)
+        kept: List[abc.Track] = []
+        while remaining:
+            track = self._queue.popleft()
+            if id(track) in removed:
+                remaining -= 1
+            else:
+                kept.append(track)
+
+        for track in reversed(kept):
+            self._queue.insert(0, track)
+
+        self._version += 1
+        return list(tracks)
+
     def put(self, item: abc.Track) -> None:
         """Put the given item into the back of the queue."""
         if self.is_full:
@@ -240,7 +471,8 @@ class BaseQueue(Iterable[abc.Track], Generic[QT]):
 
             self._drop()
 
-        return self._put(self._check_playable(item))
+        self._put(self._check_playable(item))
+        self._wakeup_next()
 
     def put_at_index(self, index: int, item: abc.Track) -> None:
         """Put the given item into the queue at the specified index."""
@@ -250,7 +482,8 @@ class BaseQueue(Iterable[abc.Track], Generic[QT]):
 
             self._drop()
 
-        return self._insert(index, self._check_playable(item))
+        self._insert(index, self._check_playable(item))
+        self._wakeup_next()
 
     def put_at_front(self, item: abc.Track) -> None:
         """Put the given item into the front of the queue."""
@@ -285,12 +518,15 @@ class BaseQueue(Iterable[abc.Track], Generic[QT]):
         """Create a copy of the current queue including it's members."""
         new_queue = self.__class__(max_size=self.max_size)
         new_queue._queue = copy(self._queue)
+        new_queue._rebuild_index()
 
         return new_queue
 
     def clear(self) -> None:
         """Remove all items from the queue."""
         self._queue.clear()
+        self._requesters.clear()
+        self._version += 1
 
 
 class Queue(BaseQueue):
@@ -299,17 +535,15 @@ class Queue(BaseQueue):
     def __init__(
             self,
             max_size: Optional[int] = 100,
-            history_max_size: Optional[int] = 100
+            history_max_size: Optional[int] = 100,
+            *,
+            queue_cls: Type[QT] = deque,
     ):
-        super().__init__(max_size, overflow=False)
+        super().__init__(max_size, overflow=False, queue_cls=queue_cls)
         self._history = BaseQueue(history_max_size)
 
         self._repeat_mode = RepeatMode.OFF
 
-    def __str__(self) -> List[str]:
-        """String showing all Playable objects appearing as a list."""
-        return [f"{track}" for track in self._queue]
-
     @property
     def upcoming(self) -> BaseQueue[abc.Track]:
         return self._queue
@@ -332,9 +566,14 @@ class Queue(BaseQueue):
     def repeat_mode(self):
         return self._repeat_mode
 
+    @property
+    def version(self) -> int:
+        # Both counters only grow, so the sum moves when the tracks or the history do.
+        return self._version + self._history.version
+
     def clear(self):
         self._history.clear()
-        self.clear()
+        super().clear()
 
     def _get(self) -> abc.Track:
         item = super()._get()
@@ -347,12 +586,26 @@ class Queue(BaseQueue):
 
         elif self._repeat_mode == RepeatMode.ALL and self.is_empty:
             self._history.put_at_front(self.current_track)
-            self._queue = self._history._queue.copy()
+            self._replace(self._history)
             self._history.clear()
             return self._get()
 
         return self._get()
 
+    def peek_next_track(self) -> Optional[abc.Track]:
+        """Return the track :meth:`get_next_track` would return, without changing the queue."""
+        if self._repeat_mode == RepeatMode.ONE:
+            return self.current_track
+
+        if not self.is_empty:
+            return self._queue[0]
+
+        if self._repeat_mode == RepeatMode.ALL:
+            # get_next_track restarts from the current track once the queue runs out.
+            return self.current_track
+
+        return None
+
     def get_previous_track(self):
         if len(self._history) < 1:
             raise exceptions.QueueHistoryEmpty
@@ -376,6 +629,26 @@ class Queue(BaseQueue):
 
     def set_repeat_mode(self, mode: str):
         self._repeat_mode = RepeatMode(mode)
+        self._version += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-compatible representation of the queue, its history and repeat mode."""
+        return {
+            "max_size": self.max_size,
+            "history_max_size": self._history.max_size,
+            "repeat_mode": self._repeat_mode.value,
+            "tracks": [track.to_dict() for track in self._queue],
+            "history": [track.to_dict() for track in self._history],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], **kwargs: Any) -> Queue:
+        """Rebuild a queue produced by :meth:`to_dict`."""
+        queue = cls(data["max_size"], data["history_max_size"], **kwargs)
+        queue._replace(abc.Track.from_dict(track) for track in data["tracks"])
+        queue._history._replace(abc.Track.from_dict(track) for track in data["history"])
+        queue._repeat_mode = RepeatMode(data["repeat_mode"])
+        return queue
 
     def estimated_duration(self, position: timedelta):
         current_track = self.current_track
@@ -397,3 +670,317 @@ class Queue(BaseQueue):
             estimated_time += track.length
 
         return estimated_time
+
+
+class FairDeque:
+    """Deque-like container that interleaves the tracks of different requesters.
+
+    Implements the :class:`lavacord.types.queue.Queue` protocol, so it can be used as
+    the ``queue_cls`` of any :class:`BaseQueue`. Every requester owns a sub-queue and
+    requesters take turns in a ring, each taking up to ``weight`` tracks per turn.
+
+    ``popleft`` and ``append`` are O(1) no matter how many requesters are queued,
+    ``pop`` and access to either end are O(requesters), other positions walk the
+    interleaved order and are O(n).
+
+    Parameters
+    ----------
+    weights: Optional[Dict[hikari.Snowflake, int]]
+        Tracks taken per turn for specific requesters.
+    default_weight: int
+        Tracks taken per turn for everyone else. Defaults to 1 (plain round-robin).
+    """
+
+    __slots__ = ("weights", "default_weight", "_queues", "_ring", "_credit", "_len")
+
+    def __init__(
+            self,
+            iterable: Iterable[abc.Track] = (),
+            *,
+            weights: Optional[Dict[hikari.Snowflake, int]] = None,
+            default_weight: int = 1,
+    ):
+        self.weights: Dict[hikari.Snowflake, int] = dict(weights or {})
+        self.default_weight: int = default_weight
+        self._queues: Dict[hikari.Snowflake, Deque[abc.Track]] = {}
+        self._ring: Deque[hikari.Snowflake] = deque()
+        self._credit: int = 0
+        self._len: int = 0
+        self.extend(iterable)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} requesters={len(self._ring)} members={self._len}>"
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[abc.Track]:
+        """Iterate in the order tracks will be popped."""
+        iterators = {key: iter(queue) for key, queue in self._queues.items()}
+        remaining = {key: len(queue) for key, queue in self._queues.items()}
+        ring = deque(self._ring)
+        credit = self._credit
+
+        while ring:
+            key = ring[0]
+            yield next(iterators[key])
+            remaining[key] -= 1
+            credit -= 1
+
+            if not remaining[key]:
+                ring.popleft()
+                credit = self._weight(ring[0]) if ring else 0
+            elif credit <= 0:
+                ring.rotate(-1)
+                credit = self._weight(ring[0])
+
+    def __reversed__(self) -> Iterator[abc.Track]:
+        return reversed(list(self))
+
+    def __contains__(self, item: abc.Track) -> bool:
+        queue = self._queues.get(getattr(item, "requester", None))
+        return queue is not None and item in queue
+
+    def __getitem__(self, index: int) -> abc.Track:
+        index = self._check_index(index)
+        if index == 0:
+            return self._queues[self._ring[0]][0]
+        if index == self._len - 1:
+            return self._queues[self._tail_key()][-1]
+
+        return next(islice(self, index, None))
+
+    def __setitem__(self, index: int, value: abc.Track) -> None:
+        del self[index]
+        self.insert(index, value)
+
+    def __delitem__(self, index: int) -> None:
+        index = self._check_index(index)
+        item = self[index]
+        queue = self._queues[item.requester]
+        del queue[self._rank(index, item.requester)]
+        self._len -= 1
+
+        if not queue:
+            self._discard(item.requester)
+
+    def __iadd__(self, other: Iterable[abc.Track]) -> FairDeque:
+        self.extend(other)
+        return self
+
+    def __copy__(self) -> FairDeque:
+        new = self.__class__(weights=self.weights, default_weight=self.default_weight)
+        new._queues = {key: queue.copy() for key, queue in self._queues.items()}
+        new._ring = self._ring.copy()
+        new._credit = self._credit
+        new._len = self._len
+        return new
+
+    def _weight(self, key: hikari.Snowflake) -> int:
+        return max(1, self.weights.get(key, self.default_weight))
+
+    def _check_index(self, index: int) -> int:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("deque index out of range")
+        return index
+
+    def _rank(self, index: int, key: hikari.Snowflake) -> int:
+        return sum(1 for track in islice(self, index) if track.requester == key)
+
+    def _tail_key(self) -> hikari.Snowflake:
+        """Requester of the track that is popped last, found from the turn counts alone.
+
+        A requester with ``n`` tracks needs ``ceil(n / weight)`` turns (the head of the
+        ring first spends its remaining credit), so the last track belongs to whoever
+        needs the most turns, ties going to the one furthest along the ring.
+        """
+        head = self._ring[0]
+        credit = max(1, self._credit)
+        tail, tail_turn = head, 0
+        for key in self._ring:
+            count = len(self._queues[key])
+            if key == head:
+                turns = 1 + max(0, -(-(count - credit) // self._weight(key)))
+            else:
+                turns = -(-count // self._weight(key))
+
+            if turns >= tail_turn:
+                tail, tail_turn = key, turns
+
+        return tail
+
+    def _discard(self, key: hikari.Snowflake) -> None:
+        del self._queues[key]
+        if self._ring[0] == key:
+            self._ring.popleft()
+            self._credit = self._weight(self._ring[0]) if self._ring else 0
+        else:
+            self._ring.remove(key)
+
+    def append(self, value: abc.Track) -> None:
+        key = value.requester
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = deque()
+            self._ring.append(key)
+            if len(self._ring) == 1:
+                self._credit = self._weight(key)
+
+        queue.append(value)
+        self._len += 1
+
+    def extend(self, values: Iterable[abc.Track]) -> None:
+        for value in values:
+            self.append(value)
+
+    def insert(self, index: int, value: abc.Track) -> None:
+        """Insert a track.
+
+        Index 0 makes the track's requester take the next turn, any other index
+        keeps the rotation and places the track among the requester's own tracks.
+        """
+        key = value.requester
+        if index < 0:
+            index += self._len
+        index = max(0, min(index, self._len))
+
+        if index == 0:
+            queue = self._queues.get(key)
+            if queue is None:
+                queue = self._queues[key] = deque()
+            else:
+                self._ring.remove(key)
+
+            self._ring.appendleft(key)
+            self._credit = self._weight(key)
+            queue.appendleft(value)
+        else:
+            rank = self._rank(index, key)
+            if key not in self._queues:
+                self._queues[key] = deque()
+                self._ring.append(key)
+
+            self._queues[key].insert(rank, value)
+
+        self._len += 1
+
+    def index(self, value: abc.Track) -> int:
+        for index, track in enumerate(self):
+            if track == value:
+                return index
+
+        raise ValueError(f"{value!r} is not in deque")
+
+    def remove(self, value: abc.Track) -> None:
+        del self[self.index(value)]
+
+    def popleft(self) -> abc.Track:
+        if not self._ring:
+            raise IndexError("pop from an empty deque")
+
+        key = self._ring[0]
+        queue = self._queues[key]
+        item = queue.popleft()
+        self._len -= 1
+        self._credit -= 1
+
+        if not queue:
+            self._discard(key)
+        elif self._credit <= 0:
+            self._ring.rotate(-1)
+            self._credit = self._weight(self._ring[0])
+
+        return item
+
+    def pop(self) -> abc.Track:
+        if not self._ring:
+            raise IndexError("pop from an empty deque")
+
+        key = self._tail_key()
+        queue = self._queues[key]
+        item = queue.pop()
+        self._len -= 1
+
+        if not queue:
+            self._discard(key)
+
+        return item
+
+    def pop_requester(self, key: hikari.Snowflake) -> List[abc.Track]:
+        """Remove and return every track of the given requester in O(1) rotation work."""
+        queue = self._queues.get(key)
+        if queue is None:
+            return []
+
+        self._discard(key)
+        self._len -= len(queue)
+        return list(queue)
+
+    def reverse(self) -> None:
+        for queue in self._queues.values():
+            queue.reverse()
+
+        self._ring.reverse()
+        if self._ring:
+            self._credit = self._weight(self._ring[0])
+
+    def clear(self) -> None:
+        self._queues.clear()
+        self._ring.clear()
+        self._credit = 0
+        self._len = 0
+
+
+class FairQueue(Queue):
+    """Queue that shares playback between requesters instead of playing strictly FIFO.
+
+    Tracks are kept in a :class:`FairDeque`, so one requester adding a large playlist
+    does not starve everyone else. History, repeat modes and duration estimation work
+    the same way as in :class:`Queue`.
+
+    Parameters
+    ----------
+    weights: Optional[Dict[hikari.Snowflake, int]]
+        Tracks taken per turn for specific requesters.
+    default_weight: int
+        Tracks taken per turn for everyone else. Defaults to 1.
+    """
+
+    __slots__ = ()
+
+    def __init__(
+            self,
+            max_size: Optional[int] = 100,
+            history_max_size: Optional[int] = 100,
+            *,
+            weights: Optional[Dict[hikari.Snowflake, int]] = None,
+            default_weight: int = 1,
+    ):
+        super().__init__(max_size, history_max_size, queue_cls=FairDeque)
+        self._queue.weights.update(weights or {})
+        self._queue.default_weight = default_weight
+
+    def set_weight(self, requester: hikari.Snowflake, weight: int) -> None:
+        """Set how many tracks the given requester gets per turn."""
+        self._queue.weights[requester] = weight
+        self._version += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = super().to_dict()
+        data["weights"] = {str(key): weight for key, weight in self._queue.weights.items()}
+        data["default_weight"] = self._queue.default_weight
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], **kwargs: Any) -> FairQueue:
+        kwargs.setdefault("weights", {hikari.Snowflake(key): weight for key, weight in data.get("weights", {}).items()})
+        kwargs.setdefault("default_weight", data.get("default_weight", 1))
+        return super().from_dict(data, **kwargs)
+
+    def remove_by_requester(self, requester: hikari.Snowflake) -> List[abc.Track]:
+        removed = self._queue.pop_requester(requester)
+        self._requesters.pop(requester, None)
+        self._version += 1
+        return removed
@@ -0,0 +1,294 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022 CrazzzyyFoxx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import typing as t
+
+from .filter import Equalizer, FilterSet
+from .ratelimit import RateLimiter
+
+if t.TYPE_CHECKING:
+    from .player import BasePlayer
+    from .pool import Node
+
+__all__ = (
+    "Easing",
+    "linear",
+    "ease_in_out",
+    "RampScheduler",
+    "default_ramps",
+)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+Easing = t.Callable[[float], float]
+"""Maps the elapsed fraction of a ramp (0 to 1) to the fraction of the change applied."""
+
+
+def linear(progress: float) -> float:
+    return progress
+
+
+def ease_in_out(progress: float) -> float:
+    return progress * progress * (3 - 2 * progress)
+
+
+# Settings under which a filter has no audible effect, so filters can be faded in and out.
+_NEUTRAL: t.Dict[str, t.Any] = {
+    "volume": 1.0,
+    "timescale": {"speed": 1.0, "pitch": 1.0, "rate": 1.0},
+    "rotation": {"rotationHz": 0.0},
+    "tremolo": {"depth": 0.0},
+    "vibrato": {"depth": 0.0},
+    "karaoke": {"level": 0.0, "monoLevel": 0.0},
+    "channelMix": {"leftToLeft": 1.0, "leftToRight": 0.0, "rightToLeft": 0.0, "rightToRight": 1.0},
+    "equalizer": [],
+}
+
+
+def _lerp(start: t.Any, end: t.Any, progress: float) -> t.Any:
+    """Interpolate the numbers found in both values, anything else takes the end value."""
+    if isinstance(end, bool) or isinstance(start, bool):
+        return end
+    if isinstance(start, (int, float)) and isinstance(end, (int, float)):
+        return start + (end - start) * progress
+    if isinstance(start, dict) and isinstance(end, dict):
+        return {key: _lerp(start.get(key, value), value, progress) for key, value in end.items()}
+    return end
+
+
+def _lerp_equalizer(start: t.List[dict], end: t.List[dict], progress: float) -> t.List[dict]:
+    return Equalizer.from_payload(start).blend(Equalizer.from_payload(end), progress).to_payload()
+
+
+def _neutral(name: str, like: t.Any) -> t.Any:
+    neutral = _NEUTRAL.get(name)
+    if isinstance(neutral, dict) and isinstance(like, dict):
+        return {**like, **neutral}
+    return neutral
+
+
+def _lerp_filters(start: t.Dict[str, t.Any], end: t.Dict[str, t.Any], progress: float) -> t.Dict[str, t.Any]:
+    """Interpolate two filter payloads.
+
+    Filters missing on one side are faded from or to their neutral settings when those
+    are known, other filters switch when the ramp starts (added) or ends (removed).
+    """
+    payload = {}
+    for name in start.keys() | end.keys():
+        if name in start and name in end:
+            origin, target = start[name], end[name]
+        else:
+            present = start[name] if name in start else end[name]
+            neutral = _neutral(name, present)
+            if neutral is None:
+                # Nothing to fade from or to, the filter switches with the first or last frame.
+                payload[name] = end[name] if name in end else start[name]
+                continue
+            origin, target = (present, neutral) if name in start else (neutral, present)
+
+        if name == "equalizer":
+            payload[name] = _lerp_equalizer(origin, target, progress)
+        else:
+            payload[name] = _lerp(origin, target, progress)
+
+    return payload
+
+
+class _Ramp:
+    __slots__ = ("player", "kind", "start", "end", "started_at", "duration", "easing", "future", "sent")
+
+    def __init__(self, player: BasePlayer, kind: str, start: t.Any, end: t.Any, started_at: float,
+                 duration: float, easing: Easing, future: asyncio.Future):
+        self.player: BasePlayer = player
+        self.kind: str = kind
+        self.start: t.Any = start
+        self.end: t.Any = end
+        self.started_at: float = started_at
+        self.duration: float = duration
+        self.easing: Easing = easing
+        self.future: asyncio.Future = future
+        self.sent: t.Any = None
+
+    def value(self, progress: float) -> t.Any:
+        eased = self.easing(progress) if progress < 1 else 1.0
+        if self.kind == "volume":
+            return round(self.start + (self.end - self.start) * eased)
+        if progress >= 1:
+            return self.end
+        return FilterSet(_lerp_filters(self.start.to_dict(), self.end.to_dict(), eased))
+
+
+class RampScheduler:
+    """Interpolates the volume and filters of many players over time.
+
+    Every ramp shares one ticker task that runs only while ramps are active. Each tick
+    the current value of every ramp is computed and sent if it changed, within a frame
+    budget per player and per node. Ramps over the budget skip intermediate frames,
+    the final value is always sent.
+
+    Parameters
+    ----------
+    player_fps: float
+        The maximum frames per second sent for one player. Defaults to 10.
+    node_fps: float
+        The maximum frames per second sent to one node by all its ramps. Defaults to 200.
+    """
+
+    def __init__(self, *, player_fps: float = 10.0, node_fps: float = 200.0):
+        self.player_fps: float = player_fps
+        self.node_fps: float = node_fps
+        self._ramps: t.Dict[t.Tuple[int, str], _Ramp] = {}
+        self._player_limits: t.Dict[int, RateLimiter] = {}
+        self._node_limits: t.Dict[str, RateLimiter] = {}
+        self._task: t.Optional[asyncio.Task] = None
+
+    def __repr__(self) -> str:
+        return f"<RampScheduler ramps={len(self._ramps)}>"
+
+    def __len__(self) -> int:
+        return len(self._ramps)
+
+    def _start(self, player: BasePlayer, kind: str, start: t.Any, end: t.Any,
+               duration: float, easing: Easing) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        key = (id(player), kind)
+        previous = self._ramps.pop(key, None)
+        if previous is not None and not previous.future.done():
+            previous.future.set_result(False)
+
+        future = loop.create_future()
+        self._ramps[key] = _Ramp(player, kind, start, end, loop.time(), max(duration, 0.0), easing, future)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return future
+
+    def fade_volume(self, player: BasePlayer, volume: int, duration: float, *,
+                    easing: Easing = linear) -> asyncio.Future:
+        """Ramp the volume of the player to ``volume`` over ``duration`` seconds.
+
+        Returns a future resolving to True once the target is reached, or False if another
+        volume ramp of the player replaced this one.
+        """
+        volume = max(min(volume, 1000), 0)
+        return self._start(player, "volume", player.volume, volume, duration, easing)
+
+    def ramp_filters(self, player: BasePlayer, filters: FilterSet, duration: float, *,
+                     easing: Easing = linear) -> asyncio.Future:
+        """Ramp the numeric settings of the player's filters to ``filters`` over ``duration`` seconds.
+
+        Returns a future like :meth:`fade_volume`.
+        """
+        return self._start(player, "filters", player.filters or FilterSet(), filters, duration, easing)
+
+    def cancel(self, player: BasePlayer, kind: t.Optional[str] = None) -> None:
+        """Stop the ramps of the player where they are, optionally only ``"volume"`` or ``"filters"``."""
+        for key in [key for key in self._ramps if key[0] == id(player) and kind in (None, key[1])]:
+            ramp = self._ramps.pop(key)
+            if not ramp.future.done():
+                ramp.future.set_result(False)
+
+    @property
+    def interval(self) -> float:
+        """Seconds between two ticks, enough for every player to use its whole frame budget."""
+        return 1 / max(self.player_fps, 1.0)
+
+    def _limit(self, limits: t.Dict[t.Any, RateLimiter], key: t.Any, rate: float) -> RateLimiter:
+        limiter = limits.get(key)
+        if limiter is None:
+            # A tick may spend what was refilled since the previous one, no more.
+            limiter = limits[key] = RateLimiter(rate, burst=max(1, math.ceil(rate * self.interval)))
+        return limiter
+
+    async def _send(self, ramp: _Ramp, value: t.Any) -> None:
+        player = ramp.player
+        if ramp.kind == "volume":
+            player.volume = value
+            await player.node._websocket.send({"op": "volume", "guildId": str(player.guild_id), "volume": value})
+        else:
+            player.filters = value
+            await player.node._websocket.send_raw(value._frame(str(player.guild_id)), op="filters")
+
+    async def _tick(self, now: float) -> None:
+        sends = []
+        finished = []
+        for key, ramp in list(self._ramps.items()):
+            player = ramp.player
+            node: Node = player.node
+            if node.get_player(player.guild_id) is not player:
+                finished.append((key, ramp, False))
+                continue
+
+            progress = (now - ramp.started_at) / ramp.duration if ramp.duration else 1.0
+            value = ramp.value(min(progress, 1.0))
+            if value == ramp.sent:
+                if progress >= 1:
+                    finished.append((key, ramp, True))
+                continue
+
+            if not self._limit(self._player_limits, id(player), self.player_fps).try_acquire():
+                continue
+            if not self._limit(self._node_limits, node.identifier, self.node_fps).try_acquire():
+                continue
+
+            ramp.sent = value
+            sends.append((ramp, self._send(ramp, value)))
+            # Move ramps that were served to the back, so a saturated node budget rotates between players.
+            self._ramps[key] = self._ramps.pop(key)
+            if progress >= 1:
+                finished.append((key, ramp, True))
+
+        if sends:
+            results = await asyncio.gather(*(send for _, send in sends), return_exceptions=True)
+            for (ramp, _), result in zip(sends, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Ramp frame failed:: {ramp.player.guild_id} :: {result}")
+
+        for key, ramp, reached in finished:
+            # The ramp may have been replaced while its last frame was being sent.
+            if self._ramps.get(key) is ramp:
+                del self._ramps[key]
+            if not ramp.future.done():
+                ramp.future.set_result(reached)
+
+        active = {id(ramp.player) for ramp in self._ramps.values()}
+        for player_id in [player_id for player_id in self._player_limits if player_id not in active]:
+            del self._player_limits[player_id]
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._ramps:
+            try:
+                await self._tick(loop.time())
+            except Exception as error:
+                logger.error(f"Ramp tick failed:: {error}")
+            await asyncio.sleep(self.interval)
+
+
+default_ramps = RampScheduler()
+"""The scheduler used by :meth:`BasePlayer.fade_volume` and :meth:`BasePlayer.ramp_filters`."""
@@ -0,0 +1,74 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022 CrazzzyyFoxx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+
+import asyncio
+import time
+from typing import Optional
+
+__all__ = ("RateLimiter",)
+
+
+class RateLimiter:
+    """A token bucket limiting how many operations may start per second.
+
+    Parameters
+    ----------
+    rate: float
+        Tokens added per second.
+    burst: Optional[int]
+        The maximum amount of tokens that can be stored. Defaults to ``rate`` (at least 1).
+    """
+
+    def __init__(self, rate: float, *, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("Rate must be positive.")
+
+        self._rate: float = rate
+        self._burst: float = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens: float = self._burst
+        self._updated: float = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available, without waiting."""
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+
+        return False
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        while not self.try_acquire():
+            await asyncio.sleep((1 - self._tokens) / self._rate)
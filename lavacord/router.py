@@ -0,0 +1,298 @@
+"""
+MIT License
+
+Copyright (c) 2022 CrazzzyyFoxx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import itertools
+import re
+import typing as t
+
+import hikari
+import yarl
+
+from .tracks import *
+
+if t.TYPE_CHECKING:
+    from .pool import Node
+
+__all__ = (
+    "Resolver",
+    "Route",
+    "SourceRouter",
+    "default_router",
+)
+
+Resolver = t.Callable[[str, t.Optional[yarl.URL], hikari.Snowflake, "Node"], t.Awaitable[t.Any]]
+"""``async def resolver(query, url, requester, node)``, ``url`` is None for plain text searches."""
+
+
+def _normalize_host(host: str) -> str:
+    host = host.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class Route:
+    """A resolver bound to a path pattern and an optional required query parameter."""
+
+    __slots__ = ("resolver", "path", "query")
+
+    def __init__(self, resolver: Resolver, *, path: t.Optional[str] = None, query: t.Optional[str] = None):
+        self.resolver: Resolver = resolver
+        self.path: t.Optional[str] = path
+        self.query: t.Optional[str] = query
+
+    def __repr__(self) -> str:
+        return f"<Route resolver={getattr(self.resolver, '__name__', self.resolver)} " \
+               f"path={self.path} query={self.query}>"
+
+
+_Matcher = t.Callable[[str], t.Optional[t.Match[str]]]
+_Table = t.List[t.Tuple[t.Optional[str], _Matcher, t.Dict[int, Resolver]]]
+
+
+def _compile(routes: t.List[Route]) -> _Table:
+    """Compile the routes of a host into a dispatch table.
+
+    Consecutive routes that need the same query parameter share one alternation regex,
+    the outermost group that matched tells which resolver to use. Picking between
+    the routes of a run therefore costs a single regex match.
+    """
+    table: _Table = []
+    for query, run in itertools.groupby(routes, key=lambda route: route.query):
+        fragments = []
+        resolvers = {}
+        group = 1
+        for route in run:
+            pattern = route.path or ""
+            fragments.append(f"({pattern})")
+            resolvers[group] = route.resolver
+            group += 1 + re.compile(pattern).groups
+
+        table.append((query, re.compile("|".join(fragments)).match, resolvers))
+
+    return table
+
+
+class SourceRouter:
+    """Dispatch table that picks the resolver for a search query.
+
+    Routes are keyed by host, so finding the candidates for a URL is a single dict lookup
+    followed by one precompiled regex match per group of routes. A leading ``www.`` is
+    ignored on both sides. Queries that are not URLs go straight to the ``fallback`` resolver.
+
+    Parameters
+    ----------
+    fallback: Optional[:class:`Resolver`]
+        The resolver used for plain text queries.
+    """
+
+    def __init__(self, fallback: t.Optional[Resolver] = None):
+        self.fallback: t.Optional[Resolver] = fallback
+        self._routes: t.Dict[str, t.List[Route]] = {}
+        self._tables: t.Dict[str, _Table] = {}
+
+    def __repr__(self) -> str:
+        return f"<SourceRouter hosts={len(self._routes)}>"
+
+    @property
+    def hosts(self) -> t.List[str]:
+        """The hosts that have at least one route."""
+        return list(self._routes)
+
+    def _rebuild(self, host: str) -> None:
+        routes = self._routes.get(host)
+        if routes:
+            # Both spellings share the same table, so lookups never have to normalize the host.
+            self._tables[host] = self._tables[f"www.{host}"] = _compile(routes)
+        else:
+            self._routes.pop(host, None)
+            self._tables.pop(host, None)
+            self._tables.pop(f"www.{host}", None)
+
+    def register(
+            self,
+            hosts: t.Union[str, t.Iterable[str]],
+            resolver: Resolver,
+            *,
+            path: t.Optional[str] = None,
+            query: t.Optional[str] = None,
+            first: bool = False,
+    ) -> Route:
+        """Register a resolver for the given hosts.
+
+        Routes of a host are tried in registration order, register specific routes
+        (with ``path``/``query``) before generic ones or pass ``first=True``.
+
+        Parameters
+        ----------
+        hosts: Union[str, Iterable[str]]
+            The host or hosts served by the resolver.
+        resolver: :class:`Resolver`
+            The coroutine function that loads the query.
+        path: Optional[str]
+            A regular expression the raw (percent-encoded) URL path has to match from its start.
+        query: Optional[str]
+            A query parameter the URL has to contain.
+        first: bool
+            Whether the route takes precedence over the already registered ones.
+        """
+        if path is not None:
+            re.compile(path)
+
+        route = Route(resolver, path=path, query=query)
+        for host in [hosts] if isinstance(hosts, str) else hosts:
+            host = _normalize_host(host)
+            routes = self._routes.setdefault(host, [])
+            if first:
+                routes.insert(0, route)
+            else:
+                routes.append(route)
+            self._rebuild(host)
+
+        return route
+
+    def route(
+            self,
+            hosts: t.Union[str, t.Iterable[str]],
+            *,
+            path: t.Optional[str] = None,
+            query: t.Optional[str] = None,
+            first: bool = False,
+    ) -> t.Callable[[Resolver], Resolver]:
+        """Decorator form of :meth:`register`."""
+        def decorator(resolver: Resolver) -> Resolver:
+            self.register(hosts, resolver, path=path, query=query, first=first)
+            return resolver
+
+        return decorator
+
+    def unregister(self, host: str, resolver: t.Optional[Resolver] = None) -> None:
+        """Remove the routes of a host, or only those using ``resolver``."""
+        host = _normalize_host(host)
+        if host not in self._routes:
+            return
+
+        if resolver is None:
+            self._routes[host] = []
+        else:
+            self._routes[host] = [route for route in self._routes[host] if route.resolver is not resolver]
+        self._rebuild(host)
+
+    def match(self, query: str) -> t.Tuple[t.Optional[Resolver], t.Optional[yarl.URL]]:
+        """Return the resolver for the query and the parsed URL, if the query is one.
+
+        The resolver is None when the query is a URL of a host nobody handles.
+        """
+        if "://" not in query:
+            return self.fallback, None
+
+        url = yarl.URL(query)
+        host = url.raw_host
+        if not host:
+            return self.fallback, None
+
+        table = self._tables.get(host)
+        if table is None:
+            table = self._tables.get(host.lower())
+            if table is None:
+                return None, url
+
+        path = url.raw_path
+        for key, matcher, resolvers in table:
+            if key is not None and key not in url.query:
+                continue
+
+            match = matcher(path)
+            if match is not None:
+                return resolvers[match.lastindex], url
+
+        return None, url
+
+    async def resolve(self, query: str, requester: hikari.Snowflake, node: Node) -> t.Any:
+        """|coro|
+        Load the query with the matching resolver, None if no resolver handles it.
+        """
+        resolver, url = self.match(query)
+        if resolver is None:
+            return None
+
+        return await resolver(query if url is None else str(url), url, requester, node)
+
+
+async def _search_youtube(query: str, url: t.Optional[yarl.URL], requester: hikari.Snowflake, node: Node):
+    return await YouTubeTrack.search(query, requester, node, return_first=True)
+
+
+default_router = SourceRouter(fallback=_search_youtube)
+
+
+@default_router.route(("youtube.com", "m.youtube.com", "youtu.be"), query="list")
+async def _youtube_playlist(query: str, url: yarl.URL, requester: hikari.Snowflake, node: Node):
+    return await YouTubePlaylist.search(query, requester, node)
+
+
+default_router.register(("youtube.com", "m.youtube.com", "youtu.be"), _search_youtube)
+
+
+@default_router.route("music.youtube.com", query="list")
+async def _youtube_music_playlist(query: str, url: yarl.URL, requester: hikari.Snowflake, node: Node):
+    return await YouTubeMusicPlaylist.search(query, requester, node)
+
+
+@default_router.route("music.youtube.com")
+async def _youtube_music_track(query: str, url: yarl.URL, requester: hikari.Snowflake, node: Node):
+    return await YouTubeMusicTrack.search(query, requester, node, return_first=True)
+
+
+_SPOTIFY_PATH = r"^/(?:intl-[\w-]+/)?{}/[^/]+$"
+
+
+@default_router.route("open.spotify.com", path=_SPOTIFY_PATH.format("track"))
+async def _spotify_track(query: str, url: yarl.URL, requester: hikari.Snowflake, node: Node):
+    return await SpotifyTrack.search(url.parts[-1], requester, node)
+
+
+@default_router.route("open.spotify.com", path=_SPOTIFY_PATH.format("playlist"))
+async def _spotify_playlist(query: str, url: yarl.URL, requester: hikari.Snowflake, node: Node):
+    return await SpotifyPlaylist.search(url.parts[-1], requester, node)
+
+
+@default_router.route("open.spotify.com", path=_SPOTIFY_PATH.format("album"))
+async def _spotify_album(query: str, url: yarl.URL, requester: hikari.Snowflake, node: Node):
+    return await SpotifyAlbum.search(url.parts[-1], requester, node)
+
+
+@default_router.route(("twitch.tv", "m.twitch.tv"))
+async def _twitch(query: str, url: yarl.URL, requester: hikari.Snowflake, node: Node):
+    return await TwitchTrack.search(query, requester, node)
+
+
+@default_router.route(("soundcloud.com", "m.soundcloud.com"), path=r"^/[^/]+/sets/")
+async def _soundcloud_playlist(query: str, url: yarl.URL, requester: hikari.Snowflake, node: Node):
+    return await SoundCloudPlaylist.search(query, requester, node)
+
+
+@default_router.route(("soundcloud.com", "m.soundcloud.com"))
+async def _soundcloud_track(query: str, url: yarl.URL, requester: hikari.Snowflake, node: Node):
+    return await node.get_tracks(SoundCloudTrack, query, requester, return_first=True, search=False)
@@ -0,0 +1,184 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022 CrazzzyyFoxx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Typed definitions of the frames Lavalink sends, decoded with msgspec if installed.
+#
+# Decoding goes straight from the raw frame to the struct of its op without building
+# an intermediate dict: playerUpdate and stats frames are part of a union tagged by
+# "op" that msgspec resolves while parsing. msgspec can only tag a union by one field
+# and every event shares the "event" op, so for events that pass only reads their
+# "type" and a second one decodes them with the union of the event structs, tagged
+# by "type". An event missing one of its fields is rejected there instead of failing
+# later.
+# Without msgspec HAS_MSGSPEC is False, decode() is not defined and the websocket
+# uses the generic JSON path.
+
+from __future__ import annotations
+
+import typing as t
+
+try:
+    import msgspec
+except ModuleNotFoundError:
+    HAS_MSGSPEC = False
+else:
+    HAS_MSGSPEC = True
+
+__all__ = ("HAS_MSGSPEC",)
+
+EVENT_TYPES: t.FrozenSet[str] = frozenset({
+    "TrackStartEvent",
+    "TrackEndEvent",
+    "TrackExceptionEvent",
+    "TrackStuckEvent",
+    "WebSocketClosedEvent",
+})
+"""The event types lavacord handles, other events are ignored."""
+
+if HAS_MSGSPEC:
+    __all__ += (
+        "PlayerStateFrame",
+        "PlayerUpdateFrame",
+        "MemoryFrame",
+        "CpuFrame",
+        "FrameStatsFrame",
+        "StatsFrame",
+        "TrackStartFrame",
+        "TrackEndFrame",
+        "TrackExceptionInfo",
+        "TrackExceptionFrame",
+        "TrackStuckFrame",
+        "WebSocketClosedFrame",
+        "EventFrame",
+        "Frame",
+        "decode",
+    )
+
+    class PlayerStateFrame(msgspec.Struct):
+        time: int = 0
+        position: int = 0
+        connected: bool = False
+        ping: int = -1
+
+    class PlayerUpdateFrame(msgspec.Struct, tag_field="op", tag="playerUpdate"):
+        guildId: str
+        state: PlayerStateFrame
+
+    class MemoryFrame(msgspec.Struct):
+        free: int
+        used: int
+        allocated: int
+        reservable: int
+
+    class CpuFrame(msgspec.Struct):
+        cores: int
+        systemLoad: float
+        lavalinkLoad: float
+
+    class FrameStatsFrame(msgspec.Struct):
+        sent: int = -1
+        nulled: int = -1
+        deficit: int = -1
+
+    class StatsFrame(msgspec.Struct, tag_field="op", tag="stats"):
+        players: int
+        playingPlayers: int
+        uptime: int
+        memory: MemoryFrame
+        cpu: CpuFrame
+        frameStats: t.Optional[FrameStatsFrame] = None
+
+    class TrackStartFrame(msgspec.Struct, tag_field="type", tag="TrackStartEvent"):
+        guildId: str
+        track: str
+
+    class TrackEndFrame(msgspec.Struct, tag_field="type", tag="TrackEndEvent"):
+        guildId: str
+        track: str
+        reason: str
+
+    class TrackExceptionInfo(msgspec.Struct):
+        severity: str
+        message: t.Optional[str] = None
+        cause: t.Optional[str] = None
+
+    class TrackExceptionFrame(
+        msgspec.Struct, tag_field="type", tag="TrackExceptionEvent"
+    ):
+        guildId: str
+        track: str
+        exception: TrackExceptionInfo
+
+    class TrackStuckFrame(msgspec.Struct, tag_field="type", tag="TrackStuckEvent"):
+        guildId: str
+        track: str
+        thresholdMs: int
+
+    class WebSocketClosedFrame(
+        msgspec.Struct, tag_field="type", tag="WebSocketClosedEvent"
+    ):
+        guildId: str
+        code: int
+        reason: str
+        byRemote: bool
+
+    EventFrame = t.Union[
+        TrackStartFrame,
+        TrackEndFrame,
+        TrackExceptionFrame,
+        TrackStuckFrame,
+        WebSocketClosedFrame,
+    ]
+
+    Frame = t.Union[PlayerUpdateFrame, StatsFrame, EventFrame]
+
+    class _EventHeader(msgspec.Struct, tag_field="op", tag="event"):
+        type: str
+
+    class _Header(msgspec.Struct):
+        op: t.Optional[str] = None
+
+    _op_decoder = msgspec.json.Decoder(
+        t.Union[PlayerUpdateFrame, StatsFrame, _EventHeader]
+    )
+    _event_decoder = msgspec.json.Decoder(EventFrame)
+    _header_decoder = msgspec.json.Decoder(_Header)
+
+    def decode(data: t.Union[str, bytes]) -> t.Optional[Frame]:
+        """Decode a frame into its struct, None for ops and events lavacord ignores.
+
+        Raises :exc:`msgspec.ValidationError` when a known frame does not match its
+        schema.
+        """
+        try:
+            frame = _op_decoder.decode(data)
+        except msgspec.ValidationError:
+            # Unknown ops fail the tag check too, only known ops with a bad body raise.
+            if _header_decoder.decode(data).op in ("playerUpdate", "stats", "event"):
+                raise
+            return None
+
+        if isinstance(frame, _EventHeader):
+            return _event_decoder.decode(data) if frame.type in EVENT_TYPES else None
+        return frame
@@ -0,0 +1,158 @@
+"""
+MIT License
+
+Copyright (c) 2022 CrazzzyyFoxx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+import typing as t
+
+import hikari
+
+from .exceptions import LavacordError
+from .player import BasePlayer, Player
+from .pool import NodePool
+from .utils import _from_json, _to_json
+
+__all__ = ("Snapshot",)
+
+BP = t.TypeVar("BP", bound=BasePlayer)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class Snapshot:
+    """State of every player in the :class:`NodePool`, used to survive bot restarts.
+
+    A rolling deploy looks like this::
+
+        # old process, right before shutting down
+        Snapshot.capture().save("players.json")
+
+        # new process
+        snapshot = Snapshot.load("players.json")
+        await NodePool.create_node(bot, ..., identifier="main",
+                                   resume_key=snapshot.resume_key("main"))
+        await snapshot.restore(cls=lavacord.Player)
+
+    Nodes whose Lavalink session was resumed with the resume key of the snapshot (within
+    Lavalink's resume timeout, see :attr:`Node.resumed`) keep playing without interruption and
+    the players are only reattached locally. Other nodes get the voice session, volume, filters and track sent again,
+    starting from the saved position.
+    """
+
+    VERSION: t.ClassVar[int] = 1
+
+    def __init__(self, data: t.Dict[str, t.Any]):
+        if data.get("version") != self.VERSION:
+            raise LavacordError(f"Unsupported snapshot version <{data.get('version')}>.")
+
+        self.data: t.Dict[str, t.Any] = data
+
+    def __repr__(self) -> str:
+        return f"<Snapshot nodes={len(self.data['nodes'])} players={len(self)}>"
+
+    def __len__(self) -> int:
+        return sum(len(node["players"]) for node in self.data["nodes"].values())
+
+    @classmethod
+    def capture(cls) -> Snapshot:
+        """Serialise every player of every node in the pool."""
+        nodes = {}
+        for identifier, node in NodePool._nodes.items():
+            nodes[identifier] = {
+                "resume_key": node.credentials.resume_key,
+                "players": [player.to_dict() for player in node.players.values()],
+            }
+
+        return cls({"version": cls.VERSION, "created_at": time.time(), "nodes": nodes})
+
+    def save(self, path: t.Union[str, os.PathLike]) -> None:
+        """Write the snapshot to a file, atomically replacing any previous one."""
+        tmp = f"{os.fspath(path)}.tmp"
+        with open(tmp, "w", encoding="utf-8") as file:
+            file.write(_to_json(self.data))
+        os.replace(tmp, path)
+        logger.info(f"Snapshot saved:: {len(self)} players -> {os.fspath(path)}")
+
+    @classmethod
+    def load(cls, path: t.Union[str, os.PathLike]) -> Snapshot:
+        """Read a snapshot written by :meth:`save`."""
+        with open(path, "r", encoding="utf-8") as file:
+            return cls(_from_json(file.read()))
+
+    def resume_key(self, identifier: str) -> t.Optional[str]:
+        """The resume key the node had when the snapshot was taken.
+
+        Pass it to :meth:`NodePool.create_node` so the node resumes its Lavalink session.
+        """
+        node = self.data["nodes"].get(identifier)
+        return node["resume_key"] if node else None
+
+    async def restore(self, cls: t.Type[BP] = Player, **kwargs: t.Any) -> t.List[BP]:
+        """|coro|
+        Recreate the players of the snapshot on the nodes of the pool.
+
+        Players of nodes that no longer exist are moved to the best available node.
+        Parameters
+        ----------
+        cls: Type[:class:`BasePlayer`]
+            The player class to create. Defaults to :class:`Player`.
+        **kwargs: Any
+            Extra keyword arguments passed to the player class.
+        Returns
+        -------
+        List[:class:`BasePlayer`]
+            The restored players.
+        """
+        players = []
+        for identifier, node_data in self.data["nodes"].items():
+            node = NodePool._nodes.get(identifier)
+            # The key alone does not prove anything: past the resume timeout Lavalink starts a new session.
+            resumed = (node is not None
+                       and node.credentials.resume_key == node_data["resume_key"]
+                       and node.resumed)
+            if node is None:
+                node = NodePool.get_node()
+
+            for data in node_data["players"]:
+                guild_id = hikari.Snowflake(data["guild_id"])
+                channel_id = hikari.Snowflake(data["channel_id"]) if data["channel_id"] else None
+                player = cls(guild_id, channel_id, node=node, **kwargs)
+                node._players[guild_id] = player
+
+                try:
+                    await player._restore(data, resumed=resumed)
+                except Exception as error:
+                    logger.error(f"Failed to restore player:: {guild_id} :: {error}")
+                    if node._players.get(guild_id) is player:
+                        node._remove_player(guild_id)
+                    continue
+
+                players.append(player)
+
+            logger.info(f"Snapshot restored:: {len(node_data['players'])} players on {node} (resumed={resumed})")
+
+        return players
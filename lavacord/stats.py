@@ -25,6 +25,7 @@ SOFTWARE.
 
 from __future__ import annotations
 
+import time
 import typing as t
 from datetime import datetime, timezone, timedelta
 
@@ -37,9 +38,10 @@ __all__ = (
 
 
 class PlayerState:
-    __slots__ = ("time", "position", "connected")
+    __slots__ = ("time", "position", "connected", "received_at")
 
     def __init__(self, data: dict):
+        self.received_at: float = time.monotonic()
         self.time: datetime = datetime.fromtimestamp(data.get("time") / 1000, tz=timezone.utc)
         position = data.get("position")
         if position:
@@ -48,12 +50,23 @@ class PlayerState:
             self.position = timedelta(seconds=0)
         self.connected: bool = data.get("connected")
 
+    @classmethod
+    def _from_frame(cls, frame: t.Any) -> PlayerState:
+        """Build the state from a :class:`~lavacord.schema.PlayerStateFrame`."""
+        self = cls.__new__(cls)
+        self.received_at = time.monotonic()
+        self.time = datetime.fromtimestamp(frame.time / 1000, tz=timezone.utc)
+        self.position = timedelta(seconds=round(frame.position / 1000, 0))
+        self.connected = frame.connected
+        return self
+
     @classmethod
     def null(cls):
         self = cls.__new__(cls)
         self.time = datetime.fromtimestamp(0, tz=timezone.utc)
         self.position = timedelta(seconds=0)
         self.connected = False
+        self.received_at = 0.0
         return self
 
 
@@ -120,3 +133,27 @@ class Stats:
         self.frames_nulled: int = frame_stats.get("nulled", -1)
         self.frames_deficit: int = frame_stats.get("deficit", -1)
         self.penalty = Penalty(self)
+
+    @classmethod
+    def _from_frame(cls, frame: t.Any) -> Stats:
+        """Build the stats from a :class:`~lavacord.schema.StatsFrame`."""
+        self = cls.__new__(cls)
+        self.uptime = frame.uptime
+        self.players = frame.players
+        self.playing_players = frame.playingPlayers
+
+        self.memory_free = frame.memory.free
+        self.memory_used = frame.memory.used
+        self.memory_allocated = frame.memory.allocated
+        self.memory_reservable = frame.memory.reservable
+
+        self.cpu_cores = frame.cpu.cores
+        self.system_load = frame.cpu.systemLoad
+        self.lavalink_load = frame.cpu.lavalinkLoad
+
+        frame_stats = frame.frameStats
+        self.frames_sent = frame_stats.sent if frame_stats else -1
+        self.frames_nulled = frame_stats.nulled if frame_stats else -1
+        self.frames_deficit = frame_stats.deficit if frame_stats else -1
+        self.penalty = Penalty(self)
+        return self
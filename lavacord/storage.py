@@ -0,0 +1,315 @@
+"""
+MIT License
+
+Copyright (c) 2022 CrazzzyyFoxx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import dbm
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Set, Type
+
+import hikari
+
+from .pool import NodePool
+from .queue import Queue
+from .utils import _from_json, _to_json
+
+__all__ = (
+    "QueueStorage",
+    "DBMQueueStorage",
+    "QueueCache",
+)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class QueueStorage(abc.ABC):
+    """An ABC for async backends that persist guild queues outside the process.
+
+    Queues are exchanged as the dicts produced by :meth:`Queue.to_dict`.
+    """
+
+    @abc.abstractmethod
+    async def load(self, guild_id: hikari.Snowflake) -> Optional[Dict[str, Any]]:
+        """Return the stored queue of the guild, or None if nothing is stored."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def save(self, guild_id: hikari.Snowflake, data: Dict[str, Any]) -> None:
+        """Store the queue of the guild."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def delete(self, guild_id: hikari.Snowflake) -> None:
+        """Remove the stored queue of the guild, if any."""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Release the resources held by the backend."""
+
+
+class DBMQueueStorage(QueueStorage):
+    """Reference :class:`QueueStorage` on top of a local :mod:`dbm` database.
+
+    Blocking database calls run on a single worker thread, so the event loop is never blocked.
+
+    Parameters
+    ----------
+    path: str
+        The database file, created if it does not exist.
+    """
+
+    def __init__(self, path: str):
+        self._db = dbm.open(path, "c")
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lavacord-dbm")
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _get(self, key: bytes) -> Optional[bytes]:
+        return self._db.get(key)
+
+    def _set(self, key: bytes, value: bytes) -> None:
+        self._db[key] = value
+
+    def _delete(self, key: bytes) -> None:
+        try:
+            del self._db[key]
+        except KeyError:
+            pass
+
+    async def load(self, guild_id: hikari.Snowflake) -> Optional[Dict[str, Any]]:
+        raw = await self._run(self._get, str(guild_id).encode())
+        return None if raw is None else _from_json(raw)
+
+    async def save(self, guild_id: hikari.Snowflake, data: Dict[str, Any]) -> None:
+        await self._run(self._set, str(guild_id).encode(), _to_json(data).encode())
+
+    async def delete(self, guild_id: hikari.Snowflake) -> None:
+        await self._run(self._delete, str(guild_id).encode())
+
+    async def close(self) -> None:
+        await self._run(self._db.close)
+        self._executor.shutdown(wait=False)
+
+
+class QueueCache:
+    """Write-behind cache of guild queues in front of a :class:`QueueStorage`.
+
+    Queues handed out by :meth:`get` stay in memory while they are used, every
+    ``flush_interval`` seconds the ones whose :attr:`Queue.version` moved are
+    written to the backend in the background. Queues that were not requested for
+    ``idle_timeout`` seconds are written one last time and evicted, which bounds
+    memory on large deployments, unless a player still holds them as its ``queue``.
+
+    Changes made through the queue methods are picked up on their own, call
+    :meth:`mark_dirty` after editing a queued track in place, which the queue
+    cannot see.
+
+    Parameters
+    ----------
+    storage: :class:`QueueStorage`
+        The backend queues are loaded from and written to.
+    queue_cls: Type[:class:`Queue`]
+        The class used for new and loaded queues. Defaults to :class:`Queue`.
+    flush_interval: float
+        Seconds between background writes of changed queues. Defaults to 5.
+    idle_timeout: float
+        Seconds after which an unused queue is evicted from memory. Defaults to 600.
+    """
+
+    def __init__(
+            self,
+            storage: QueueStorage,
+            *,
+            queue_cls: Type[Queue] = Queue,
+            flush_interval: float = 5.0,
+            idle_timeout: float = 600.0,
+    ):
+        self.storage: QueueStorage = storage
+        self._queue_cls: Type[Queue] = queue_cls
+        self._flush_interval: float = flush_interval
+        self._idle_timeout: float = idle_timeout
+
+        self._queues: Dict[hikari.Snowflake, Queue] = {}
+        self._last_used: Dict[hikari.Snowflake, float] = {}
+        self._dirty: Set[hikari.Snowflake] = set()
+        self._saved: Dict[hikari.Snowflake, int] = {}
+        self._loading: Dict[hikari.Snowflake, asyncio.Future] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._queues)
+
+    def __contains__(self, guild_id: hikari.Snowflake) -> bool:
+        return guild_id in self._queues
+
+    def _touch(self, guild_id: hikari.Snowflake) -> None:
+        self._last_used[guild_id] = asyncio.get_running_loop().time()
+
+    async def get(self, guild_id: hikari.Snowflake) -> Queue:
+        """|coro|
+        Return the queue of the guild, loading it from the backend if it is not in memory.
+
+        Reading does not schedule a write, changing the queue does.
+        """
+        if self._task is None:
+            self.start()
+
+        queue = self._queues.get(guild_id)
+        if queue is None:
+            loading = self._loading.get(guild_id)
+            if loading is not None:
+                queue = await asyncio.shield(loading)
+            else:
+                loading = self._loading[guild_id] = asyncio.get_running_loop().create_future()
+                try:
+                    data = await self.storage.load(guild_id)
+                    queue = self._queue_cls() if data is None else self._queue_cls.from_dict(data)
+                    self._queues[guild_id] = queue
+                    self._saved[guild_id] = queue.version
+                    loading.set_result(queue)
+                except BaseException as error:
+                    loading.set_exception(error)
+                    loading.exception()
+                    raise
+                finally:
+                    del self._loading[guild_id]
+
+        self._touch(guild_id)
+        return queue
+
+    def mark_dirty(self, guild_id: hikari.Snowflake) -> None:
+        """Schedule the in-memory queue of the guild to be written on the next flush.
+
+        Only needed for changes the queue does not see, such as a track edited in place.
+        """
+        if guild_id in self._queues:
+            self._touch(guild_id)
+            self._dirty.add(guild_id)
+
+    async def flush(self) -> None:
+        """|coro|
+        Write every changed queue to the backend.
+        """
+        dirty, self._dirty = self._dirty, set()
+        for guild_id, queue in list(self._queues.items()):
+            if guild_id not in dirty and queue.version == self._saved.get(guild_id):
+                continue
+            try:
+                await self._save(guild_id, queue)
+            except Exception as error:
+                self._dirty.add(guild_id)
+                logger.error(f"Failed to store queue:: {guild_id} :: {error}")
+
+    async def _save(self, guild_id: hikari.Snowflake, queue: Queue) -> None:
+        version = queue.version
+        await self.storage.save(guild_id, queue.to_dict())
+        self._saved[guild_id] = version
+
+    def _held_by_player(self, guild_id: hikari.Snowflake, queue: Queue) -> bool:
+        for node in NodePool._nodes.values():
+            player = node.get_player(guild_id)
+            if player is not None and getattr(player, "queue", None) is queue:
+                return True
+
+        return False
+
+    async def evict(self, guild_id: hikari.Snowflake) -> None:
+        """|coro|
+        Write the queue of the guild to the backend and drop it from memory.
+
+        The queue is kept in memory if it was requested or changed while it was being written.
+        """
+        queue = self._queues.get(guild_id)
+        if queue is None:
+            return
+
+        last_used = self._last_used.get(guild_id)
+        version = queue.version
+        self._dirty.discard(guild_id)
+        try:
+            await self._save(guild_id, queue)
+        except BaseException:
+            self._dirty.add(guild_id)
+            raise
+
+        if (guild_id in self._dirty
+                or queue.version != version
+                or self._queues.get(guild_id) is not queue
+                or self._last_used.get(guild_id) != last_used):
+            logger.debug(f"Queue used while evicting, kept:: {guild_id}")
+            return
+
+        self._queues.pop(guild_id, None)
+        self._last_used.pop(guild_id, None)
+        self._saved.pop(guild_id, None)
+        logger.debug(f"Queue evicted:: {guild_id}")
+
+    async def delete(self, guild_id: hikari.Snowflake) -> None:
+        """|coro|
+        Forget the queue of the guild both in memory and in the backend.
+        """
+        self._queues.pop(guild_id, None)
+        self._last_used.pop(guild_id, None)
+        self._saved.pop(guild_id, None)
+        self._dirty.discard(guild_id)
+        await self.storage.delete(guild_id)
+
+    async def _evict_idle(self) -> None:
+        deadline = asyncio.get_running_loop().time() - self._idle_timeout
+        for guild_id in [g for g, last_used in self._last_used.items() if last_used < deadline]:
+            queue = self._queues.get(guild_id)
+            if queue is not None and self._held_by_player(guild_id, queue):
+                # A reloaded copy would drift from the one the player keeps using.
+                continue
+            try:
+                await self.evict(guild_id)
+            except Exception as error:
+                logger.error(f"Failed to evict queue:: {guild_id} :: {error}")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            await self.flush()
+            await self._evict_idle()
+
+    def start(self) -> None:
+        """Start the background flush and eviction task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """|coro|
+        Stop the background task, write every queue in memory and close the backend.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        self._dirty.update(self._queues)
+        await self.flush()
+        await self.storage.close()
@@ -0,0 +1,179 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022 CrazzzyyFoxx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from typing import Any, Callable, List, Optional
+
+__all__ = (
+    "TimerHandle",
+    "TimingWheel",
+)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class TimerHandle:
+    """A callback scheduled on a :class:`TimingWheel`."""
+
+    __slots__ = ("expires", "callback", "args", "cancelled", "_wheel")
+
+    def __init__(self, wheel: TimingWheel, expires: int, callback: Callable[..., Any], args: tuple):
+        self.expires: int = expires
+        self.callback: Callable[..., Any] = callback
+        self.args: tuple = args
+        self.cancelled: bool = False
+        self._wheel: Optional[TimingWheel] = wheel
+
+    def __repr__(self) -> str:
+        return f"<TimerHandle expires={self.expires} cancelled={self.cancelled}>"
+
+    def cancel(self) -> None:
+        """Prevent the callback from running. Cancelled timers are dropped lazily."""
+        if not self.cancelled:
+            self.cancelled = True
+            if self._wheel is not None:
+                self._wheel._pending -= 1
+                self._wheel = None
+
+
+class TimingWheel:
+    """A hierarchical timing wheel driven by a single asyncio task.
+
+    Scheduling and cancelling a timer is O(1) no matter how many timers are pending,
+    and all of them share one ticker instead of an asyncio task or handle each.
+    Level ``n`` has ``slots`` buckets of ``slots ** n`` ticks, timers move to the lower
+    levels as their expiry comes closer. Timers further away than the whole wheel wait
+    in an overflow list that is re-sorted once per full turn.
+
+    Parameters
+    ----------
+    resolution: float
+        Seconds per tick, the precision of the timers. Defaults to 1.
+    slots: int
+        Buckets per level. Defaults to 64.
+    levels: int
+        Number of levels. Defaults to 3, which covers 64 ** 3 ticks (about 3 days).
+    """
+
+    def __init__(self, resolution: float = 1.0, *, slots: int = 64, levels: int = 3):
+        self._resolution: float = resolution
+        self._slots: int = slots
+        self._levels: int = levels
+        self._wheels: List[List[List[TimerHandle]]] = [[[] for _ in range(slots)] for _ in range(levels)]
+        self._overflow: List[TimerHandle] = []
+        self._tick: int = 0
+        self._epoch: float = 0.0
+        self._pending: int = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return self._pending
+
+    @property
+    def resolution(self) -> float:
+        return self._resolution
+
+    def _place(self, handle: TimerHandle) -> None:
+        expires, tick, slots = handle.expires, self._tick, self._slots
+        span = 1
+        for level in range(self._levels):
+            # A timer sits on the lowest level whose current turn still contains its expiry.
+            if expires // (span * slots) == tick // (span * slots):
+                self._wheels[level][(expires // span) % slots].append(handle)
+                return
+            span *= slots
+
+        self._overflow.append(handle)
+
+    def _advance(self) -> None:
+        self._tick += 1
+        tick, slots = self._tick, self._slots
+
+        span = slots ** self._levels
+        if tick % span == 0:
+            overflow, self._overflow = self._overflow, []
+            for handle in overflow:
+                if not handle.cancelled:
+                    self._place(handle)
+
+        for level in range(self._levels - 1, 0, -1):
+            span = slots ** level
+            if tick % span == 0:
+                bucket = self._wheels[level][(tick // span) % slots]
+                handles, bucket[:] = bucket[:], []
+                for handle in handles:
+                    if not handle.cancelled:
+                        self._place(handle)
+
+        bucket = self._wheels[0][tick % slots]
+        handles, bucket[:] = bucket[:], []
+        for handle in handles:
+            if handle.cancelled:
+                continue
+
+            handle.cancelled = True
+            handle._wheel = None
+            self._pending -= 1
+            try:
+                handle.callback(*handle.args)
+            except Exception as error:
+                logger.error(f"Timer callback {handle.callback} failed:: {error}")
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            await asyncio.sleep(self._resolution)
+            due = int((loop.time() - self._epoch) / self._resolution)
+            while self._tick < due:
+                self._advance()
+
+    def schedule(self, delay: float, callback: Callable[..., Any], *args: Any) -> TimerHandle:
+        """Run ``callback(*args)`` after ``delay`` seconds, rounded up to the wheel resolution."""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done():
+            # The wheel sleeps while empty, re-align the tick counter with the clock when it starts again.
+            self._epoch = loop.time() - self._tick * self._resolution
+            self._task = asyncio.create_task(self._run())
+
+        ticks = max(1, math.ceil(delay / self._resolution))
+        handle = TimerHandle(self, self._tick + ticks, callback, args)
+        self._pending += 1
+        self._place(handle)
+        return handle
+
+    def close(self) -> None:
+        """Stop the ticker and drop every pending timer."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        for wheel in self._wheels:
+            for bucket in wheel:
+                bucket.clear()
+        self._overflow.clear()
+        self._pending = 0
@@ -0,0 +1,197 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022 CrazzzyyFoxx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import abc
+import contextvars
+import logging
+import time
+import typing as t
+
+__all__ = (
+    "Span",
+    "Tracer",
+    "set_tracer",
+    "get_tracer",
+    "current_span",
+    "span",
+)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+_current_span: contextvars.ContextVar[t.Optional[Span]] = contextvars.ContextVar("lavacord_span", default=None)
+
+
+class Span:
+    """A timed operation reported to the installed :class:`Tracer`.
+
+    Attributes
+    ----------
+    name: str
+        What the span measures, e.g. ``lavacord.rest.loadtracks``.
+    attributes: Dict[str, Any]
+        Details of the operation, e.g. the node or the guild.
+    parent: Optional[:class:`Span`]
+        The span that was active where this one started.
+    started_at: float
+        :func:`time.perf_counter` when the span started.
+    ended_at: Optional[float]
+        :func:`time.perf_counter` when the span ended, None while it runs.
+    error: Optional[BaseException]
+        The exception that ended the span, if any.
+    data: Any
+        Free for the tracer, e.g. to hold the span of its backend.
+    """
+
+    __slots__ = ("name", "attributes", "parent", "started_at", "ended_at", "error", "data", "_tracer", "_token")
+
+    def __init__(self, tracer: Tracer, name: str, attributes: t.Dict[str, t.Any]):
+        self.name: str = name
+        self.attributes: t.Dict[str, t.Any] = attributes
+        self.parent: t.Optional[Span] = _current_span.get()
+        self.started_at: float = time.perf_counter()
+        self.ended_at: t.Optional[float] = None
+        self.error: t.Optional[BaseException] = None
+        self.data: t.Any = None
+        self._tracer: Tracer = tracer
+        self._token: t.Optional[contextvars.Token] = None
+
+    def __repr__(self) -> str:
+        return f"<Span {self.name} duration={self.duration}>"
+
+    @property
+    def duration(self) -> t.Optional[float]:
+        """Seconds the span took, None while it runs."""
+        return None if self.ended_at is None else self.ended_at - self.started_at
+
+    def set_attribute(self, key: str, value: t.Any) -> None:
+        self.attributes[key] = value
+
+    def _start(self) -> None:
+        try:
+            self._tracer.on_start(self)
+        except Exception as error:
+            logger.error(f"Tracer failed to start span:: {self.name} :: {error}")
+
+    def end(self, error: t.Optional[BaseException] = None) -> None:
+        """End the span, only the first call is reported."""
+        if self.ended_at is not None:
+            return
+
+        self.ended_at = time.perf_counter()
+        self.error = error
+        try:
+            self._tracer.on_end(self)
+        except Exception as exc:
+            logger.error(f"Tracer failed to end span:: {self.name} :: {exc}")
+
+    def __enter__(self) -> Span:
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type: t.Any, exc: t.Optional[BaseException], tb: t.Any) -> None:
+        if self._token is not None:
+            _current_span.reset(self._token)
+            self._token = None
+        self.end(exc)
+
+
+class Tracer(abc.ABC):
+    """Receives the spans of lavacord, to forward them to a tracing backend.
+
+    Spans are opened around REST requests, Spotify lookups, websocket sends, frame processing
+    and player operations. ``lavacord.player.start`` spans run from :meth:`BasePlayer.play`
+    until Lavalink reports the ``TrackStartEvent``.
+    The active span is kept in a context variable, so spans started in tasks created
+    inside a span have it as parent.
+    """
+
+    @abc.abstractmethod
+    def on_start(self, span: Span) -> None:
+        """Called when a span starts."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def on_end(self, span: Span) -> None:
+        """Called when a span ends, :attr:`Span.error` is set if it failed."""
+        raise NotImplementedError
+
+
+class _NoopSpan:
+    """Stands in for spans while no tracer is installed."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: t.Any) -> None:
+        pass
+
+    def end(self, error: t.Optional[BaseException] = None) -> None:
+        pass
+
+    def __enter__(self) -> _NoopSpan:
+        return self
+
+    def __exit__(self, *args: t.Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+_tracer: t.Optional[Tracer] = None
+
+
+def set_tracer(tracer: t.Optional[Tracer]) -> None:
+    """Install the tracer receiving every span, None to stop tracing."""
+    global _tracer
+    _tracer = tracer
+
+
+def get_tracer() -> t.Optional[Tracer]:
+    return _tracer
+
+
+def current_span() -> t.Optional[Span]:
+    """The span active in the current context, if any."""
+    return _current_span.get()
+
+
+def span(name: str, **attributes: t.Any) -> t.Union[Span, _NoopSpan]:
+    """Start a span, its parent is the current span.
+
+    Used as a context manager the span is current inside the block and ends with it,
+    otherwise it has to be ended with :meth:`Span.end`. Without a tracer a shared no-op
+    object is returned.
+
+    .. code-block:: python
+
+        with lavacord.span("bot.play", guild=guild_id):
+            ...
+    """
+    if _tracer is None:
+        return _NOOP_SPAN
+
+    started = Span(_tracer, name, attributes)
+    started._start()
+    return started
+
@@ -24,15 +24,16 @@ SOFTWARE.
 
 from __future__ import annotations
 
-import asyncio
 import typing as t
 from datetime import datetime, timezone
 
 import hikari
 import tekore
-from tekore.model import FullAlbum, FullPlaylist, SimpleTrack, PlaylistTrack
+from pydantic import Field
+from tekore.model import FullAlbum, FullPlaylist, SimpleTrack
 
-from .abc import Playlist, Track
+from . import tracing
+from .abc import _TRACK_TYPES, Playlist, Track
 from .enums import Icons
 
 if t.TYPE_CHECKING:
@@ -43,8 +44,10 @@ __all__ = (
     "YouTubeTrack",
     "YouTubeMusicTrack",
     "SoundCloudTrack",
+    "SoundCloudPlaylist",
     "YouTubePlaylist",
     "SpotifyTrack",
+    "PartialTrack",
     "YouTubeMusicPlaylist",
     "SpotifyPlaylist",
     "TwitchTrack",
@@ -153,7 +156,8 @@ class SpotifyTrack(YouTubeMusicTrack):
             *,
             return_first: bool = True
     ) -> t.List[Track]:
-        track_: tekore.model.FullTrack = await node.spotify.track(query)
+        with tracing.span("lavacord.spotify.track", query=query):
+            track_: tekore.model.FullTrack = await node.spotify.track(query)
         artists = [artist.name for artist in track_.artists]
         return await node.get_tracks(cls,
                                      query=f'{track_.name} {", ".join(artists)}',
@@ -162,6 +166,60 @@ class SpotifyTrack(YouTubeMusicTrack):
                                      return_first=return_first)
 
 
+class PartialTrack(Track):
+    """A track known by its title and author only, searched for right before it plays.
+
+    :meth:`resolve` searches ``track_type`` for the title and author and returns the
+    playable track, with ``payload`` merged into its fields. Players resolve the next
+    queued track ahead of the end of the current one, see ``prefetch_window``.
+    """
+
+    id: str = Field("", alias="track")
+    is_seekable: bool = Field(True, alias="isSeekable", repr=False)
+    is_stream: bool = Field(False, alias="isStream", repr=False)
+    source_mame: str = Field("", alias="sourceName", repr=False)
+    position: int = Field(0, repr=False)
+
+    track_type: str = Field("YouTubeMusicTrack", repr=False)
+    payload: t.Dict[str, t.Any] = Field(default_factory=dict, repr=False)
+
+    @property
+    def thumbnail(self) -> t.Optional[str]:
+        return self.payload.get("thumbnail_")
+
+    async def resolve(self, node: Node) -> Track:
+        """|coro|
+        Search the track on ``node`` and return the first match.
+
+        Raises
+        --------
+        :exc:`.LavalinkException`
+            If nothing matched the title and author.
+        """
+        query = f"{self.title} {self.author}" if self.author else self.title
+        with tracing.span("lavacord.track.resolve", query=query, type=self.track_type):
+            return await node.get_tracks(_TRACK_TYPES[self.track_type],
+                                         query=query,
+                                         requester=self.requester,
+                                         payload=self.payload,
+                                         return_first=True)
+
+
+def _spotify_partial(
+        track: SimpleTrack,
+        thumbnail: str,
+        requester: hikari.Snowflake
+) -> PartialTrack:
+    return PartialTrack(title=track.name,
+                        author=", ".join(artist.name for artist in track.artists),
+                        identifier=track.id,
+                        uri=f"https://open.spotify.com/track/{track.id}",
+                        length=track.duration_ms,
+                        requester=requester,
+                        track_type=SpotifyTrack.__name__,
+                        payload={"identifier": track.id, "thumbnail_": thumbnail})
+
+
 # class YandexMusicTrack(YouTubeMusicTrack):
 #     _color = hikari.Color.from_hex_code("#f3d92f")
 #     _icon = Icons.yandexmusic
@@ -229,6 +287,20 @@ class YouTubeMusicPlaylist(Playlist):
         return await node.get_playlist(cls, YouTubeMusicTrack, query, requester)
 
 
+class SoundCloudPlaylist(Playlist):
+    _icon = Icons.soundcloud
+    _color = hikari.Color.from_hex_code("#f08f16")
+
+    @classmethod
+    async def search(
+            cls: t.Type[PT],
+            query: str,
+            requester: hikari.Snowflake,
+            node: Node,
+    ) -> SoundCloudPlaylist:
+        return await node.get_playlist(cls, SoundCloudTrack, query, requester)
+
+
 class SpotifyAlbum(Playlist):
     _icon = Icons.spotify
     _color = hikari.Color.from_hex_code("#1ed760")
@@ -242,34 +314,21 @@ class SpotifyAlbum(Playlist):
             requester: hikari.Snowflake,
             node: Node,
     ) -> SpotifyAlbum:
-        playlist: FullAlbum = await node.spotify.album(query)
-        tracks = []
-
-        async def func(spotify_track: SimpleTrack):
-            artists = [artist.name for artist in spotify_track.artists]
-            lavalink_track = await node.get_tracks(SpotifyTrack,
-                                                   query=f'{spotify_track.name} {", ".join(artists)}',
-                                                   requester=requester,
-                                                   return_first=True,
-                                                   payload={"identifier": spotify_track.id,
-                                                            "thumbnail": spotify_track.preview_url}
-                                                   )
-            if lavalink_track is None:
-                return
-
-            tracks.append(lavalink_track)
+        with tracing.span("lavacord.spotify.album", query=query):
+            playlist: FullAlbum = await node.spotify.album(query)
 
-        tasks = []
-
-        for track in playlist.tracks.items:
-            tasks.append(asyncio.create_task(func(track)))
-        await asyncio.wait(tasks)
+        # Searched one by one as they are about to play, see PartialTrack.
+        thumbnail = playlist.images[0].url
+        tracks = [
+            _spotify_partial(track, thumbnail, requester)
+            for track in playlist.tracks.items
+        ]
 
         return cls(tracks=tracks,
                    name=playlist.name,
                    selectedTrack=len(tracks),
                    uri=playlist.uri,
-                   thumbnail=playlist.images[0].url,
+                   thumbnail=thumbnail,
                    requester=requester)
 
 
@@ -286,28 +345,15 @@ class SpotifyPlaylist(Playlist):
             requester: hikari.Snowflake,
             node: Node,
     ) -> SpotifyPlaylist:
-        playlist: FullPlaylist = await node.spotify.playlist(query)
-        tracks = []
-
-        async def func(spotify_track: PlaylistTrack):
-            artists = [artist.name for artist in spotify_track.track.artists]
-            lavalink_track = await node.get_tracks(SpotifyTrack,
-                                                   query=f'{spotify_track.track.name} {", ".join(artists)}',
-                                                   requester=requester,
-                                                   return_first=True,
-                                                   payload={"identifier": spotify_track.track.id,
-                                                            "thumbnail": spotify_track.track.album.images[0].url}
-                                                   )
-            if lavalink_track is None:
-                return
-
-            tracks.append(lavalink_track)
-
-        tasks = []
-
-        for track in playlist.tracks.items:
-            tasks.append(asyncio.create_task(func(track)))
-        await asyncio.wait(tasks)
+        with tracing.span("lavacord.spotify.playlist", query=query):
+            playlist: FullPlaylist = await node.spotify.playlist(query)
+
+        # Searched one by one as they are about to play, see PartialTrack.
+        tracks = [
+            _spotify_partial(item.track, item.track.album.images[0].url, requester)
+            for item in playlist.tracks.items
+            if item.track is not None
+        ]
 
         return cls(tracks=tracks,
                    name=playlist.name,
@@ -0,0 +1,164 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022 CrazzzyyFoxx
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import typing as t
+import weakref
+
+import hikari
+
+if t.TYPE_CHECKING:
+    from .player import BasePlayer
+    from .stats import PlayerState
+
+__all__ = (
+    "Updates",
+    "StateUpdates",
+    "PoolStateUpdates",
+)
+
+T = t.TypeVar("T")
+
+
+class Updates(t.Generic[T]):
+    """Async iterator over the latest value published to it.
+
+    Only the most recent value is kept: a consumer slower than the publisher skips
+    the values it missed instead of building a backlog, so memory stays constant per
+    subscriber. With ``min_interval`` consecutive values are at least that many
+    seconds apart. Iteration ends once the subscription is closed.
+
+    The publisher only keeps a weak reference, an abandoned iterator unsubscribes itself.
+    """
+
+    def __init__(self, min_interval: float = 0.0):
+        self.min_interval: float = min_interval
+        self._value: t.Any = None
+        self._pending: bool = False
+        self._ready: asyncio.Event = asyncio.Event()
+        self._closed: bool = False
+        self._last: float = 0.0
+
+    def __aiter__(self) -> Updates[T]:
+        return self
+
+    async def __aenter__(self) -> Updates[T]:
+        return self
+
+    async def __aexit__(self, *args: t.Any) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _store(self, value: t.Any) -> None:
+        self._value = value
+
+    def _take(self) -> T:
+        value, self._value = self._value, None
+        return value
+
+    def _publish(self, value: t.Any) -> None:
+        self._store(value)
+        self._pending = True
+        self._ready.set()
+
+    def close(self) -> None:
+        """Stop the iteration, a pending value is still delivered before it ends."""
+        self._closed = True
+        self._ready.set()
+
+    async def __anext__(self) -> T:
+        if self.min_interval and not self._closed:
+            delay = self._last + self.min_interval - asyncio.get_running_loop().time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        await self._ready.wait()
+        if not self._pending:
+            raise StopAsyncIteration
+
+        self._pending = False
+        if not self._closed:
+            self._ready.clear()
+        self._last = asyncio.get_running_loop().time()
+        return self._take()
+
+
+class StateUpdates(Updates["PlayerState"]):
+    """The ``playerUpdate`` states of one player, see :meth:`BasePlayer.updates`."""
+
+
+class PoolStateUpdates(Updates[t.Dict[hikari.Snowflake, t.Tuple["BasePlayer", "PlayerState"]]]):
+    """The ``playerUpdate`` states of every player, see :meth:`NodePool.updates`.
+
+    Each item maps the guilds updated since the previous item to their player and latest state,
+    memory is bounded by the number of players.
+    """
+
+    def __init__(self, min_interval: float = 0.0):
+        super().__init__(min_interval)
+        self._value = {}
+
+    def _store(self, value: t.Tuple[BasePlayer, PlayerState]) -> None:
+        self._value[value[0].guild_id] = value
+
+    def _take(self) -> t.Dict[hikari.Snowflake, t.Tuple[BasePlayer, PlayerState]]:
+        value, self._value = self._value, {}
+        return value
+
+
+class Publisher(t.Generic[T]):
+    """The subscriptions of one source, held weakly."""
+
+    __slots__ = ("_subscribers",)
+
+    def __init__(self):
+        self._subscribers: t.Optional[weakref.WeakSet[Updates[t.Any]]] = None
+
+    def __bool__(self) -> bool:
+        return bool(self._subscribers)
+
+    def add(self, updates: Updates[t.Any]) -> None:
+        if self._subscribers is None:
+            self._subscribers = weakref.WeakSet()
+        self._subscribers.add(updates)
+
+    def publish(self, value: T) -> None:
+        if not self._subscribers:
+            return
+        for updates in list(self._subscribers):
+            if updates.closed:
+                self._subscribers.discard(updates)
+            else:
+                updates._publish(value)
+
+    def close(self) -> None:
+        if self._subscribers:
+            for updates in list(self._subscribers):
+                updates.close()
+        self._subscribers = None
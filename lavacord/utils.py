@@ -18,10 +18,12 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 
+import bisect
 import json
+import math
 import os
 
-from typing import Any
+from typing import Any, Dict, Iterable, List, Tuple, Type, Union
 
 try:
     import orjson
@@ -30,21 +32,100 @@ except ModuleNotFoundError:
 else:
     HAS_ORJSON = True
 
+try:
+    import ujson
+except ModuleNotFoundError:
+    HAS_UJSON = False
+else:
+    HAS_UJSON = True
+
+
+class Serializer:
+    """A JSON backend.
+
+    :meth:`dumps` returns UTF-8 bytes, which can be written to a websocket text frame
+    as they are. :meth:`dumps_str` is for the places that need text.
+    """
+
+    name: str = "json"
+
+    def __repr__(self) -> str:
+        return f"<Serializer {self.name}>"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def dumps_str(self, obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonSerializer(Serializer):
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def dumps_str(self, obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+
+class UjsonSerializer(Serializer):
+    name = "ujson"
+
+    def dumps(self, obj: Any) -> bytes:
+        return ujson.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    def dumps_str(self, obj: Any) -> str:
+        return ujson.dumps(obj, ensure_ascii=False)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return ujson.loads(data)
+
+
+SERIALIZERS: Dict[str, Type[Serializer]] = {"json": Serializer}
+"""The available backends by name, fastest first."""
+if HAS_UJSON:
+    SERIALIZERS = {"ujson": UjsonSerializer, **SERIALIZERS}
 if HAS_ORJSON:
+    SERIALIZERS = {"orjson": OrjsonSerializer, **SERIALIZERS}
 
-    def _to_json(obj: Any) -> str:
-        return orjson.dumps(obj).decode('utf-8')
+_serializer: Serializer = next(iter(SERIALIZERS.values()))()
 
 
-    _from_json = orjson.loads
+def get_serializer() -> Serializer:
+    """The JSON backend in use, the fastest installed one unless :func:`set_serializer` was called."""
+    return _serializer
+
+
+def set_serializer(serializer: Union[str, Serializer]) -> None:
+    """Use another JSON backend, by name (``"orjson"``, ``"ujson"``, ``"json"``) or instance.
+
+    Call it at startup, before any node is connected.
+    """
+    global _serializer
+    if isinstance(serializer, str):
+        if serializer not in SERIALIZERS:
+            raise ValueError(f"Unknown or not installed serializer <{serializer}>.")
+        serializer = SERIALIZERS[serializer]()
+    _serializer = serializer
+
+
+def _to_json(obj: Any) -> str:
+    return _serializer.dumps_str(obj)
 
-else:
 
-    def _to_json(obj: Any) -> str:
-        return json.dumps(obj, ensure_ascii=True)
+def _to_json_bytes(obj: Any) -> bytes:
+    return _serializer.dumps(obj)
 
 
-    _from_json = json.loads
+def _from_json(data: Union[str, bytes]) -> Any:
+    return _serializer.loads(data)
 
 
 class Credentials:
@@ -75,3 +156,49 @@ class Credentials:
     @property
     def websocket_host(self) -> str:
         return self.host if self._is_https else f"ws://{self._host}:{self._port}"
+
+
+class Histogram:
+    """Counts observed values, e.g. latencies in seconds, into cumulative upper-bound buckets."""
+
+    DEFAULT_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+
+    def __repr__(self) -> str:
+        return f"<Histogram count={self.count} mean={self.mean:.3f}>"
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """``(upper bound, observations <= bound)`` pairs, the last bound is infinity."""
+        total = 0
+        pairs = []
+        for bound, count in zip(self.buckets + (math.inf,), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket containing the ``q`` quantile, 0 without observations."""
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return bound
+        return math.inf
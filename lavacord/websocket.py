@@ -27,15 +27,17 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from typing import Any, Dict, TYPE_CHECKING, Optional
 
 import aiohttp
 import hikari
 
+from . import schema, tracing
 from .backoff import Backoff
 from .events import *
 from .stats import Stats, PlayerState
-from .utils import _from_json, _to_json
+from .utils import _from_json, _to_json_bytes
 
 if TYPE_CHECKING:
     from .pool import Node
@@ -45,6 +47,12 @@ __all__ = ("Websocket",)
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+_HAS_SEND_FRAME: bool = hasattr(aiohttp.ClientWebSocketResponse, "send_frame")
+
+_FRAME_OPS: Dict[type, str] = (
+    {schema.PlayerUpdateFrame: "playerUpdate", schema.StatsFrame: "stats"} if schema.HAS_MSGSPEC else {}
+)
+
 
 class Websocket:
     def __init__(self, *, node: Node):
@@ -53,6 +61,8 @@ class Websocket:
         self.websocket: Optional[aiohttp.ClientWebSocketResponse] = None
         self.listener: Optional[asyncio.Task] = None
         self.session: Optional[aiohttp.ClientSession] = None
+        self.resumed: bool = False
+        """Whether Lavalink resumed the previous session on the last connection."""
 
     def is_connected(self) -> bool:
         return self.websocket is not None and not self.websocket.closed
@@ -67,7 +77,11 @@ class Websocket:
             'Resume-Key': credentials.resume_key
         }
 
-        self.session = aiohttp.ClientSession(headers=headers)
+        # Only tracing exposes the upgrade response, which carries Session-Resumed.
+        trace = aiohttp.TraceConfig()
+        trace.on_request_end.append(self._on_request_end)
+        self.resumed = False
+        self.session = aiohttp.ClientSession(headers=headers, trace_configs=[trace])
         if self.is_connected():
             assert isinstance(self.websocket, aiohttp.ClientWebSocketResponse)
             await self.websocket.close(
@@ -95,7 +109,7 @@ class Websocket:
             self.listener = asyncio.create_task(self.listen())
 
         if self.is_connected():
-            await self.node.bot.dispatch(NodeReady(node=self.node))
+            await self.node._dispatch(NodeReady(node=self.node))
             logger.info(f"Connection established...{self.node.__repr__()}")
 
             resume = {
@@ -105,12 +119,24 @@ class Websocket:
             }
             await self.send(resume)
 
+    async def _on_request_end(
+            self,
+            session: aiohttp.ClientSession,
+            context: Any,
+            params: aiohttp.TraceRequestEndParams
+    ) -> None:
+        # Lavalink resumes the session only if it had not timed out yet.
+        resumed = params.response.headers.get("Session-Resumed", "")
+        self.resumed = resumed.lower() == "true"
+
     async def listen(self) -> None:
         backoff = Backoff(base=1, maximum_time=60, maximum_tries=None)
 
         while True:
             assert isinstance(self.websocket, aiohttp.ClientWebSocketResponse)
             msg = await self.websocket.receive()
+            # Stamped before any scheduling or decoding, so the lag of the node excludes our own delays.
+            received_at = time.time()
             if msg.type is aiohttp.WSMsgType.CLOSED:
                 logger.info(f"Websocket Closed: {msg.extra}")
 
@@ -120,6 +146,7 @@ class Websocket:
 
                 await asyncio.sleep(retry)
                 if not self.is_connected():
+                    self.node.metrics.reconnects += 1
                     await self.connect()
             else:
                 logger.debug(f"Received Payload:: <{msg.data}>")
@@ -131,55 +158,174 @@ class Websocket:
                     self.listener.cancel()
                     return
 
-                asyncio.create_task(self.process_data(msg.json(loads=_from_json)))
+                self.node.metrics.dispatch_depth += 1
+                asyncio.create_task(self._process(msg, received_at))
 
-    async def process_data(self, data: Dict[str, Any]) -> None:
+    async def _process(self, msg: aiohttp.WSMessage, received_at: float) -> None:
+        try:
+            with tracing.span("lavacord.websocket.process", node=self.node.identifier):
+                if schema.HAS_MSGSPEC:
+                    await self.process_frame(msg.data, received_at)
+                else:
+                    await self.process_data(msg.json(loads=_from_json), received_at)
+        finally:
+            self.node.metrics.dispatch_depth -= 1
+
+    async def process_data(self, data: Dict[str, Any], received_at: Optional[float] = None) -> None:
         op = data.pop("op")
         if not op:
             return
 
+        frames_in = self.node.metrics.frames_in
+        frames_in[op] = frames_in.get(op, 0) + 1
+
         if op == "stats":
-            self.node.stats = Stats(data)
+            self.node._on_stats(Stats(data))
             return
 
         player = self.node.get_player(hikari.Snowflake(data.pop("guildId")))
         assert player is not None
 
         if op == 'event':
-            event = self._get_event_payload(data, player)
-            logger.debug(f'op: event:: {event}')
-
-            await self.node.bot.dispatch(event)
+            await self._dispatch_event(self._get_event_payload(data, player), player)
 
         elif op == "playerUpdate":
             logger.debug(f"op: playerUpdate:: {data}")
-            player.last_state = PlayerState(data.get("state"))
+            self._update_state(player, PlayerState(data.get("state")), received_at)
+
+    async def process_frame(self, data: str, received_at: Optional[float] = None) -> None:
+        """Handle a raw frame with the typed decoders of :mod:`lavacord.schema`.
+
+        ``received_at`` is the POSIX time the frame arrived at, now by default.
+        """
+        try:
+            frame = schema.decode(data)
+        except Exception as error:
+            logger.error(f"Invalid frame:: {error} :: {data}")
+            return
+
+        op = _FRAME_OPS.get(type(frame), "event") if frame is not None else "unknown"
+        frames_in = self.node.metrics.frames_in
+        frames_in[op] = frames_in.get(op, 0) + 1
+
+        if frame is None:
+            return
+
+        if isinstance(frame, schema.StatsFrame):
+            self.node._on_stats(Stats._from_frame(frame))
+            return
+
+        player = self.node.get_player(hikari.Snowflake(frame.guildId))
+        assert player is not None
+
+        if isinstance(frame, schema.PlayerUpdateFrame):
+            self._update_state(player, PlayerState._from_frame(frame.state), received_at)
+        else:
+            await self._dispatch_event(self._get_frame_event(frame, player), player)
+
+    def _update_state(self, player: BasePlayer, state: PlayerState, received_at: Optional[float]) -> None:
+        player.last_state = state
+        self.node._on_player_update(state, time.time() if received_at is None else received_at)
+        player._on_state_update()
+        self.node._publish_state(player, state)
+
+    async def _dispatch_event(self, event: hikari.Event, player: BasePlayer) -> None:
+        logger.debug(f'op: event:: {event}')
+
+        if isinstance(event, TrackStartEvent):
+            player._on_track_started()
+
+        if isinstance(event, TrackEndEvent) and player.auto_advance:
+            try:
+                await player._on_track_end(event.reason)
+            except Exception as error:
+                logger.error(f"Auto advance failed:: {error}")
+
+        await self.node._dispatch(event, player.guild_id)
 
     def _get_event_payload(self, data: Dict[str, Any], player: BasePlayer) -> hikari.Event:
         name = data.pop('type')
         if name == "WebSocketClosedEvent":
-            event = WebSocketClosedEvent(self.node.bot, data)
+            event = WebSocketClosedEvent(app=self.node.bot, guildId=player.guild_id, **data)
         else:
+            source = player._known_track(data["track"])
             if name == "TrackEndEvent":
-                player._source = None
+                player._on_track_ended(data["track"], data["reason"])
                 event = TrackEndEvent(player=player,
+                                      source=source,
                                       **data)
 
             elif name == "TrackStartEvent":
                 event = TrackStartEvent(player=player,
+                                        source=source,
                                         **data)
 
             elif name == "TrackExceptionEvent":
+                exception = data["exception"]
                 event = TrackExceptionEvent(player=player,
-                                            **data)
+                                            track=data["track"],
+                                            source=source,
+                                            exception=exception,
+                                            severity=exception["severity"],
+                                            message=exception.get("message"))
             else:
                 event = TrackStuckEvent(player=player,
+                                        source=source,
                                         **data)
 
         return event
 
+    def _get_frame_event(self, frame: Any, player: BasePlayer) -> hikari.Event:
+        if isinstance(frame, schema.WebSocketClosedFrame):
+            return WebSocketClosedEvent(app=self.node.bot,
+                                        guildId=frame.guildId,
+                                        code=frame.code,
+                                        reason=frame.reason,
+                                        byRemote=frame.byRemote)
+
+        source = player._known_track(frame.track)
+        if isinstance(frame, schema.TrackEndFrame):
+            player._on_track_ended(frame.track, frame.reason)
+            return TrackEndEvent(player=player, track=frame.track, source=source, reason=frame.reason)
+
+        if isinstance(frame, schema.TrackStartFrame):
+            return TrackStartEvent(player=player, track=frame.track, source=source)
+
+        if isinstance(frame, schema.TrackExceptionFrame):
+            return TrackExceptionEvent(player=player,
+                                       track=frame.track,
+                                       source=source,
+                                       exception={"severity": frame.exception.severity,
+                                                  "message": frame.exception.message,
+                                                  "cause": frame.exception.cause},
+                                       severity=frame.exception.severity,
+                                       message=frame.exception.message)
+
+        return TrackStuckEvent(player=player, track=frame.track, source=source, thresholdMs=frame.thresholdMs)
+
     async def send(self, data: dict) -> None:
         if self.is_connected():
             assert isinstance(self.websocket, aiohttp.ClientWebSocketResponse)
             logger.debug(f"Sending Payload:: {data}")
-            await self.websocket.send_str(_to_json(data))
+            frames_out = self.node.metrics.frames_out
+            op = data.get("op")
+            frames_out[op] = frames_out.get(op, 0) + 1
+            with tracing.span("lavacord.websocket.send", node=self.node.identifier, op=op):
+                await self._send_text(_to_json_bytes(data))
+
+    async def send_raw(self, data: bytes, *, op: str = "raw") -> None:
+        """Send an already serialised UTF-8 payload, ``op`` only labels the metrics."""
+        if self.is_connected():
+            assert isinstance(self.websocket, aiohttp.ClientWebSocketResponse)
+            logger.debug(f"Sending Payload:: {data}")
+            frames_out = self.node.metrics.frames_out
+            frames_out[op] = frames_out.get(op, 0) + 1
+            with tracing.span("lavacord.websocket.send", node=self.node.identifier, op=op):
+                await self._send_text(data)
+
+    async def _send_text(self, payload: bytes) -> None:
+        if _HAS_SEND_FRAME:
+            # The payload already is UTF-8, skip the decode/encode round trip of send_str.
+            await self.websocket.send_frame(payload, aiohttp.WSMsgType.TEXT)
+        else:
+            await self.websocket.send_str(payload.decode("utf-8"))
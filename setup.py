@@ -27,6 +27,11 @@ setup(
     keywords='lavalink, discord, discord-lavalink, lavacord.py',
     packages=["lavacord", "lavacord.types"],
     install_requires=["aiohttp", "hikari", "yarl", "tekore", "pydantic"],
+    extras_require={
+        "msgspec": ["msgspec"],
+        "orjson": ["orjson"],
+        "ujson": ["ujson"],
+    },
     project_urls={
         'Bug Reports': 'https://github.com/CraazzzyyFoxx/lavacord.py/issues',
         'Source': 'https://github.com/CraazzzyyFoxx/lavacord.py/',
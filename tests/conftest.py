@@ -0,0 +1,11 @@
+import pytest
+
+import lavacord
+
+
+@pytest.fixture(autouse=True)
+def clean_pool():
+    yield
+    lavacord.NodePool._nodes.clear()
+    lavacord.NodePool.events = lavacord.EventBus()
+    lavacord.set_tracer(None)
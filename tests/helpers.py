@@ -0,0 +1,78 @@
+import asyncio
+import typing as t
+
+import hikari
+import lavacord
+from lavacord.websocket import Websocket
+
+
+class FakeBot:
+    """The parts of :class:`hikari.GatewayBot` lavacord uses, recording what it dispatches."""
+
+    def __init__(self):
+        self.dispatched: t.List[hikari.Event] = []
+        self.voice_updates: t.List[t.Tuple[t.Any, ...]] = []
+
+    async def dispatch(self, event: hikari.Event) -> None:
+        self.dispatched.append(event)
+
+    async def update_voice_state(self, *args: t.Any, **kwargs: t.Any) -> None:
+        self.voice_updates.append(args)
+
+    def subscribe(self, *args: t.Any) -> None:
+        pass
+
+    def get_me(self):
+        class Me:
+            id = hikari.Snowflake(42)
+
+        return Me()
+
+
+class FakeWebsocket(Websocket):
+    """A websocket that records the payloads sent instead of sending them."""
+
+    def __init__(self, node: lavacord.Node):
+        super().__init__(node=node)
+        self.sent: t.List[t.Dict[str, t.Any]] = []
+
+    def is_connected(self) -> bool:
+        return True
+
+    async def send(self, data: dict) -> None:
+        frames_out = self.node.metrics.frames_out
+        frames_out[data["op"]] = frames_out.get(data["op"], 0) + 1
+        self.sent.append(data)
+
+    async def send_raw(self, data: bytes, *, op: str = "raw") -> None:
+        frames_out = self.node.metrics.frames_out
+        frames_out[op] = frames_out.get(op, 0) + 1
+        self.sent.append(lavacord.utils._from_json(data))
+
+    def ops(self) -> t.List[str]:
+        return [payload["op"] for payload in self.sent]
+
+
+def make_track(index: int, requester: int = 1, length: int = 100_000, cls=lavacord.YouTubeTrack) -> lavacord.Track:
+    return cls(track=f"track{index}", title=f"Title {index}", identifier=str(index), uri=f"https://example/{index}",
+               isSeekable=True, author="author", isStream=False, length=length, sourceName="youtube",
+               position=0, requester=hikari.Snowflake(requester))
+
+
+def make_node(identifier: str = "main") -> lavacord.Node:
+    node = lavacord.Node(FakeBot(), "localhost", 2333, "password", identifier=identifier)
+    node._websocket = FakeWebsocket(node)
+    lavacord.NodePool._nodes[identifier] = node
+    return node
+
+
+def make_player(node: lavacord.Node, guild_id: int = 1, cls=lavacord.BasePlayer, **kwargs: t.Any):
+    guild = hikari.Snowflake(guild_id)
+    player = cls(guild, hikari.Snowflake(10), node=node, **kwargs)
+    node._players[guild] = player
+    player._connected = True
+    return player
+
+
+def run(coro: t.Awaitable[t.Any]) -> t.Any:
+    return asyncio.run(coro)
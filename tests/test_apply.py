@@ -0,0 +1,71 @@
+import asyncio
+
+import hikari
+import pytest
+
+import lavacord
+from lavacord.ratelimit import RateLimiter
+from helpers import make_node, make_player, run
+
+
+def test_apply_bounds_concurrency_and_returns_errors_per_guild():
+    async def main():
+        node = make_node()
+        for guild in range(1, 7):
+            make_player(node, guild)
+
+        running = peak = 0
+
+        async def operation(player):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            if player.guild_id == 3:
+                raise RuntimeError("broken")
+            return int(player.guild_id) * 10
+
+        results = await node.apply(operation, lambda player: player.guild_id != 6, concurrency=2)
+        return results, peak
+
+    results, peak = run(main())
+    assert peak == 2
+    assert sorted(results) == [1, 2, 3, 4, 5]
+    assert isinstance(results[hikari.Snowflake(3)], RuntimeError)
+    assert results[hikari.Snowflake(5)] == 50
+
+
+def test_pool_apply_filters_nodes():
+    async def main():
+        first, second = make_node("first"), make_node("second")
+        make_player(first, 1)
+        make_player(second, 2)
+
+        async def volume(player):
+            await player.set_volume(30)
+            return player.volume
+
+        return await lavacord.NodePool.apply(volume, nodes=lambda node: node.identifier == "second"), first, second
+
+    results, first, second = run(main())
+    assert results == {hikari.Snowflake(2): 30}
+    assert first._websocket.sent == []
+    assert second._websocket.ops() == ["volume"]
+
+
+def test_rate_limiter_bucket():
+    limiter = RateLimiter(2, burst=2)
+    assert limiter.try_acquire() and limiter.try_acquire()
+    assert not limiter.try_acquire()
+
+    with pytest.raises(ValueError):
+        RateLimiter(0)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await limiter.acquire()
+        return loop.time() - started
+
+    assert run(main()) >= 0.2
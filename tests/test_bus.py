@@ -0,0 +1,143 @@
+import asyncio
+import logging
+
+import hikari
+import pytest
+
+import lavacord
+from helpers import make_node, make_player, run
+
+GUILD = hikari.Snowflake(1)
+OTHER = hikari.Snowflake(2)
+
+
+def _events():
+    player = make_player(make_node())
+    start = lavacord.TrackStartEvent(player=player, track="track1")
+    end = lavacord.TrackEndEvent(player=player, track="track1", reason="FINISHED")
+    return start, end
+
+
+def test_listeners_by_type_base_class_and_guild():
+    async def main():
+        bus = lavacord.EventBus()
+        start, end = _events()
+        received = []
+
+        async def on_any(event):
+            received.append(("any", type(event).__name__))
+
+        async def on_start(event):
+            received.append(("start", type(event).__name__))
+
+        async def on_other_guild(event):
+            received.append(("other", type(event).__name__))
+
+        bus.subscribe(lavacord.BaseTrackEvent, on_any)
+        bus.subscribe(lavacord.TrackStartEvent, on_start, guild_id=GUILD)
+        bus.subscribe(lavacord.TrackStartEvent, on_other_guild, guild_id=OTHER)
+
+        await bus.dispatch(start, GUILD)
+        await bus.dispatch(end, GUILD)
+        assert sorted(received) == [("any", "TrackEndEvent"), ("any", "TrackStartEvent"),
+                                    ("start", "TrackStartEvent")]
+
+        bus.unsubscribe(lavacord.BaseTrackEvent, on_any)
+        bus.unsubscribe(lavacord.TrackStartEvent, on_start, guild_id=GUILD)
+        bus.unsubscribe(lavacord.TrackStartEvent, on_other_guild, guild_id=OTHER)
+        assert len(bus) == 0 and bus._listeners == {}
+
+    run(main())
+
+
+def test_failing_listener_is_logged_and_others_still_run(caplog):
+    async def main():
+        bus = lavacord.EventBus()
+        start, _ = _events()
+        received = []
+
+        async def broken(event):
+            raise RuntimeError("boom")
+
+        async def working(event):
+            received.append(event)
+
+        bus.subscribe(lavacord.TrackStartEvent, broken)
+        bus.subscribe(lavacord.TrackStartEvent, working)
+        await bus.dispatch(start, GUILD)
+        return received
+
+    with caplog.at_level(logging.ERROR, logger="lavacord.bus"):
+        assert len(run(main())) == 1
+    assert "Listener broken failed on TrackStartEvent:: boom" in caplog.text
+
+
+def test_wait_for_matches_type_guild_and_predicate():
+    async def main():
+        bus = lavacord.EventBus()
+        start, end = _events()
+
+        any_track = asyncio.create_task(bus.wait_for(lavacord.BaseTrackEvent))
+        other_guild = asyncio.create_task(bus.wait_for(lavacord.TrackEndEvent, guild_id=OTHER))
+        finished = asyncio.create_task(bus.wait_for(
+            lavacord.TrackEndEvent, guild_id=GUILD,
+            predicate=lambda event: event.reason is lavacord.TrackEndReason.FINISHED))
+        await asyncio.sleep(0)
+
+        await bus.dispatch(start, GUILD)
+        assert await any_track is start
+        assert not finished.done()
+
+        await bus.dispatch(end, GUILD)
+        assert await finished is end
+        assert not other_guild.done()
+        assert list(bus._waiters) == [(lavacord.TrackEndEvent, OTHER)]
+
+        other_guild.cancel()
+        await asyncio.sleep(0)
+        assert bus._waiters == {}
+
+    run(main())
+
+
+def test_wait_for_timeout_and_predicate_errors_clean_up():
+    async def main():
+        bus = lavacord.EventBus()
+        start, _ = _events()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await bus.wait_for(lavacord.TrackStartEvent, timeout=0.01)
+        assert bus._waiters == {}
+
+        def broken(event):
+            raise ValueError("bad predicate")
+
+        waiting = asyncio.create_task(bus.wait_for(lavacord.TrackStartEvent, predicate=broken))
+        await asyncio.sleep(0)
+        await bus.dispatch(start, GUILD)
+        with pytest.raises(ValueError):
+            await waiting
+        assert bus._waiters == {}
+
+    run(main())
+
+
+def test_player_subscriptions_end_with_the_player():
+    async def main():
+        node = make_node()
+        player = make_player(node)
+        other = make_player(node, 2)
+        received = []
+
+        async def on_start(event):
+            received.append(event.player.guild_id)
+
+        player.subscribe(lavacord.TrackStartEvent, on_start)
+        await node._dispatch(lavacord.TrackStartEvent(player=other, track="track1"), other.guild_id)
+        await node._dispatch(lavacord.TrackStartEvent(player=player, track="track1"), player.guild_id)
+        assert received == [GUILD]
+
+        await player.destroy()
+        assert len(lavacord.NodePool.events) == 0
+
+    run(main())
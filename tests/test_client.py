@@ -0,0 +1,159 @@
+import asyncio
+import types
+
+import hikari
+import pytest
+
+import lavacord
+from helpers import FakeBot, make_node, make_player, run
+
+GUILD = hikari.Snowflake(1)
+ME = 42
+
+
+def _state(channel=10, session="session", user=ME):
+    state = types.SimpleNamespace(user_id=hikari.Snowflake(user), member=None, session_id=session,
+                                  channel_id=None if channel is None else hikari.Snowflake(channel))
+    return types.SimpleNamespace(state=state, guild_id=GUILD)
+
+
+def _server(endpoint="endpoint", token="token"):
+    return types.SimpleNamespace(guild_id=GUILD, token=token, raw_endpoint=endpoint)
+
+
+def test_wait_for_connection_resolves_once_both_halves_arrived():
+    async def main():
+        make_player(make_node())
+        client = lavacord.LavalinkClient(FakeBot())
+        waiting = asyncio.create_task(client.wait_for_connection(GUILD, timeout=1))
+        await asyncio.sleep(0)
+
+        await client._raw_voice_state_update(_state())
+        assert not waiting.done()
+        await client._raw_voice_server_update(_server())
+        player = await waiting
+
+        assert player.session_id == "session"
+        assert client._connection_waiters == {}
+        # Already connected, returns at once.
+        assert await client.wait_for_connection(GUILD, timeout=0) is player
+
+    run(main())
+
+
+def test_wait_for_connection_times_out_and_forgets_the_waiter():
+    async def main():
+        client = lavacord.LavalinkClient(FakeBot())
+        with pytest.raises(asyncio.TimeoutError):
+            await client.wait_for_connection(GUILD, timeout=0.01)
+        assert client._connection_waiters == {}
+
+    run(main())
+
+
+def test_wait_for_remove_connection():
+    async def main():
+        node = make_node()
+        make_player(node)
+        client = lavacord.LavalinkClient(FakeBot())
+
+        with pytest.raises(asyncio.TimeoutError):
+            await client.wait_for_remove_connection(GUILD, timeout=0.01)
+
+        waiting = asyncio.create_task(client.wait_for_remove_connection(GUILD, timeout=1))
+        await asyncio.sleep(0)
+        node._remove_player(GUILD)
+        await waiting
+
+        with pytest.raises(lavacord.NoMatchingNode):
+            await client.wait_for_remove_connection(GUILD)
+
+    run(main())
+
+
+def test_handshake_sends_one_voice_update():
+    async def main():
+        node = make_node()
+        player = make_player(node)
+        client = lavacord.LavalinkClient(FakeBot())
+
+        await client._raw_voice_server_update(_server())
+        assert node._websocket.sent == []
+        await client._raw_voice_state_update(_state())
+        await client._raw_voice_state_update(_state())
+        await client._raw_voice_server_update(_server())
+
+        assert node._websocket.ops() == ["voiceUpdate"]
+        assert node._websocket.sent[0] == {"op": "voiceUpdate", "guildId": "1", "sessionId": "session",
+                                           "event": {"token": "token", "guild_id": "1", "endpoint": "endpoint"}}
+        assert client.join_latency.count == 1
+
+        # A new voice server is sent again, without counting as a new join.
+        await client._raw_voice_server_update(_server(endpoint="other"))
+        assert node._websocket.ops() == ["voiceUpdate", "voiceUpdate"]
+        assert player._voice_server["endpoint"] == "other"
+        assert client.join_latency.count == 1
+
+    run(main())
+
+
+def test_halves_before_the_player_exists_are_buffered():
+    async def main():
+        node = make_node()
+        client = lavacord.LavalinkClient(FakeBot())
+        await client._raw_voice_state_update(_state(channel=11))
+        await client._raw_voice_server_update(_server())
+
+        player = make_player(node)
+        await client._flush_handshake(GUILD, player)
+        assert player.voice_channel_id == 11
+        assert node._websocket.ops() == ["voiceUpdate"]
+
+    run(main())
+
+
+def test_other_users_and_leaving_reset_the_handshake():
+    async def main():
+        node = make_node()
+        player = make_player(node)
+        client = lavacord.LavalinkClient(FakeBot())
+
+        await client._raw_voice_state_update(_state(user=7))
+        assert GUILD not in client._handshakes
+
+        await client._raw_voice_state_update(_state())
+        await client._raw_voice_server_update(_server())
+        await client._raw_voice_state_update(_state(channel=None, session=None))
+        assert GUILD not in client._handshakes
+        assert player.voice_channel_id is None
+
+        await client._raw_voice_state_update(_state(session="new"))
+        await client._raw_voice_server_update(_server())
+        assert node._websocket.ops() == ["voiceUpdate", "voiceUpdate"]
+        assert node._websocket.sent[-1]["sessionId"] == "new"
+
+    run(main())
+
+
+def test_rejoining_waits_for_the_new_voice_server():
+    async def main():
+        node = make_node()
+        player = make_player(node)
+        client = lavacord.LavalinkClient(FakeBot())
+
+        await client._raw_voice_state_update(_state())
+        await client._raw_voice_server_update(_server())
+        await client._raw_voice_state_update(_state(channel=None, session=None))
+        assert player._voice_server is None
+
+        await client._raw_voice_state_update(_state(session="new"))
+        waiting = asyncio.create_task(client.wait_for_connection(GUILD, timeout=1))
+        await asyncio.sleep(0)
+        assert not waiting.done()
+
+        await client._raw_voice_server_update(_server(endpoint="other"))
+        assert await waiting is player
+        assert player._voice_server["endpoint"] == "other"
+        assert node._websocket.sent[-1]["sessionId"] == "new"
+
+    run(main())
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+import lavacord
+from lavacord import schema
+from helpers import make_node, make_player, make_track, run
+
+
+def _process(node: lavacord.Node, frame: dict, *, typed: bool) -> None:
+    if typed:
+        if not schema.HAS_MSGSPEC:
+            pytest.skip("msgspec is not installed")
+        run(node._websocket.process_frame(json.dumps(frame)))
+    else:
+        run(node._websocket.process_data(frame))
+
+
+def _end(reason: str) -> dict:
+    return {"op": "event", "type": "TrackEndEvent", "guildId": "1", "track": "track1", "reason": reason}
+
+
+def _playing(**kwargs) -> lavacord.BasePlayer:
+    node = make_node()
+    node.dispatch_events = True
+    player = make_player(node, **kwargs)
+    run(player.play(make_track(1)))
+    player.queue.put(make_track(2))
+    node._websocket.sent.clear()
+    return player
+
+
+@pytest.mark.parametrize("typed", [False, True])
+def test_unknown_end_reason_is_still_dispatched(typed):
+    player = _playing(auto_advance=True)
+    _process(player.node, _end("SOMETHING_NEW"), typed=typed)
+
+    event, = player.node.bot.dispatched
+    assert isinstance(event, lavacord.TrackEndEvent)
+    assert event.reason is lavacord.TrackEndReason.UNKNOWN
+    assert player.source is None
+    # An unknown reason does not start the next track.
+    assert player.node._websocket.sent == []
+
+
+@pytest.mark.parametrize("typed", [False, True])
+def test_finished_track_advances_the_queue(typed):
+    player = _playing(auto_advance=True)
+    _process(player.node, _end("FINISHED"), typed=typed)
+
+    assert player.node.bot.dispatched[0].reason is lavacord.TrackEndReason.FINISHED
+    assert player.node._websocket.ops() == ["play"]
+    assert player.source.id == "track2"
+
+
+def test_end_reason_parse():
+    assert lavacord.TrackEndReason.parse("REPLACED") is lavacord.TrackEndReason.REPLACED
+    assert lavacord.TrackEndReason.parse("SOMETHING_NEW") is lavacord.TrackEndReason.UNKNOWN
+    assert not lavacord.TrackEndReason.UNKNOWN.may_start_next
+
+
+@pytest.mark.parametrize("typed", [False, True])
+def test_events_carry_the_known_track(typed):
+    player = _playing()
+    first = player.source
+    run(player.play(make_track(3)))
+    second = player.source
+
+    _process(player.node, {**_end("REPLACED"), "track": "track1"}, typed=typed)
+    # The end of the replaced track does not clear the track that replaced it.
+    assert player.source is second
+    _process(player.node, {"op": "event", "type": "TrackStartEvent", "guildId": "1", "track": "track3"}, typed=typed)
+    _process(player.node, {**_end("FINISHED"), "track": "unknown"}, typed=typed)
+
+    replaced, started, unknown = player.node.bot.dispatched
+    assert replaced.source is first
+    assert started.source is second
+    assert unknown.source is None
+    assert run(started.build_track()) is second
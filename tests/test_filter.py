@@ -0,0 +1,106 @@
+import json
+
+import pytest
+
+import lavacord
+from lavacord.exceptions import FiltersError
+from helpers import make_node, make_player, run
+
+
+def test_negative_zero_gains_equal_and_hash_like_zero():
+    flat = lavacord.Equalizer.flat()
+    negated = flat * -1
+
+    assert negated == flat
+    assert hash(negated) == hash(flat)
+    assert len({flat, negated}) == 1
+    assert {flat: "flat"}[negated] == "flat"
+
+
+def test_equal_gains_hash_alike():
+    gains = [0.1, 0.2, -0.1]
+    assert hash(lavacord.Equalizer(gains)) == hash(lavacord.Equalizer.from_bands({0: 0.1, 1: 0.2, 2: -0.1}))
+
+
+def test_gains_are_clamped_and_padded():
+    equalizer = lavacord.Equalizer([2.0, -1.0])
+    assert equalizer.gains == (1.0, -0.25) + (0.0,) * 13
+
+
+def test_too_many_bands_are_rejected():
+    with pytest.raises(FiltersError):
+        lavacord.Equalizer([0.0] * 16)
+    with pytest.raises(FiltersError):
+        lavacord.Equalizer.flat().with_band(15, 0.1)
+
+
+def test_arithmetic_and_blend():
+    low = lavacord.Equalizer.from_bands({0: 0.2})
+    high = lavacord.Equalizer.from_bands({0: 0.6, 1: 0.4})
+
+    assert (high - low)[0] == pytest.approx(0.4)
+    assert (low + low)[0] == pytest.approx(0.4)
+    assert low.blend(high, 0) == low
+    assert low.blend(high, 1) == high
+    assert low.blend(high, 0.5)[1] == pytest.approx(0.2)
+    assert low.diff(high) == {0: pytest.approx(0.4), 1: pytest.approx(0.4)}
+
+
+def test_payload_round_trip():
+    equalizer = lavacord.Equalizer.from_bands({3: 0.5})
+    assert lavacord.Equalizer.from_payload(equalizer.to_payload()) == equalizer
+
+
+def test_equalizer_is_immutable():
+    with pytest.raises(AttributeError):
+        lavacord.Equalizer.flat()._gains = None
+
+
+def test_filter_sets_compare_by_content():
+    built = lavacord.Filters(volume=0.5)
+    built.timescale(speed=1.2, pitch=1, rate=1)
+
+    preset = lavacord.FilterSet(timescale={"rate": 1, "pitch": 1, "speed": 1.2}, volume=0.5)
+    assert built.freeze() == preset
+    assert hash(built.freeze()) == hash(preset)
+    assert "op" not in preset.to_dict()
+    assert preset != lavacord.FilterSet(volume=0.5)
+
+
+def test_filter_set_is_immutable_and_copies_its_input():
+    payload = {"rotation": {"rotationHz": 0.2}}
+    preset = lavacord.FilterSet(payload)
+    payload["rotation"]["rotationHz"] = 5
+
+    assert preset.get("rotation") == {"rotationHz": 0.2}
+    preset.get("rotation")["rotationHz"] = 5
+    assert preset.get("rotation") == {"rotationHz": 0.2}
+    with pytest.raises(AttributeError):
+        preset.volume = 1
+
+
+def test_replace_and_diff():
+    preset = lavacord.FilterSet(volume=0.5, rotation={"rotationHz": 0.2})
+    changed = preset.replace(rotation=None, lowPass={"smoothing": 20})
+
+    assert "rotation" not in changed
+    assert changed.diff(preset) == {"rotation": None, "lowPass": {"smoothing": 20}}
+    assert preset.diff(None) == preset.to_dict()
+
+
+def test_frame_is_the_filters_op():
+    preset = lavacord.FilterSet(volume=0.5)
+    assert isinstance(preset._frame("1"), bytes)
+    assert json.loads(preset._frame("1")) == {"op": "filters", "guildId": "1", "volume": 0.5}
+    assert json.loads(lavacord.FilterSet()._frame("1")) == {"op": "filters", "guildId": "1"}
+
+
+def test_player_skips_equal_filters():
+    async def main():
+        player = make_player(make_node())
+        assert await player.set_filters(lavacord.FilterSet(volume=0.5))
+        assert not await player.set_filters(lavacord.Filters(volume=0.5))
+        assert await player.set_filters(lavacord.FilterSet(volume=0.6))
+        return player.node._websocket.ops()
+
+    assert run(main()) == ["filters", "filters"]
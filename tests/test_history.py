@@ -0,0 +1,55 @@
+import types
+
+import pytest
+
+import lavacord
+
+
+def _stats(players: int = 0, sent: int = 3000, nulled: int = 0, deficit: int = 0):
+    values = dict.fromkeys(lavacord.StatsHistory.COLUMNS, 0)
+    values.update(players=players, frames_sent=sent, frames_nulled=nulled, frames_deficit=deficit)
+    return types.SimpleNamespace(**values)
+
+
+def test_ring_keeps_the_latest_samples_in_order():
+    history = lavacord.StatsHistory(capacity=3)
+    for minute in range(5):
+        history.append(_stats(players=minute), at=minute * 60.0)
+
+    assert len(history) == 3
+    assert list(history.values("players")) == [2, 3, 4]
+    assert list(history.times()) == [120.0, 180.0, 240.0]
+    assert history.latest("players") == 4
+
+
+def test_window_counts_back_from_the_latest_sample():
+    history = lavacord.StatsHistory(capacity=4)
+    for minute in range(6):
+        history.append(_stats(players=minute), at=minute * 60.0)
+
+    assert list(history.values("players", seconds=60)) == [4, 5]
+    assert history.mean("players", seconds=60) == 4.5
+    assert history.max("players") == 5
+    assert history.percentile("players", 0.5) == pytest.approx(3.5)
+    assert history.percentile("players", 2) == 5
+
+
+def test_empty_history():
+    history = lavacord.StatsHistory()
+    assert history.latest("players") is None
+    assert history.mean("players") == 0.0
+    assert history.percentile("players", 0.9) == 0.0
+    assert history.deficit_rate() == 0.0
+
+    with pytest.raises(ValueError):
+        lavacord.StatsHistory(capacity=0)
+
+
+def test_deficit_rate_skips_unknown_samples_and_clamps_negative_deficits():
+    history = lavacord.StatsHistory()
+    history.append(_stats(sent=2900, nulled=0, deficit=100), at=0.0)
+    history.append(_stats(sent=-1, nulled=-1, deficit=-1), at=60.0)
+    history.append(_stats(sent=3010, nulled=0, deficit=-10), at=120.0)
+
+    assert history.deficit_rate() == pytest.approx(100 / (3000 + 3010))
+    assert history.deficit_rate(seconds=0) == 0.0
@@ -0,0 +1,137 @@
+import asyncio
+import types
+
+import hikari
+
+import lavacord
+from helpers import FakeBot, make_node, make_player, run
+
+
+def _ticked(wheel: lavacord.TimingWheel, ticks: int) -> None:
+    for _ in range(ticks):
+        wheel._advance()
+
+
+def test_timers_fire_on_their_tick_across_levels():
+    async def main():
+        wheel = lavacord.TimingWheel(slots=4, levels=2)
+        fired = []
+        for delay in (1, 3, 5, 16, 17, 40):
+            wheel.schedule(delay, lambda delay=delay: fired.append((delay, wheel._tick)))
+        wheel._task.cancel()
+        assert len(wheel) == 6
+
+        _ticked(wheel, 40)
+        return fired, len(wheel)
+
+    fired, pending = run(main())
+    assert fired == [(1, 1), (3, 3), (5, 5), (16, 16), (17, 17), (40, 40)]
+    assert pending == 0
+
+
+def test_cancelled_timers_do_not_fire():
+    async def main():
+        wheel = lavacord.TimingWheel(slots=4, levels=2)
+        fired = []
+        handle = wheel.schedule(2, fired.append, "cancelled")
+        wheel.schedule(2, fired.append, "kept")
+        wheel._task.cancel()
+
+        handle.cancel()
+        handle.cancel()
+        assert len(wheel) == 1
+        _ticked(wheel, 2)
+        return fired
+
+    assert run(main()) == ["kept"]
+
+
+def test_wheel_runs_on_its_own():
+    async def main():
+        wheel = lavacord.TimingWheel(resolution=0.01)
+        done = asyncio.get_running_loop().create_future()
+        wheel.schedule(0.02, done.set_result, True)
+        result = await asyncio.wait_for(done, 1)
+        wheel.close()
+        return result
+
+    assert run(main())
+
+
+def _voice(user: int, channel):
+    state = types.SimpleNamespace(user_id=hikari.Snowflake(user), member=None,
+                                  channel_id=None if channel is None else hikari.Snowflake(channel))
+    return types.SimpleNamespace(state=state, guild_id=hikari.Snowflake(1))
+
+
+def test_idle_player_is_paused_resumed_and_destroyed():
+    async def main():
+        node = make_node()
+        player = make_player(node)
+        client = lavacord.LavalinkClient(FakeBot())
+        manager = lavacord.IdleManager(client, pause_after=0.02, destroy_after=0.3,
+                                       wheel=lavacord.TimingWheel(resolution=0.01))
+        sent = node._websocket
+
+        await client._raw_voice_state_update(_voice(7, 10))
+        await lavacord.NodePool.events.dispatch(lavacord.TrackStartEvent(player=player, track="track1"), player.guild_id)
+        assert not manager.is_idle(player)
+
+        await client._raw_voice_state_update(_voice(7, None))
+        assert manager.is_idle(player)
+        await asyncio.sleep(0.1)
+        assert sent.ops() == ["pause"]
+
+        await client._raw_voice_state_update(_voice(7, 10))
+        assert sent.ops() == ["pause", "pause"]
+        assert not player.is_paused()
+
+        await client._raw_voice_state_update(_voice(7, None))
+        await asyncio.sleep(0.5)
+        manager.close()
+        return sent.ops()
+
+    assert run(main()) == ["pause", "pause", "pause", "destroy"]
+
+
+def test_replaced_track_keeps_the_player_busy():
+    async def main():
+        player = make_player(make_node())
+        client = lavacord.LavalinkClient(FakeBot())
+        manager = lavacord.IdleManager(client)
+        await client._raw_voice_state_update(_voice(7, 10))
+
+        await lavacord.NodePool.events.dispatch(lavacord.TrackStartEvent(player=player, track="track1"), player.guild_id)
+        await lavacord.NodePool.events.dispatch(
+            lavacord.TrackEndEvent(player=player, track="track1", reason="REPLACED"), player.guild_id)
+        assert not manager.is_idle(player)
+
+        await lavacord.NodePool.events.dispatch(
+            lavacord.TrackEndEvent(player=player, track="track2", reason="FINISHED"), player.guild_id)
+        assert manager.is_idle(player)
+        assert player.guild_id in manager._timers
+        manager.close()
+
+    run(main())
+
+
+def test_bot_moving_to_the_listeners_is_seen_by_the_idle_check():
+    async def main():
+        player = make_player(make_node())
+        client = lavacord.LavalinkClient(FakeBot())
+        manager = lavacord.IdleManager(client)
+        await client._raw_voice_state_update(_voice(7, 11))
+        await lavacord.NodePool.events.dispatch(lavacord.TrackStartEvent(player=player, track="track1"), player.guild_id)
+        assert manager.is_idle(player)
+        assert player.guild_id in manager._timers
+
+        moved = _voice(42, 11)
+        moved.state.session_id = "session"
+        await client._raw_voice_state_update(moved)
+
+        assert player.voice_channel_id == 11
+        assert not manager.is_idle(player)
+        assert player.guild_id not in manager._timers
+        manager.close()
+
+    run(main())
@@ -0,0 +1,142 @@
+import asyncio
+import json
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+import lavacord
+from helpers import FakeBot, FakeWebsocket, make_node, make_player, run
+
+
+def test_skew_is_the_fastest_frame_minus_half_the_round_trip():
+    tracker = lavacord.LagTracker()
+    assert tracker.skew is None
+
+    tracker.observe_rtt(0.2)
+    tracker.observe_update(100.0, 102.5)
+    tracker.observe_update(110.0, 112.3)
+
+    assert tracker.skew == pytest.approx(2.2)
+    # Each frame is measured against the skew known when it arrived: 2.4, then 2.2.
+    assert tracker.lag == pytest.approx(0.1)
+
+
+def test_lag_above_the_baseline_adds_a_penalty():
+    tracker = lavacord.LagTracker(recent=4, penalty_per_second=100)
+    for second in range(8):
+        tracker.observe_update(second, second + 1.0)
+    tracker.rotate()
+    assert tracker.penalty == 0
+
+    for second in range(4):
+        tracker.observe_update(second, second + 1.5)
+    assert tracker.lag == pytest.approx(0.5)
+    assert tracker.baseline == pytest.approx(0.0)
+    assert tracker.penalty == pytest.approx(50)
+
+
+def test_skew_follows_the_last_epochs_only():
+    tracker = lavacord.LagTracker(epochs=2)
+    tracker.observe_update(0, 5.0)
+    for _ in range(3):
+        tracker.rotate()
+        tracker.observe_update(0, 1.0)
+    assert tracker.skew == pytest.approx(1.0)
+
+
+def test_frames_are_measured_at_their_receive_time():
+    pytest.importorskip("msgspec")
+
+    async def main():
+        node = make_node()
+        player = make_player(node)
+
+        def frame(sent_at: float) -> str:
+            return json.dumps({"op": "playerUpdate", "guildId": "1",
+                               "state": {"time": int(sent_at * 1000), "position": 0, "connected": True}})
+
+        await node._websocket.process_frame(frame(1_000.0), 1_002.0)
+        await node._websocket.process_frame(frame(1_010.0), 1_012.5)
+        await node._websocket.process_data(json.loads(frame(1_020.0)), 1_022.25)
+        return node, player
+
+    node, player = run(main())
+    assert node.lag.skew == pytest.approx(2.0)
+    assert node.lag.histogram.count == 3
+    assert node.lag.lag == pytest.approx((0.0 + 0.5 + 0.25) / 3)
+    assert player.last_state.connected
+
+
+def test_probe_goes_through_the_rest_path():
+    class Recorder(lavacord.Tracer):
+        def __init__(self):
+            self.ended = []
+
+        def on_start(self, span):
+            pass
+
+        def on_end(self, span):
+            self.ended.append(span)
+
+    async def version(request: web.Request) -> web.Response:
+        assert request.headers["Authorization"] == "password"
+        return web.Response(text="3.7.0")
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/version", version)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        node = lavacord.Node(FakeBot(), "127.0.0.1", port, "password", identifier="main")
+        node._websocket = FakeWebsocket(node)
+        node._websocket.session = aiohttp.ClientSession()
+        try:
+            await node._probe()
+        finally:
+            await node._websocket.session.close()
+            await runner.cleanup()
+            await asyncio.sleep(0)
+        return node
+
+    tracer = Recorder()
+    lavacord.set_tracer(tracer)
+    node = run(main())
+
+    assert node.lag.rtt is not None
+    assert node.metrics.rest_latency["version"].count == 1
+    span, = tracer.ended
+    assert span.name == "lavacord.rest.version"
+    assert span.attributes["status"] == 200
+
+
+def test_probes_are_not_stacked_and_are_spaced_out():
+    async def main():
+        node = make_node()
+        probes = []
+
+        async def probe():
+            probes.append(True)
+            await asyncio.sleep(0.01)
+
+        node._probe = probe
+        node._schedule_probe()
+        node._schedule_probe()
+        await asyncio.sleep(0)
+        assert len(probes) == 1
+
+        await node._probe_task
+        node._schedule_probe()
+        await asyncio.sleep(0)
+        assert len(probes) == 1
+
+        node._probed_at -= node.PROBE_INTERVAL
+        node._schedule_probe()
+        await node._probe_task
+        return len(probes)
+
+    assert run(main()) == 2
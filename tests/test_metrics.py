@@ -0,0 +1,80 @@
+import asyncio
+import urllib.request
+
+import pytest
+
+import lavacord
+from helpers import make_node, make_player, run
+
+STATS = {"op": "stats", "players": 3, "playingPlayers": 2, "uptime": 1000,
+         "memory": {"free": 1, "used": 2, "allocated": 3, "reservable": 4},
+         "cpu": {"cores": 4, "systemLoad": 0.5, "lavalinkLoad": 0.25},
+         "frameStats": {"sent": 3000, "nulled": 0, "deficit": 0}}
+
+
+def _lines(text: str) -> set:
+    return set(text.splitlines())
+
+
+def test_render_node_gauges_and_counters():
+    async def main():
+        node = make_node('main "one"')
+        player = make_player(node)
+        await node._websocket.process_data(dict(STATS))
+        await player.set_volume(20)
+        node.metrics.observe_rest("loadtracks", 0.02)
+        node.metrics.observe_rest("loadtracks", 3.0)
+        return lavacord.render_metrics()
+
+    lines = _lines(run(main()))
+    label = 'node="main \\"one\\""'
+    assert f"lavacord_node_connected{{{label}}} 1" in lines
+    assert f"lavacord_node_local_players{{{label}}} 1" in lines
+    assert f"lavacord_node_players{{{label}}} 3" in lines
+    assert f"lavacord_node_system_load{{{label}}} 0.5" in lines
+    assert f'lavacord_websocket_frames_received_total{{{label},op="stats"}} 1' in lines
+    assert f'lavacord_websocket_frames_sent_total{{{label},op="volume"}} 1' in lines
+    assert f'lavacord_rest_request_seconds_bucket{{{label},endpoint="loadtracks",le="0.025"}} 1' in lines
+    assert f'lavacord_rest_request_seconds_bucket{{{label},endpoint="loadtracks",le="+Inf"}} 2' in lines
+    assert f'lavacord_rest_request_seconds_count{{{label},endpoint="loadtracks"}} 2' in lines
+    assert "# TYPE lavacord_rest_request_seconds histogram" in lines
+
+
+def test_penalty_components_add_up_to_the_load_penalty():
+    async def main():
+        node = make_node()
+        await node._websocket.process_data(dict(STATS))
+        return node, lavacord.render_metrics()
+
+    node, text = run(main())
+    components = [float(line.rsplit(" ", 1)[1]) for line in text.splitlines()
+                  if line.startswith("lavacord_node_penalty{")]
+    assert len(components) == 5
+    assert sum(components) == pytest.approx(node.penalty)
+    assert f'lavacord_node_load_penalty{{node="main"}} {node.penalty!r}' in _lines(text)
+
+
+def test_nodes_without_stats_only_render_local_metrics():
+    make_node()
+    text = lavacord.render_metrics()
+    assert 'lavacord_node_connected{node="main"} 1' in _lines(text)
+    assert "lavacord_node_players{" not in text
+    assert "lavacord_voice_join_seconds" not in text
+
+
+def test_metrics_server_serves_the_text_format():
+    async def main():
+        make_node()
+        server = lavacord.MetricsServer(port=0)
+        await server.start()
+        port = server._runner.addresses[0][1]
+        try:
+            loop = asyncio.get_running_loop()
+            with await loop.run_in_executor(None, urllib.request.urlopen, f"http://127.0.0.1:{port}/metrics") as resp:
+                return resp.headers["Content-Type"], resp.read().decode()
+        finally:
+            await server.close()
+
+    content_type, body = run(main())
+    assert content_type.startswith("text/plain; version=0.0.4")
+    assert 'lavacord_node_connected{node="main"} 1' in body
@@ -0,0 +1,154 @@
+import asyncio
+import logging
+import time
+import types
+
+import hikari
+
+import lavacord
+from helpers import make_node, make_player, make_track, run
+
+
+def _update(player: lavacord.BasePlayer, position: int) -> dict:
+    return {"op": "playerUpdate", "guildId": str(player.guild_id),
+            "state": {"time": int(time.time() * 1000), "position": position, "connected": True}}
+
+
+async def _near_end(player: lavacord.BasePlayer) -> None:
+    await player.node._websocket.process_data(_update(player, 98_000))
+    await asyncio.sleep(0)
+
+
+def test_prefetch_prepares_the_next_track_near_the_end():
+    async def main():
+        player = make_player(make_node(), prefetch_window=5)
+        await player.play(make_track(1))
+        player.queue.put(make_track(2))
+
+        await _near_end(player)
+        assert player._prefetched[0].identifier == "2"
+
+        player.node._websocket.sent.clear()
+        await player.play(player.queue.get())
+        # The prepared frame is sent as is.
+        assert player.node._websocket.sent[0]["track"] == "track2"
+        assert player._prefetched is None
+
+    run(main())
+
+
+def test_stale_prefetch_is_replaced_when_the_queue_changes():
+    async def main():
+        player = make_player(make_node(), prefetch_window=5)
+        await player.play(make_track(1))
+        player.queue.put(make_track(2))
+        await _near_end(player)
+
+        player.queue.put_at_front(make_track(3))
+        await _near_end(player)
+        assert player._prefetched[0].identifier == "3"
+
+    run(main())
+
+
+def _partial() -> lavacord.PartialTrack:
+    return lavacord.PartialTrack(title="Song", author="Artist", identifier="spotify-id", length=200_000,
+                                 requester=1, track_type="SpotifyTrack",
+                                 payload={"identifier": "spotify-id", "thumbnail_": "cover"})
+
+
+def _lavalink_search(node: lavacord.Node) -> list:
+    queries = []
+
+    async def loadtracks(query):
+        queries.append(query)
+        info = make_track(9).dict(by_alias=True, exclude={"id", "requester"})
+        info["length"] = 200_000
+        data = {"loadType": "SEARCH_RESULT", "tracks": [{"track": "resolved", "info": info}]}
+        return data, lavacord.LoadType.search_result
+
+    node._loadtracks = loadtracks
+    return queries
+
+
+def test_partial_track_is_searched_before_the_current_track_ends():
+    async def main():
+        player = make_player(make_node(), prefetch_window=5)
+        queries = _lavalink_search(player.node)
+        await player.play(make_track(1))
+        player.queue.put(_partial())
+
+        await _near_end(player)
+        await asyncio.sleep(0)
+        assert queries == ["ytmsearch:Song Artist"]
+        assert player.source.identifier == "1"
+
+        player.node._websocket.sent.clear()
+        playing = await player.play(player.queue.get())
+        assert isinstance(playing, lavacord.SpotifyTrack)
+        assert (playing.identifier, playing.thumbnail) == ("spotify-id", "cover")
+        assert player.node._websocket.sent[0]["track"] == "resolved"
+        assert len(queries) == 1
+
+    run(main())
+
+
+def test_partial_track_played_directly_is_resolved():
+    async def main():
+        player = make_player(make_node())
+        queries = _lavalink_search(player.node)
+        playing = await player.play(_partial())
+
+        assert queries == ["ytmsearch:Song Artist"]
+        assert player.source is playing
+        assert player.node._websocket.sent[0]["track"] == "resolved"
+
+    run(main())
+
+
+def test_spotify_album_queues_partial_tracks_without_searching():
+    class Spotify:
+        async def album(self, query):
+            artist = types.SimpleNamespace(name="Artist")
+            track = types.SimpleNamespace(name="Song", artists=[artist], id="spotify-id", duration_ms=200_000)
+            return types.SimpleNamespace(name="Album", uri="spotify:album:1", tracks=types.SimpleNamespace(items=[track]),
+                                         images=[types.SimpleNamespace(url="cover")])
+
+    async def main():
+        node = make_node()
+        queries = _lavalink_search(node)
+        node._spotify = Spotify()
+        album = await lavacord.SpotifyAlbum.search("1", hikari.Snowflake(1), node)
+
+        assert queries == []
+        assert [type(track) for track in album.tracks] == [lavacord.PartialTrack]
+        assert await album.tracks[0].resolve(node) is not None
+        assert queries == ["ytmsearch:Song Artist"]
+
+    run(main())
+
+
+def test_partial_track_round_trips_through_the_queue_storage_format():
+    track = _partial()
+    loaded = lavacord.Track.from_dict(track.to_dict())
+    assert isinstance(loaded, lavacord.PartialTrack)
+    assert (loaded.length, loaded.payload) == (track.length, track.payload)
+
+
+def test_failed_prefetch_is_logged(caplog):
+    class BrokenTrack(lavacord.YouTubeTrack):
+        async def resolve(self, node):
+            raise RuntimeError("cannot resolve")
+
+    async def main():
+        player = make_player(make_node(), prefetch_window=5)
+        await player.play(make_track(1))
+        player.queue.put(make_track(2, cls=BrokenTrack))
+        await _near_end(player)
+        await asyncio.sleep(0)
+        assert player._prefetched is None
+
+    with caplog.at_level(logging.ERROR, logger="lavacord.player"):
+        run(main())
+
+    assert "Prefetch failed:: cannot resolve" in caplog.text
@@ -0,0 +1,226 @@
+import asyncio
+
+import hikari
+import pytest
+
+import lavacord
+from helpers import make_track, run
+
+
+def _assert_index(queue: lavacord.BaseQueue) -> None:
+    expected = {}
+    for track in queue:
+        expected.setdefault(track.requester, []).append(track)
+    assert {requester: list(tracks) for requester, tracks in queue._requesters.items()} == expected
+
+
+def _queue(*requesters: int) -> lavacord.Queue:
+    queue = lavacord.Queue(max_size=None)
+    for index, requester in enumerate(requesters):
+        queue.put(make_track(index, requester))
+    return queue
+
+
+def test_requester_index_follows_every_change():
+    queue = _queue(1, 2, 1, 3, 2, 1)
+    _assert_index(queue)
+
+    queue.put_at_index(2, make_track(10, 3))
+    queue.put_at_front(make_track(11, 2))
+    _assert_index(queue)
+
+    del queue[4]
+    queue.get()
+    _assert_index(queue)
+
+    queue.remove_where(lambda track: track.identifier == "4")
+    _assert_index(queue)
+
+    assert queue.count_by_requester(hikari.Snowflake(1)) == 2
+    assert [track.identifier for track in queue.tracks_by_requester(hikari.Snowflake(3))] == ["10", "3"]
+
+
+def test_remove_by_requester_keeps_order_and_index():
+    queue = _queue(1, 2, 1, 3, 2, 1)
+
+    removed = queue.remove_by_requester(hikari.Snowflake(1))
+
+    assert [track.identifier for track in removed] == ["0", "2", "5"]
+    assert [track.identifier for track in queue] == ["1", "3", "4"]
+    assert queue.count_by_requester(hikari.Snowflake(1)) == 0
+    _assert_index(queue)
+
+
+def test_remove_by_requester_removes_repeated_tracks():
+    queue = _queue(2)
+    track = make_track(9, 1)
+    queue.put(track)
+    queue.put(track)
+
+    assert queue.remove_by_requester(hikari.Snowflake(1)) == [track, track]
+    assert len(queue) == 1
+    _assert_index(queue)
+
+
+def test_remove_by_requester_stops_after_the_last_match():
+    queue = _queue(1, 2, 1, 3, 3)
+    tail = [queue[3], queue[4]]
+
+    class Guarded(type(queue._queue)):
+        def popleft(self):
+            item = super().popleft()
+            assert item not in tail, "walked past the requester's last track"
+            return item
+
+    queue._queue = Guarded(queue._queue)
+    removed = queue.remove_by_requester(hikari.Snowflake(1))
+
+    assert [track.identifier for track in removed] == ["0", "2"]
+    assert [track.identifier for track in queue] == ["1", "3", "4"]
+    _assert_index(queue)
+
+
+def test_remove_by_unknown_requester_changes_nothing():
+    queue = _queue(1, 2)
+    assert queue.remove_by_requester(hikari.Snowflake(7)) == []
+    assert len(queue) == 2
+
+
+@pytest.mark.parametrize("size", [1, 3])
+def test_pages_cover_the_queue(size):
+    queue = _queue(*[1] * 7)
+    pages = [queue.page(number, size) for number in range(queue.page_count(size))]
+
+    assert sum(pages, []) == [str(track) for track in queue]
+    assert queue.page(-1, size) == pages[-1]
+    assert queue.page(queue.page_count(size), size) == []
+
+
+def test_page_size_must_be_positive():
+    with pytest.raises(ValueError):
+        _queue(1).page(0, 0)
+
+
+def test_round_trip_keeps_tracks_and_history():
+    queue = _queue(1, 2, 3)
+    queue.get()
+    queue.set_repeat_mode("ALL")
+
+    loaded = lavacord.Queue.from_dict(queue.to_dict())
+
+    assert [track.identifier for track in loaded] == ["1", "2"]
+    assert loaded.current_track.identifier == "0"
+    assert loaded.repeat_mode == lavacord.RepeatMode.ALL
+    _assert_index(loaded)
+
+
+def _fair(*requesters: int, **kwargs) -> lavacord.FairQueue:
+    queue = lavacord.FairQueue(max_size=None, **kwargs)
+    for index, requester in enumerate(requesters):
+        queue.put(make_track(index, requester))
+    return queue
+
+
+def _order(queue) -> list:
+    return [track.identifier for track in queue]
+
+
+def test_fair_queue_takes_turns_between_requesters():
+    queue = _fair(1, 1, 1, 2, 2, 3)
+
+    assert _order(queue) == ["0", "3", "5", "1", "4", "2"]
+    assert [queue.get().identifier for _ in range(len(queue))] == ["0", "3", "5", "1", "4", "2"]
+
+
+def test_fair_queue_ends_are_read_without_walking_the_order(monkeypatch):
+    queue = _fair(1, 1, 1, 2, 2, 3, 3, weights={hikari.Snowflake(1): 2})
+    order = _order(queue)
+
+    def walk(self):
+        raise AssertionError("walked the interleaved order")
+
+    monkeypatch.setattr(lavacord.FairDeque, "__iter__", walk)
+
+    assert queue.peek_next_track().identifier == order[0]
+    assert queue[-1].identifier == order[-1]
+    assert [queue.pop().identifier for _ in range(len(order))] == order[::-1]
+
+
+def test_fair_queue_weights():
+    queue = _fair(1, 1, 1, 1, 2, 2, weights={hikari.Snowflake(1): 2})
+
+    assert _order(queue) == ["0", "1", "4", "2", "3", "5"]
+
+
+def test_fair_queue_front_insert_and_requester_removal():
+    queue = _fair(1, 1, 2, 2)
+    queue.put_at_front(make_track(9, 2))
+    assert _order(queue) == ["9", "0", "2", "1", "3"]
+
+    assert [track.identifier for track in queue.remove_by_requester(hikari.Snowflake(2))] == ["9", "2", "3"]
+    assert _order(queue) == ["0", "1"]
+    _assert_index(queue)
+
+
+def test_fair_queue_round_trip_keeps_weights():
+    queue = _fair(1, 1, 2, weights={hikari.Snowflake(1): 3}, default_weight=2)
+    loaded = lavacord.FairQueue.from_dict(queue.to_dict())
+
+    assert _order(loaded) == _order(queue)
+    assert loaded._queue.weights == {hikari.Snowflake(1): 3}
+    assert loaded._queue.default_weight == 2
+
+
+def test_wait_get_wakes_up_on_put():
+    async def main():
+        queue = _queue()
+        waiting = asyncio.create_task(queue.wait_get())
+        await asyncio.sleep(0)
+        assert not waiting.done()
+
+        queue.put(make_track(1))
+        return (await waiting).identifier
+
+    assert run(main()) == "1"
+
+
+def test_wait_get_times_out_and_forgets_the_waiter():
+    async def main():
+        queue = _queue()
+        with pytest.raises(asyncio.TimeoutError):
+            await queue.wait_get(timeout=0.01)
+        assert not queue._waiters
+
+    run(main())
+
+
+def test_cancelled_waiter_passes_the_wakeup_on():
+    async def main():
+        queue = _queue()
+        first = asyncio.create_task(queue.wait_get())
+        second = asyncio.create_task(queue.wait_get())
+        await asyncio.sleep(0)
+
+        queue.put(make_track(1))
+        first.cancel()
+        return (await second).identifier
+
+    assert run(main()) == "1"
+
+
+def test_track_text_is_cached_until_a_field_changes():
+    track = make_track(1)
+    assert str(track) is str(track)
+
+    track.title = "Renamed"
+    assert "Renamed" in str(track)
+    assert str(_queue(1, 2)).count("Title") == 2
+
+
+def test_track_copy_with_update_renders_the_new_fields():
+    track = make_track(1)
+    str(track)
+
+    renamed = track.copy(update={"title": "Renamed"})
+    assert "Renamed" in str(renamed)
+    assert "Renamed" not in str(track)
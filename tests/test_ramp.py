@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+import lavacord
+from lavacord import ramp
+from helpers import make_node, make_player, run
+
+
+def _volumes(player) -> list:
+    return [payload["volume"] for payload in player.node._websocket.sent if payload["op"] == "volume"]
+
+
+def test_fade_reaches_the_target_within_the_frame_budget():
+    async def main():
+        scheduler = lavacord.RampScheduler(player_fps=50)
+        player = make_player(make_node())
+        reached = await scheduler.fade_volume(player, 0, 0.1)
+        return reached, player
+
+    reached, player = run(main())
+    volumes = _volumes(player)
+    assert reached
+    assert player.volume == 0
+    assert volumes[-1] == 0
+    assert volumes == sorted(volumes, reverse=True)
+    # 0.1 s at 50 frames per second, plus the first and last frame.
+    assert 2 <= len(volumes) <= 8
+
+
+def test_a_new_fade_replaces_the_previous_one():
+    async def main():
+        scheduler = lavacord.RampScheduler(player_fps=50)
+        player = make_player(make_node())
+        first = scheduler.fade_volume(player, 0, 10)
+        second = scheduler.fade_volume(player, 200, 0.05)
+        return await first, await second, player.volume
+
+    assert run(main()) == (False, True, 200)
+
+
+def test_ramp_of_a_removed_player_stops():
+    async def main():
+        scheduler = lavacord.RampScheduler(player_fps=50)
+        node = make_node()
+        player = make_player(node)
+        fading = scheduler.fade_volume(player, 0, 10)
+        await asyncio.sleep(0.05)
+        node._remove_player(player.guild_id)
+        return await asyncio.wait_for(fading, 1), len(scheduler)
+
+    assert run(main()) == (False, 0)
+
+
+def test_filter_ramp_ends_on_the_exact_target():
+    async def main():
+        scheduler = lavacord.RampScheduler(player_fps=50)
+        player = make_player(make_node())
+        target = lavacord.FilterSet(timescale={"speed": 1.5, "pitch": 1.0, "rate": 1.0})
+        assert await scheduler.ramp_filters(player, target, 0.05)
+        return player, target
+
+    player, target = run(main())
+    assert player.filters == target
+    assert player.node._websocket.ops()[-1] == "filters"
+
+
+def test_filters_fade_from_and_to_neutral_settings():
+    start = {"volume": 0.5, "rotation": {"rotationHz": 0.4}}
+    end = {"volume": 1.0, "timescale": {"speed": 2.0, "pitch": 1.0, "rate": 1.0}, "lowPass": {"smoothing": 20}}
+
+    halfway = ramp._lerp_filters(start, end, 0.5)
+
+    assert halfway["volume"] == pytest.approx(0.75)
+    assert halfway["rotation"] == {"rotationHz": pytest.approx(0.2)}
+    assert halfway["timescale"] == {"speed": pytest.approx(1.5), "pitch": 1.0, "rate": 1.0}
+    # No neutral setting is known, the filter switches at once.
+    assert halfway["lowPass"] == {"smoothing": 20}
+
+
+def test_easings():
+    assert lavacord.linear(0.3) == 0.3
+    assert lavacord.ease_in_out(0) == 0 and lavacord.ease_in_out(1) == 1
+    assert lavacord.ease_in_out(0.25) < 0.25 and lavacord.ease_in_out(0.75) > 0.75
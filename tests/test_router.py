@@ -0,0 +1,69 @@
+import hikari
+import pytest
+
+import lavacord
+from lavacord import router
+from helpers import run
+
+
+@pytest.mark.parametrize("query, resolver", [
+    ("never gonna give you up", router._search_youtube),
+    ("https://www.youtube.com/watch?v=abc", router._search_youtube),
+    ("https://youtu.be/abc", router._search_youtube),
+    ("https://m.youtube.com/watch?v=abc&list=PL1", router._youtube_playlist),
+    ("https://music.youtube.com/watch?v=abc", router._youtube_music_track),
+    ("https://music.youtube.com/playlist?list=PL1", router._youtube_music_playlist),
+    ("https://open.spotify.com/track/123", router._spotify_track),
+    ("https://open.spotify.com/intl-de/album/123", router._spotify_album),
+    ("https://open.spotify.com/playlist/123", router._spotify_playlist),
+    ("https://WWW.Twitch.tv/someone", router._twitch),
+    ("https://soundcloud.com/artist/sets/album", router._soundcloud_playlist),
+    ("https://soundcloud.com/artist/song", router._soundcloud_track),
+])
+def test_default_routes(query, resolver):
+    assert router.default_router.match(query)[0] is resolver
+
+
+@pytest.mark.parametrize("query", [
+    "https://example.com/song.mp3",
+    "https://open.spotify.com/artist/123",
+])
+def test_unhandled_urls_have_no_resolver(query):
+    resolver, url = router.default_router.match(query)
+    assert resolver is None
+    assert url is not None
+
+
+def test_register_order_first_and_unregister():
+    source = lavacord.SourceRouter()
+
+    async def generic(query, url, requester, node):
+        return "generic"
+
+    async def specific(query, url, requester, node):
+        return "specific"
+
+    source.register("www.example.com", generic)
+    source.register("example.com", specific, path=r"^/special/", first=True)
+
+    assert source.match("https://example.com/special/1")[0] is specific
+    assert source.match("https://www.example.com/other")[0] is generic
+    assert run(source.resolve("https://example.com/special/1", hikari.Snowflake(1), None)) == "specific"
+
+    source.unregister("example.com", specific)
+    assert source.match("https://example.com/special/1")[0] is generic
+    source.unregister("example.com")
+    assert source.hosts == []
+    assert source.match("https://example.com/other")[0] is None
+
+
+def test_query_routes_need_the_parameter():
+    source = lavacord.SourceRouter()
+
+    @source.route("example.com", query="list")
+    async def playlist(query, url, requester, node):
+        return url.query["list"]
+
+    assert source.match("https://example.com/watch?v=1")[0] is None
+    assert run(source.resolve("https://example.com/watch?list=PL1", hikari.Snowflake(1), None)) == "PL1"
+    assert run(source.resolve("plain text", hikari.Snowflake(1), None)) is None
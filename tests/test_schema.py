@@ -0,0 +1,108 @@
+import attrs
+import pytest
+
+from helpers import make_node, make_player, run
+from lavacord import schema
+from lavacord.utils import _from_json
+
+msgspec = pytest.importorskip("msgspec")
+
+TRACK = "QAAAjQIAJVJpY2sgQXN0bGV5"
+
+
+def test_player_update_and_stats_decode_to_their_structs():
+    update = schema.decode('{"op":"playerUpdate","guildId":"1","state":{"time":5,"position":10,"connected":true}}')
+    assert isinstance(update, schema.PlayerUpdateFrame)
+    assert update.state.position == 10
+
+    stats = schema.decode('{"op":"stats","players":1,"playingPlayers":0,"uptime":3,'
+                          '"memory":{"free":1,"used":2,"allocated":3,"reservable":4},'
+                          '"cpu":{"cores":2,"systemLoad":0.5,"lavalinkLoad":0.1}}')
+    assert isinstance(stats, schema.StatsFrame)
+    assert stats.frameStats is None
+
+
+@pytest.mark.parametrize("raw, cls, fields", [
+    ('{"op":"event","type":"TrackStartEvent","guildId":"1","track":"%s"}' % TRACK,
+     "TrackStartFrame", {"track": TRACK}),
+    ('{"op":"event","type":"TrackEndEvent","guildId":"1","track":"%s","reason":"FINISHED"}' % TRACK,
+     "TrackEndFrame", {"reason": "FINISHED"}),
+    ('{"op":"event","type":"TrackStuckEvent","guildId":"1","track":"%s","thresholdMs":100}' % TRACK,
+     "TrackStuckFrame", {"thresholdMs": 100}),
+    ('{"op":"event","type":"WebSocketClosedEvent","guildId":"1","code":4006,"reason":"x","byRemote":true}',
+     "WebSocketClosedFrame", {"code": 4006, "byRemote": True}),
+])
+def test_events_decode_to_the_struct_of_their_type(raw, cls, fields):
+    frame = schema.decode(raw)
+    assert type(frame) is getattr(schema, cls)
+    for name, value in fields.items():
+        assert getattr(frame, name) == value
+
+
+def test_exception_event_keeps_the_nested_exception():
+    frame = schema.decode('{"op":"event","type":"TrackExceptionEvent","guildId":"1","track":"%s",'
+                          '"exception":{"severity":"COMMON","message":"boom"}}' % TRACK)
+    assert frame.exception.severity == "COMMON"
+    assert frame.exception.cause is None
+
+
+def test_unhandled_ops_and_events_are_ignored():
+    assert schema.decode('{"op":"unknown"}') is None
+    assert schema.decode('{"op":"event","type":"SegmentsLoaded","guildId":"1"}') is None
+
+
+@pytest.mark.parametrize("raw", [
+    '{"op":"playerUpdate","guildId":1}',
+    '{"op":"event","type":"TrackEndEvent","guildId":"1","track":"%s"}' % TRACK,
+    '{"op":"event","type":"TrackExceptionEvent","guildId":"1","track":"%s"}' % TRACK,
+    '{"op":"event","type":"WebSocketClosedEvent","guildId":"1","code":4006}',
+])
+def test_invalid_known_frame_raises(raw):
+    with pytest.raises(msgspec.ValidationError):
+        schema.decode(raw)
+
+
+def test_invalid_frame_is_dropped_before_any_event():
+    async def main():
+        node = make_node()
+        make_player(node)
+        await node._websocket.process_frame('{"op":"event","type":"TrackEndEvent","guildId":"1","track":"%s"}'
+                                            % TRACK)
+        return node.bot.dispatched
+
+    assert run(main()) == []
+
+
+def _events(process: str):
+    frames = [
+        '{"op":"event","type":"TrackStartEvent","guildId":"1","track":"%s"}' % TRACK,
+        '{"op":"event","type":"TrackExceptionEvent","guildId":"1","track":"%s",'
+        '"exception":{"severity":"COMMON","message":"boom","cause":"x"}}' % TRACK,
+        '{"op":"event","type":"TrackStuckEvent","guildId":"1","track":"%s","thresholdMs":100}' % TRACK,
+        '{"op":"event","type":"TrackEndEvent","guildId":"1","track":"%s","reason":"FINISHED"}' % TRACK,
+        '{"op":"event","type":"WebSocketClosedEvent","guildId":"1","code":4006,"reason":"x","byRemote":true}',
+    ]
+
+    async def main():
+        node = make_node()
+        make_player(node)
+        for raw in frames:
+            if process == "frame":
+                await node._websocket.process_frame(raw)
+            else:
+                await node._websocket.process_data(_from_json(raw))
+        return node.bot.dispatched
+
+    return run(main())
+
+
+def test_typed_and_generic_paths_build_the_same_events():
+    typed, generic = _events("frame"), _events("data")
+    assert [type(event) for event in typed] == [type(event) for event in generic]
+    for left, right in zip(typed, generic):
+        assert _fields(left) == _fields(right)
+
+
+def _fields(event) -> dict:
+    return {field.name: getattr(event, field.name) for field in attrs.fields(type(event))
+            if field.name not in ("player", "app")}
@@ -0,0 +1,82 @@
+import asyncio
+import json
+
+import pytest
+from aiohttp import WSMsgType, web
+
+import lavacord
+from lavacord import utils
+from helpers import FakeBot, run
+
+PAYLOAD = {"op": "play", "guildId": "1", "track": "QAAAjQIAJVJpY2sgQXN0bGV5", "title": "Café ☕", "volume": 0.5}
+
+
+@pytest.fixture
+def serializer():
+    previous = utils.get_serializer()
+    yield
+    utils.set_serializer(previous)
+
+
+@pytest.mark.parametrize("name", list(utils.SERIALIZERS))
+def test_backends_round_trip(name):
+    backend = utils.SERIALIZERS[name]()
+
+    assert backend.loads(backend.dumps(PAYLOAD)) == PAYLOAD
+    assert backend.loads(backend.dumps_str(PAYLOAD)) == PAYLOAD
+    assert backend.dumps(PAYLOAD) == backend.dumps_str(PAYLOAD).encode("utf-8")
+    assert json.loads(backend.dumps(PAYLOAD)) == PAYLOAD
+
+
+def test_set_serializer_by_name_or_instance(serializer):
+    utils.set_serializer("json")
+    assert utils.get_serializer().name == "json"
+
+    class Custom(utils.Serializer):
+        name = "custom"
+
+    utils.set_serializer(Custom())
+    assert utils._to_json({"a": 1}) == '{"a":1}'
+    assert utils.get_serializer().name == "custom"
+
+    with pytest.raises(ValueError):
+        utils.set_serializer("missing")
+
+
+def test_frames_are_sent_as_text():
+    received = []
+
+    async def handler(request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        async for msg in ws:
+            received.append(msg)
+        return ws
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        node = lavacord.Node(FakeBot(), "127.0.0.1", port, "password", identifier="main")
+        try:
+            await node.connect()
+            await node._websocket.send(PAYLOAD)
+            await node._websocket.send_raw(lavacord.FilterSet(volume=0.5)._frame("1"), op="filters")
+            await asyncio.sleep(0.05)
+        finally:
+            node._websocket.listener.cancel()
+            await node._websocket.websocket.close()
+            await node._websocket.session.close()
+            await runner.cleanup()
+            await asyncio.sleep(0)
+
+    run(main())
+    assert [msg.type for msg in received] == [WSMsgType.TEXT, WSMsgType.TEXT, WSMsgType.TEXT]
+    assert json.loads(received[0].data)["op"] == "configureResuming"
+    assert json.loads(received[1].data) == PAYLOAD
+    assert json.loads(received[2].data) == {"op": "filters", "guildId": "1", "volume": 0.5}
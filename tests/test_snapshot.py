@@ -0,0 +1,134 @@
+import asyncio
+from typing import Optional
+
+from aiohttp import web
+
+import lavacord
+from helpers import FakeBot, FakeWebsocket, make_node, make_player, make_track, run
+
+
+def _playing_snapshot() -> lavacord.Snapshot:
+    async def capture():
+        node = make_node()
+        player = make_player(node)
+        await player.play(make_track(1))
+        await player.set_volume(50)
+        await player.set_filters(lavacord.FilterSet(volume=0.8))
+        player.session_id = "session"
+        player._voice_server = {"token": "token", "endpoint": "endpoint"}
+        player.queue.put(make_track(2))
+        return lavacord.Snapshot.capture()
+
+    snapshot = run(capture())
+    lavacord.NodePool._nodes.clear()
+    return snapshot
+
+
+def test_save_and_load_round_trip(tmp_path):
+    snapshot = _playing_snapshot()
+    path = tmp_path / "players.json"
+    snapshot.save(path)
+
+    loaded = lavacord.Snapshot.load(path)
+    assert len(loaded) == 1
+    assert loaded.resume_key("main") == snapshot.resume_key("main")
+
+
+def _restore(snapshot: lavacord.Snapshot, *, resumed: bool, same_key: bool = True):
+    async def restore():
+        node = lavacord.Node(FakeBot(), "localhost", 2333, "password", identifier="main",
+                             resume_key=snapshot.resume_key("main") if same_key else None)
+        node._websocket = FakeWebsocket(node)
+        node._websocket.resumed = resumed
+        lavacord.NodePool._nodes["main"] = node
+        players = await snapshot.restore(cls=lavacord.BasePlayer)
+        return node, players
+
+    return run(restore())
+
+
+def test_resumed_session_only_reattaches_locally():
+    node, players = _restore(_playing_snapshot(), resumed=True)
+
+    assert node._websocket.sent == []
+    player = players[0]
+    assert node.get_player(player.guild_id) is player
+    assert player.source.id == "track1"
+    assert player.volume == 50
+    assert player.filters == lavacord.FilterSet(volume=0.8)
+    assert len(player.queue) == 1
+
+
+def test_matching_key_without_resumed_session_sends_everything_again():
+    node, players = _restore(_playing_snapshot(), resumed=False)
+
+    assert node._websocket.ops() == ["voiceUpdate", "volume", "filters", "play"]
+    assert node._websocket.sent[-1]["track"] == "track1"
+    assert players[0].source.id == "track1"
+
+
+def test_other_resume_key_sends_everything_again():
+    node, _ = _restore(_playing_snapshot(), resumed=True, same_key=False)
+
+    assert "play" in node._websocket.ops()
+
+
+def test_failed_restore_does_not_leave_the_player_registered():
+    class BrokenPlayer(lavacord.BasePlayer):
+        async def _restore(self, data, *, resumed):
+            raise RuntimeError("broken")
+
+    snapshot = _playing_snapshot()
+
+    async def restore():
+        node = make_node()
+        players = await snapshot.restore(cls=BrokenPlayer)
+        return node, players
+
+    node, players = run(restore())
+    assert players == []
+    assert node.players == {}
+
+
+def _lavalink(resumed: Optional[str]):
+    async def handler(request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        if resumed is not None:
+            ws.headers["Session-Resumed"] = resumed
+        await ws.prepare(request)
+        async for _ in ws:
+            pass
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/", handler)
+    return app
+
+
+def _connect(resumed: Optional[str]) -> bool:
+    async def connect():
+        runner = web.AppRunner(_lavalink(resumed))
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        node = lavacord.Node(FakeBot(), "127.0.0.1", port, "password", identifier="main")
+        try:
+            await node.connect()
+            return node.resumed
+        finally:
+            node._websocket.listener.cancel()
+            await node._websocket.websocket.close()
+            await node._websocket.session.close()
+            await runner.cleanup()
+            await asyncio.sleep(0)
+
+    return run(connect())
+
+
+def test_node_reads_the_session_resumed_header():
+    assert _connect("true") is True
+    assert _connect("false") is False
+    assert _connect(None) is False
+
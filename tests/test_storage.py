@@ -0,0 +1,174 @@
+import asyncio
+
+import hikari
+
+import lavacord
+from helpers import make_node, make_player, make_track, run
+
+GUILD = hikari.Snowflake(1)
+
+
+class MemoryStorage(lavacord.QueueStorage):
+    """Stores queues in a dict, saves wait for ``gate`` when it is set."""
+
+    def __init__(self):
+        self.data = {}
+        self.saves = 0
+        self.gate = None
+
+    async def load(self, guild_id):
+        return self.data.get(guild_id)
+
+    async def save(self, guild_id, data):
+        self.saves += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        self.data[guild_id] = data
+
+    async def delete(self, guild_id):
+        self.data.pop(guild_id, None)
+
+
+def _cache(storage):
+    return lavacord.QueueCache(storage, flush_interval=3600, idle_timeout=3600)
+
+
+def test_only_changed_queues_are_written():
+    async def main():
+        storage = MemoryStorage()
+        cache = _cache(storage)
+        await cache.get(GUILD)
+        await cache.flush()
+        assert storage.saves == 0
+
+        (await cache.get(GUILD)).put(make_track(1))
+        await cache.flush()
+        await cache.flush()
+        assert storage.saves == 1
+        assert len(lavacord.Queue.from_dict(storage.data[GUILD])) == 1
+
+        (await cache.get(GUILD)).get()
+        await cache.flush()
+        assert storage.saves == 2
+        assert len(storage.data[GUILD]["history"]) == 1
+
+    run(main())
+
+
+def test_mark_dirty_writes_tracks_edited_in_place():
+    async def main():
+        storage = MemoryStorage()
+        cache = _cache(storage)
+        queue = await cache.get(GUILD)
+        queue.put(make_track(1))
+        await cache.flush()
+
+        queue[0].title = "Renamed"
+        cache.mark_dirty(GUILD)
+        await cache.flush()
+        assert storage.data[GUILD]["tracks"][0]["title"] == "Renamed"
+
+    run(main())
+
+
+def test_idle_eviction_keeps_queues_held_by_players():
+    async def main():
+        cache = lavacord.QueueCache(MemoryStorage(), flush_interval=3600, idle_timeout=-1)
+        player = make_player(make_node())
+        player.queue = await cache.get(GUILD)
+        await cache.get(hikari.Snowflake(2))
+
+        await cache._evict_idle()
+        assert GUILD in cache
+        assert hikari.Snowflake(2) not in cache
+
+    run(main())
+
+
+def test_evict_then_get_loads_the_saved_queue():
+    async def main():
+        storage = MemoryStorage()
+        cache = _cache(storage)
+        (await cache.get(GUILD)).put(make_track(1))
+        await cache.evict(GUILD)
+        assert GUILD not in cache
+
+        assert len(await cache.get(GUILD)) == 1
+
+    run(main())
+
+
+def test_change_during_evict_keeps_the_queue():
+    async def main():
+        storage = MemoryStorage()
+        cache = _cache(storage)
+        queue = await cache.get(GUILD)
+        storage.gate = asyncio.Event()
+
+        evicting = asyncio.create_task(cache.evict(GUILD))
+        await asyncio.sleep(0)
+        queue.put(make_track(1))
+        storage.gate.set()
+        await evicting
+
+        assert GUILD in cache
+        await cache.flush()
+        assert len(lavacord.Queue.from_dict(storage.data[GUILD])) == 1
+
+    run(main())
+
+
+def test_get_during_evict_keeps_the_queue():
+    async def main():
+        storage = MemoryStorage()
+        cache = _cache(storage)
+        queue = await cache.get(GUILD)
+        storage.gate = asyncio.Event()
+
+        evicting = asyncio.create_task(cache.evict(GUILD))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+        assert await cache.get(GUILD) is queue
+        storage.gate.set()
+        await evicting
+
+        assert GUILD in cache
+
+    run(main())
+
+
+def test_failed_evict_stays_dirty():
+    class FailingStorage(MemoryStorage):
+        async def save(self, guild_id, data):
+            raise OSError("disk full")
+
+    async def main():
+        cache = _cache(FailingStorage())
+        await cache.get(GUILD)
+        try:
+            await cache.evict(GUILD)
+        except OSError:
+            pass
+        assert GUILD in cache
+        assert GUILD in cache._dirty
+
+    run(main())
+
+
+def test_concurrent_gets_load_once():
+    class CountingStorage(MemoryStorage):
+        loads = 0
+
+        async def load(self, guild_id):
+            self.loads += 1
+            await asyncio.sleep(0)
+            return None
+
+    async def main():
+        storage = CountingStorage()
+        cache = _cache(storage)
+        first, second = await asyncio.gather(cache.get(GUILD), cache.get(GUILD))
+        assert first is second
+        assert storage.loads == 1
+
+    run(main())
@@ -0,0 +1,97 @@
+import asyncio
+import logging
+
+import pytest
+
+import lavacord
+from helpers import make_node, make_player, make_track, run
+
+
+class Recorder(lavacord.Tracer):
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    def on_start(self, span):
+        self.started.append(span)
+
+    def on_end(self, span):
+        self.ended.append(span)
+
+    def names(self):
+        return [span.name for span in self.ended]
+
+
+@pytest.fixture
+def tracer():
+    recorder = Recorder()
+    lavacord.set_tracer(recorder)
+    return recorder
+
+
+def test_no_tracer_means_no_spans():
+    with lavacord.span("noop") as span:
+        span.set_attribute("key", "value")
+    assert lavacord.current_span() is None
+
+
+def test_spans_nest_and_record_errors(tracer):
+    with lavacord.span("outer", guild=1) as outer:
+        with pytest.raises(ValueError):
+            with lavacord.span("inner") as inner:
+                assert lavacord.current_span() is inner
+                raise ValueError("broken")
+        assert lavacord.current_span() is outer
+
+    assert tracer.names() == ["inner", "outer"]
+    assert inner.parent is outer and outer.parent is None
+    assert isinstance(inner.error, ValueError) and outer.error is None
+    assert outer.attributes == {"guild": 1}
+    assert outer.duration >= inner.duration >= 0
+
+
+def test_tasks_inherit_the_current_span(tracer):
+    async def main():
+        with lavacord.span("outer") as outer:
+            child = asyncio.create_task(asyncio.sleep(0, result=lavacord.current_span()))
+        return outer, await child
+
+    outer, seen = run(main())
+    assert seen is outer
+
+
+def test_failing_tracer_is_logged(caplog):
+    class Broken(lavacord.Tracer):
+        def on_start(self, span):
+            raise RuntimeError("start")
+
+        def on_end(self, span):
+            raise RuntimeError("end")
+
+    lavacord.set_tracer(Broken())
+    with caplog.at_level(logging.ERROR, logger="lavacord.tracing"):
+        with lavacord.span("work"):
+            pass
+    assert "Tracer failed to start span:: work :: start" in caplog.text
+    assert "Tracer failed to end span:: work :: end" in caplog.text
+
+
+def test_play_start_span_runs_until_the_track_starts(tracer):
+    async def main():
+        node = make_node()
+        player = make_player(node)
+        await player.play(make_track(1))
+        assert "lavacord.player.start" not in tracer.names()
+        await node._websocket.process_data({"op": "event", "type": "TrackStartEvent", "guildId": "1",
+                                            "track": "track1"})
+
+        await player.play(make_track(2))
+        await node._websocket.process_data({"op": "event", "type": "TrackEndEvent", "guildId": "1",
+                                            "track": "track2", "reason": "LOAD_FAILED"})
+
+    run(main())
+    starts = [span for span in tracer.ended if span.name == "lavacord.player.start"]
+    assert len(starts) == 2
+    assert "reason" not in starts[0].attributes
+    assert starts[1].attributes["reason"] == "LOAD_FAILED"
+    assert "lavacord.player.play" in tracer.names()
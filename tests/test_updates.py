@@ -0,0 +1,98 @@
+import asyncio
+import gc
+import time
+
+import lavacord
+from lavacord.updates import Publisher
+from helpers import make_node, make_player, run
+
+
+def _update(player, position: int) -> dict:
+    return {"op": "playerUpdate", "guildId": str(player.guild_id),
+            "state": {"time": int(time.time() * 1000), "position": position, "connected": True}}
+
+
+def test_slow_consumer_gets_the_latest_state_only():
+    async def main():
+        node = make_node()
+        player = make_player(node)
+        updates = player.updates()
+        for position in (1_000, 2_000, 3_000):
+            await node._websocket.process_data(_update(player, position))
+
+        state = await updates.__anext__()
+        updates.close()
+        return state, [state async for state in updates]
+
+    state, rest = run(main())
+    assert state.position.total_seconds() == 3
+    assert rest == []
+
+
+def test_close_still_delivers_the_pending_value():
+    async def main():
+        publisher = Publisher()
+        updates = lavacord.Updates()
+        publisher.add(updates)
+        publisher.publish(1)
+        publisher.close()
+        return [value async for value in updates]
+
+    assert run(main()) == [1]
+
+
+def test_destroying_the_player_ends_the_iteration():
+    async def main():
+        player = make_player(make_node())
+        updates = player.updates()
+        consumer = asyncio.create_task(asyncio.wait_for(updates.__anext__(), 1))
+        await asyncio.sleep(0)
+        await player.destroy()
+        try:
+            await consumer
+        except StopAsyncIteration:
+            return True
+        return False
+
+    assert run(main())
+
+
+def test_pool_updates_merge_states_by_guild():
+    async def main():
+        node = make_node()
+        first, second = make_player(node, 1), make_player(node, 2)
+        async with lavacord.NodePool.updates() as updates:
+            await node._websocket.process_data(_update(first, 1_000))
+            await node._websocket.process_data(_update(second, 1_000))
+            await node._websocket.process_data(_update(first, 5_000))
+            states = await updates.__anext__()
+        return first, second, states
+
+    first, second, states = run(main())
+    assert set(states) == {first.guild_id, second.guild_id}
+    assert states[first.guild_id][0] is first
+    assert states[first.guild_id][1].position.total_seconds() == 5
+
+
+def test_min_interval_spaces_the_values():
+    async def main():
+        loop = asyncio.get_running_loop()
+        publisher = Publisher()
+        updates = lavacord.Updates(min_interval=0.05)
+        publisher.add(updates)
+
+        publisher.publish(1)
+        await updates.__anext__()
+        started = loop.time()
+        publisher.publish(2)
+        await updates.__anext__()
+        return loop.time() - started
+
+    assert run(main()) >= 0.04
+
+
+def test_abandoned_iterators_unsubscribe():
+    publisher = Publisher()
+    publisher.add(lavacord.Updates())
+    gc.collect()
+    assert not publisher